@@ -35,6 +35,9 @@ class ColorSpectrumExtraction(EventListener):
         if isinstance(event, ImageRenderEvent):
             self._render_image(event)
 
+    def get_supported_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [BeginPageEvent, TextRenderEvent, ImageRenderEvent]
+
     def _begin_page(self, page: Page):
         self.current_page += 1
         self.colors_per_page[self.current_page] = {}
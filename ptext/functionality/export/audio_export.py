@@ -47,6 +47,9 @@ class AudioExport(EventListener):
         if isinstance(event, ParagraphRenderEvent):
             self._speak_paragraph(event)
 
+    def get_supported_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [BeginPageEvent, ParagraphRenderEvent]
+
     def _begin_page(self, page: "Page"):
         self.current_page += 1
         self.current_page = 0
@@ -1,3 +1,5 @@
+import typing
+
 from ptext.functionality.structure.list.bullet_list_render_event import (
     BulletListRenderEvent,
 )
@@ -33,6 +35,9 @@ class MarkdownExport(EventListener):
         elif isinstance(event, ParagraphRenderEvent):
             self._render_paragraph(event)
 
+    def get_supported_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [BeginPageEvent, ParagraphRenderEvent]
+
     def _begin_page(self, page: Page):
         self.current_page += 1
         self.markdown_per_page[self.current_page] = ""
@@ -46,6 +46,9 @@ class SVGExport(EventListener):
         if isinstance(event, ImageRenderEvent):
             self._render_image(event)
 
+    def get_supported_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [BeginPageEvent, EndPageEvent, TextRenderEvent, ImageRenderEvent]
+
     def _begin_page(self, page: Page):
 
         # get page nr
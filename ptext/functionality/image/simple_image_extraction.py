@@ -1,3 +1,4 @@
+import typing
 from typing import List
 
 from PIL import Image  # type: ignore [import]
@@ -26,6 +27,9 @@ class SimpleImageExtraction(EventListener):
         if isinstance(event, ImageRenderEvent):
             self._render_image(event)
 
+    def get_supported_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [BeginPageEvent, ImageRenderEvent]
+
     def get_images_per_page(self, page_nr: int) -> List[Image.Image]:
         return (
             self.image_render_info_per_page[page_nr]
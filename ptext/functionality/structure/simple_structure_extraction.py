@@ -35,6 +35,9 @@ class SimpleStructureExtraction(EventListener):
         if isinstance(event, EndPageEvent):
             self.end_page(event.get_page())
 
+    def get_supported_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [TextRenderEvent, BeginPageEvent, EndPageEvent]
+
     def render_text(self, text_render_info: TextRenderEvent):
 
         # init if needed
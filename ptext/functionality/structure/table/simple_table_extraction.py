@@ -1,3 +1,5 @@
+import typing
+
 from ptext.pdf.canvas.event.event_listener import EventListener, Event
 from ptext.pdf.canvas.event.text_render_event import TextRenderEvent
 
@@ -10,5 +12,8 @@ class SimpleTableExtraction(EventListener):
         if isinstance(event, TextRenderEvent):
             self.render_text(event)
 
+    def get_supported_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [TextRenderEvent]
+
     def render_text(self, event: TextRenderEvent) -> None:
         pass
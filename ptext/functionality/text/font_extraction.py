@@ -15,6 +15,9 @@ class FontExtraction(EventListener):
         if isinstance(event, BeginPageEvent):
             self._begin_page(event)
 
+    def get_supported_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [BeginPageEvent]
+
     def _begin_page(self, event: BeginPageEvent):
 
         # update page number
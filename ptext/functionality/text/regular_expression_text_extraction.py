@@ -1,4 +1,5 @@
 import re
+import typing
 from decimal import Decimal
 from functools import cmp_to_key
 from typing import List
@@ -29,6 +30,9 @@ class RegularExpressionTextExtraction(EventListener):
         if isinstance(event, EndPageEvent):
             self._end_page(event.get_page())
 
+    def get_supported_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [TextRenderEvent, BeginPageEvent, EndPageEvent]
+
     def get_text_per_page(self, page_nr: int) -> str:
         return self.text_per_page[page_nr] if page_nr in self.text_per_page else ""
 
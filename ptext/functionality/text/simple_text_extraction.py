@@ -1,3 +1,4 @@
+import typing
 from decimal import Decimal
 from functools import cmp_to_key
 
@@ -25,6 +26,9 @@ class SimpleTextExtraction(EventListener):
         if isinstance(event, EndPageEvent):
             self.end_page(event.get_page())
 
+    def get_supported_event_types(self) -> typing.Optional[typing.List[type]]:
+        return [TextRenderEvent, BeginPageEvent, EndPageEvent]
+
     def get_text(self, page_nr: int) -> str:
         return self.text_per_page[page_nr] if page_nr in self.text_per_page else ""
 
@@ -0,0 +1,262 @@
+import decimal
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import typing
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ptext.io.read_transform.types import Boolean, Stream
+
+
+class ContentHashCache:
+    """
+    This class keeps (the results of) work that only depends on the content of a Stream, such as its DecodedBytes,
+    a CMap parsed from it, or a width table built from a Font, keyed by a hash of that content.
+    The same content (e.g. the ToUnicode CMap of an embedded font, or a logo) is often found in many documents,
+    when a ContentHashCache is set as the process cache, such work is done once and reused across documents.
+
+    Entries are kept in memory within a given budget (in bytes), the least recently used entries are evicted first.
+    When a directory is given, entries are also written to (and read from) that directory,
+    so that they can be shared between processes (or runs). Entries in that directory are pickled,
+    it should only be used by (and be writeable by) trusted processes.
+    """
+
+    # the ContentHashCache (if any) used by ptext while reading a Document
+    _process_cache: Optional["ContentHashCache"] = None
+
+    def __init__(
+        self,
+        max_size_in_bytes: int = 64 * 1024 * 1024,
+        directory: Optional[Union[str, Path]] = None,
+    ):
+        assert max_size_in_bytes >= 0
+        self.max_size_in_bytes: int = max_size_in_bytes
+        self.directory: Optional[Path] = Path(directory) if directory else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.size_in_bytes: int = 0
+        self.number_of_hits: int = 0
+        self.number_of_disk_hits: int = 0
+        self.number_of_misses: int = 0
+        self.number_of_evictions: int = 0
+        # kind -> [number of hits, number of misses]
+        self._stats_per_kind: typing.Dict[str, typing.List[int]] = {}
+        self._entries: typing.OrderedDict[
+            typing.Tuple[str, str], typing.Tuple[Any, int]
+        ] = OrderedDict()
+        # Stream objects may be decoded by several threads at once
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_process_cache() -> Optional["ContentHashCache"]:
+        """
+        This function returns the ContentHashCache used by ptext while reading a Document,
+        or None if there is none
+        """
+        return ContentHashCache._process_cache
+
+    @staticmethod
+    def set_process_cache(cache: Optional["ContentHashCache"]) -> None:
+        """
+        This function sets the ContentHashCache used by ptext while reading a Document,
+        setting it to None disables caching (by content hash)
+        """
+        ContentHashCache._process_cache = cache
+
+    @staticmethod
+    def get_key(kind: str, content: bytes) -> typing.Tuple[str, str]:
+        """
+        This function returns the key of (a given kind of work on) some content
+        """
+        return kind, hashlib.blake2b(content, digest_size=20).hexdigest()
+
+    @staticmethod
+    def get_stream_key(kind: str, stream: Stream) -> Optional[typing.Tuple[str, str]]:
+        """
+        This function returns the key of (a given kind of work on) a Stream,
+        the hash of its Bytes, Filter and DecodeParms,
+        or None if its Filter or DecodeParms hold values that can not be hashed (and the work should not be cached)
+        """
+        h = hashlib.blake2b(digest_size=20)
+        for k in ["Filter", "DecodeParms"]:
+            key_bytes: Optional[bytes] = ContentHashCache._to_key_bytes(
+                stream.get(k, None)
+            )
+            if key_bytes is None:
+                return None
+            h.update(key_bytes)
+        h.update(b"\n")
+        h.update(stream["Bytes"])
+        return kind, h.hexdigest()
+
+    @staticmethod
+    def get_object_key(kind: str, obj: Any) -> Optional[typing.Tuple[str, str]]:
+        """
+        This function returns the key of (a given kind of work on) a (List or Dictionary of) names, numbers and booleans,
+        or None if it holds values that can not be hashed (and the work should not be cached)
+        """
+        key_bytes: Optional[bytes] = ContentHashCache._to_key_bytes(obj)
+        if key_bytes is None:
+            return None
+        return ContentHashCache.get_key(kind, key_bytes)
+
+    @staticmethod
+    def _to_key_bytes(obj: Any) -> Optional[bytes]:
+        # only (lists and dictionaries of) names, numbers and booleans are hashed,
+        # any other value (e.g. a Stream, or an unresolved Reference) makes the object uncacheable
+        if obj is None:
+            return b"null "
+        if isinstance(obj, list):
+            out: typing.List[bytes] = []
+            for x in obj:
+                x_bytes = ContentHashCache._to_key_bytes(x)
+                if x_bytes is None:
+                    return None
+                out.append(x_bytes)
+            return b"[%s] " % b"".join(out)
+        if isinstance(obj, dict) and not isinstance(obj, Stream):
+            out = []
+            for k in sorted(obj.keys()):
+                v_bytes = ContentHashCache._to_key_bytes(obj[k])
+                if v_bytes is None:
+                    return None
+                out.append(ContentHashCache._to_key_bytes(str(k)) + v_bytes)  # type: ignore [operator]
+            return b"<<%s>> " % b"".join(out)
+        if isinstance(obj, (str, int, float, decimal.Decimal, Boolean)):
+            return str(obj).encode("utf8") + b" "
+        return None
+
+    def get(self, key: typing.Tuple[str, str]) -> Optional[Any]:
+        """
+        This function returns the entry for a given key (reading it from the directory, if needed),
+        or None if this ContentHashCache has no such entry
+        """
+        with self._lock:
+            stats = self._stats_per_kind.setdefault(key[0], [0, 0])
+            entry = self._entries.get(key, None)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.number_of_hits += 1
+                stats[0] += 1
+                return entry[0]
+
+        # directory
+        entry = self._read_from_directory(key)
+        with self._lock:
+            if entry is None:
+                self.number_of_misses += 1
+                stats[1] += 1
+                return None
+            self.number_of_hits += 1
+            self.number_of_disk_hits += 1
+            stats[0] += 1
+        self._put_in_memory(key, entry[0], entry[1])
+        return entry[0]
+
+    def put(self, key: typing.Tuple[str, str], value: Any, size_in_bytes: int) -> None:
+        """
+        This function stores an entry (of about size_in_bytes bytes) for a given key,
+        in memory (if it fits the budget of this ContentHashCache) and in the directory (if any)
+        """
+        assert value is not None
+        self._put_in_memory(key, value, size_in_bytes)
+        self._write_to_directory(key, value, size_in_bytes)
+
+    def _put_in_memory(
+        self, key: typing.Tuple[str, str], value: Any, size_in_bytes: int
+    ) -> None:
+        if size_in_bytes > self.max_size_in_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.size_in_bytes -= self._entries[key][1]
+            self._entries[key] = (value, size_in_bytes)
+            self.size_in_bytes += size_in_bytes
+            while self.size_in_bytes > self.max_size_in_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size_in_bytes -= evicted_size
+                self.number_of_evictions += 1
+
+    def get_hit_rate(self, kind: Optional[str] = None) -> float:
+        """
+        This function returns the fraction of lookups (of a given kind, or of any kind)
+        that found an entry (in memory or in the directory)
+        """
+        if kind is None:
+            hits, misses = self.number_of_hits, self.number_of_misses
+        else:
+            hits, misses = self._stats_per_kind.get(kind, [0, 0])
+        return hits / (hits + misses) if hits + misses > 0 else 0.0
+
+    def clear(self) -> None:
+        """
+        This function evicts all entries from memory (entries in the directory are kept)
+        """
+        with self._lock:
+            self.number_of_evictions += len(self._entries)
+            self._entries.clear()
+            self.size_in_bytes = 0
+
+    #
+    # DIRECTORY
+    #
+
+    def _get_path(self, key: typing.Tuple[str, str]) -> Path:
+        assert self.directory is not None
+        return self.directory / ("%s-%s.pickle" % key)
+
+    def _read_from_directory(
+        self, key: typing.Tuple[str, str]
+    ) -> Optional[typing.Tuple[Any, int]]:
+        if self.directory is None:
+            return None
+        path: Path = self._get_path(key)
+        try:
+            fh = open(path, "rb")
+        except OSError:
+            return None
+
+        # an entry that can not be read (e.g. a partial entry, or one pickled by another version of ptext)
+        # is a miss, and is removed
+        try:
+            with fh:
+                entry = pickle.load(fh)
+            if (
+                isinstance(entry, tuple)
+                and len(entry) == 2
+                and entry[0] is not None
+                and isinstance(entry[1], int)
+            ):
+                return entry
+        except Exception:
+            pass
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+    def _write_to_directory(
+        self, key: typing.Tuple[str, str], value: Any, size_in_bytes: int
+    ) -> None:
+        if self.directory is None:
+            return
+        # write to a temporary file first, so that other processes never read a partial entry
+        # an entry that can not be written (or pickled) is only kept in memory
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump((value, size_in_bytes), fh, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._get_path(key))
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -1,4 +1,5 @@
 import base64
+from typing import Iterable, Iterator
 
 
 class ASCII85Decode:
@@ -42,3 +43,40 @@ class ASCII85Decode:
 
         # we should not be here
         raise exceptions_to_throw[0]
+
+    @staticmethod
+    def decode_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Decodes data encoded in an ASCII base-85 representation,
+        one chunk at a time. Decoding stops at the end-of-data marker (~>)
+        """
+        carry: bytes = b""
+        is_first_chunk: bool = True
+        for chunk in chunks:
+            bytes_in: bytes = carry + bytes(chunk).translate(None, b" \t\n\r\v\f\x00")
+
+            # (optional) start marker
+            if is_first_chunk:
+                if len(bytes_in) < 2:
+                    carry = bytes_in
+                    continue
+                if bytes_in.startswith(b"<~"):
+                    bytes_in = bytes_in[2:]
+                is_first_chunk = False
+
+            # end-of-data marker
+            end_of_data: int = bytes_in.find(b"~")
+            if end_of_data >= 0:
+                yield base64.a85decode(bytes_in[0:end_of_data])
+                return
+
+            # decode whole groups (of 5 characters) only
+            bytes_in = bytes_in.replace(b"z", b"!!!!!")
+            n: int = len(bytes_in) - len(bytes_in) % 5
+            carry = bytes_in[n:]
+            if n > 0:
+                yield base64.a85decode(bytes_in[0:n])
+
+        # remainder
+        if len(carry) > 0:
+            yield base64.a85decode(carry)
@@ -0,0 +1,89 @@
+import itertools
+import typing
+import weakref
+from collections import OrderedDict
+
+from ptext.io.filter.stream_decode_util import decode_stream_bytes
+from ptext.io.read_transform.types import Stream
+
+
+class DecodedBytesCache:
+    """
+    This class keeps the DecodedBytes of Stream objects, within a given budget (in bytes).
+    Stream objects added to a DecodedBytesCache are only decoded when their DecodedBytes are first accessed.
+    When the budget is exceeded, the least recently used DecodedBytes are evicted,
+    and decoded again (from the Bytes of their Stream) the next time they are accessed.
+    The DecodedBytes of a Stream are discarded once the Stream is garbage collected,
+    so a DecodedBytesCache can be shared by many Document(s).
+    """
+
+    _keys = itertools.count()
+
+    def __init__(self, max_size_in_bytes: int = 64 * 1024 * 1024):
+        assert max_size_in_bytes >= 0
+        self.max_size_in_bytes: int = max_size_in_bytes
+        self.size_in_bytes: int = 0
+        self.number_of_hits: int = 0
+        self.number_of_misses: int = 0
+        self.number_of_evictions: int = 0
+        self._entries: typing.OrderedDict[int, bytes] = OrderedDict()
+
+    def add(self, stream: Stream) -> Stream:
+        """
+        This function links a Stream to this DecodedBytesCache,
+        its DecodedBytes are then computed (and kept) by this DecodedBytesCache
+        """
+        key: int = next(DecodedBytesCache._keys)
+        setattr(stream, "_decoded_bytes_key", key)
+        setattr(stream, "_decoded_bytes_cache", self)
+        weakref.finalize(stream, self._discard, key)
+        return stream
+
+    def _discard(self, key: int) -> None:
+        # called once the Stream (linked to this key) is garbage collected
+        decoded_bytes: typing.Optional[bytes] = self._entries.pop(key, None)
+        if decoded_bytes is not None:
+            self.size_in_bytes -= len(decoded_bytes)
+
+    def get(self, stream: Stream) -> bytes:
+        """
+        This function returns the DecodedBytes of a Stream (linked to this DecodedBytesCache),
+        decoding its Bytes if needed
+        """
+        key: int = getattr(stream, "_decoded_bytes_key")
+        decoded_bytes: typing.Optional[bytes] = self._entries.get(key, None)
+        if decoded_bytes is not None:
+            self.number_of_hits += 1
+            self._entries.move_to_end(key)
+            return decoded_bytes
+
+        # decode
+        self.number_of_misses += 1
+        decoded_bytes = decode_stream_bytes(stream)
+        if len(decoded_bytes) > self.max_size_in_bytes:
+            return decoded_bytes
+
+        # store
+        self._entries[key] = decoded_bytes
+        self.size_in_bytes += len(decoded_bytes)
+        while self.size_in_bytes > self.max_size_in_bytes:
+            _, evicted_bytes = self._entries.popitem(last=False)
+            self.size_in_bytes -= len(evicted_bytes)
+            self.number_of_evictions += 1
+        return decoded_bytes
+
+    def get_hit_rate(self) -> float:
+        """
+        This function returns the fraction of DecodedBytes lookups
+        that did not require decoding
+        """
+        n: int = self.number_of_hits + self.number_of_misses
+        return self.number_of_hits / n if n > 0 else 0.0
+
+    def clear(self) -> None:
+        """
+        This function evicts all DecodedBytes from this DecodedBytesCache
+        """
+        self.number_of_evictions += len(self._entries)
+        self._entries.clear()
+        self.size_in_bytes = 0
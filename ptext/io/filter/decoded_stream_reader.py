@@ -0,0 +1,52 @@
+import io
+import typing
+from typing import Iterable, Iterator
+
+
+class DecodedStreamReader(io.RawIOBase):
+    """
+    This class offers a (read-only, non-seekable) io source on top of an iterable of chunks (of bytes),
+    such as the decoded bytes of a Stream yielded by iter_decoded_stream_bytes.
+    Chunks are only requested (and thus decoded) as the DecodedStreamReader is read.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        super(DecodedStreamReader, self).__init__()
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._chunk: memoryview = memoryview(b"")
+        self._position: int = 0
+
+    def _next_chunk(self) -> bool:
+        while len(self._chunk) == 0:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return False
+            self._chunk = memoryview(chunk)
+        return True
+
+    #
+    # RawIOBase
+    #
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if not self._next_chunk():
+            return 0
+        n: int = min(len(b), len(self._chunk))
+        b[0:n] = self._chunk[0:n]
+        self._chunk = self._chunk[n:]
+        self._position += n
+        return n
+
+    def readall(self) -> bytes:
+        chunks: typing.List[bytes] = [self._chunk.tobytes()]
+        chunks.extend(self._chunks)
+        self._chunk = memoryview(b"")
+        out: bytes = b"".join(chunks)
+        self._position += len(out)
+        return out
+
+    def tell(self) -> int:
+        return self._position
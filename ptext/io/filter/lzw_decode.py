@@ -1,6 +1,175 @@
-import copy
+import typing
+from typing import Iterable, Iterator, Union
 
 from ptext.exception.pdf_exception import PDFSyntaxError
+from ptext.io.filter.predictor import Predictor
+
+
+# codes are read in groups, these hold the number of bytes (holding a group of codes)
+# and the shift of each code in the group (by code length and bit offset)
+_CODES_PER_GROUP: int = 32
+_GROUP_LENGTHS: typing.Dict[int, int] = {
+    n: (7 + _CODES_PER_GROUP * n + 7) // 8 for n in range(9, 13)
+}
+_GROUP_SHIFTS: typing.Dict[int, typing.List[typing.List[int]]] = {
+    n: [
+        [8 * _GROUP_LENGTHS[n] - r - (k + 1) * n for k in range(_CODES_PER_GROUP)]
+        for r in range(0, 8)
+    ]
+    for n in range(9, 13)
+}
+
+
+class _LZWDecoder:
+    """
+    This class holds the state of LZW decoding, so that encoded bytes can be decoded one chunk at a time.
+    The string table is not stored as a list of strings; each string is a prefix (an earlier string)
+    followed by a suffix (a single byte), and such a string has always been written to the output before,
+    so the table holds the offsets (in the output) at which each string starts and stops.
+    Decoding a code then amounts to copying a slice of the output.
+    Codes are read in groups (of up to _CODES_PER_GROUP codes of the same length), from a single int.
+    """
+
+    FIRST_CODE: int = 258
+    MAX_CODE: int = 4096
+    def __init__(self, early_change: int = 1):
+        assert early_change in [0, 1]
+        self._early_change: int = early_change
+        self._starts: typing.List[int] = [0] * _LZWDecoder.MAX_CODE
+        self._stops: typing.List[int] = [0] * _LZWDecoder.MAX_CODE
+        self._next_code: int = _LZWDecoder.FIRST_CODE
+        self._code_length: int = 9
+
+        # output still referred to by the string table (since the last ClearTable)
+        # the previous string starts at _previous_offset (or -1 right after a ClearTable)
+        self._output: bytearray = bytearray()
+        self._previous_offset: int = -1
+        self._number_of_bytes_yielded: int = 0
+        self._table_start: int = 0
+
+        # input that does not hold a complete code yet
+        self._bytes_in: bytes = b""
+        self._bit_offset: int = 0
+        self.is_done: bool = False
+
+    def decode(self, bytes_in: Union[bytes, memoryview]) -> bytes:
+        """
+        This function decodes (the next chunk of) the encoded bytes,
+        and returns the bytes that have been decoded (since the previous call)
+        """
+        if self.is_done:
+            return b""
+
+        data: bytes = self._bytes_in + bytes(bytes_in)
+        number_of_bits: int = len(data) * 8
+        data += bytes(_GROUP_LENGTHS[12])
+        bit_offset: int = self._bit_offset
+
+        # local variables (for speed)
+        group_lengths = _GROUP_LENGTHS
+        group_shifts = _GROUP_SHIFTS
+        starts = self._starts
+        stops = self._stops
+        output = self._output
+        early_change: int = self._early_change
+        next_code: int = self._next_code
+        code_length: int = self._code_length
+        mask: int = (1 << code_length) - 1
+        next_code_length_at: int = (1 << code_length) - early_change
+        previous_offset: int = self._previous_offset
+        current_offset: int = len(output)
+
+        is_done: bool = False
+        while not is_done and bit_offset + code_length <= number_of_bits:
+
+            # read a group of codes (most significant bit first)
+            i: int = bit_offset >> 3
+            shifts = group_shifts[code_length][bit_offset & 7]
+            n: int = (number_of_bits - bit_offset) // code_length
+            if n < len(shifts):
+                shifts = shifts[0:n]
+            group = int.from_bytes(data[i : i + group_lengths[code_length]], "big")
+            group_code_length: int = code_length
+            number_of_codes_read: int = 0
+
+            # the remainder of a group is dropped when the code length changes
+            for code in [(group >> x) & mask for x in shifts]:
+                number_of_codes_read += 1
+
+                # literal
+                if code < 256:
+                    output.append(code)
+
+                # string in table
+                elif 257 < code < next_code:
+                    output += output[starts[code] : stops[code]]
+
+                # ClearTable
+                elif code == 256:
+                    next_code = _LZWDecoder.FIRST_CODE
+                    code_length = 9
+                    mask = 511
+                    next_code_length_at = 512 - early_change
+                    previous_offset = -1
+                    self._table_start = current_offset
+                    break
+
+                # EOD
+                elif code == 257:
+                    is_done = True
+                    break
+
+                # string being added to the table (previous string + its first byte)
+                elif code == next_code and previous_offset >= 0:
+                    output += output[previous_offset:current_offset]
+                    output.append(output[previous_offset])
+
+                else:
+                    raise PDFSyntaxError("malformed lzw byte stream")
+
+                # add previous string + first byte of current string to the table
+                if previous_offset >= 0 and next_code < 4096:
+                    starts[next_code] = previous_offset
+                    stops[next_code] = current_offset + 1
+                    next_code += 1
+                    if next_code == next_code_length_at and code_length < 12:
+                        code_length += 1
+                        mask = (1 << code_length) - 1
+                        next_code_length_at = (1 << code_length) - early_change
+                        previous_offset = current_offset
+                        current_offset = len(output)
+                        break
+
+                previous_offset = current_offset
+                current_offset = len(output)
+
+            bit_offset += number_of_codes_read * group_code_length
+
+        # keep state
+        self.is_done = is_done
+        self._next_code = next_code
+        self._code_length = code_length
+        self._previous_offset = previous_offset
+        self._bytes_in = data[bit_offset >> 3 : number_of_bits >> 3]
+        self._bit_offset = bit_offset & 7
+
+        # return newly decoded bytes
+        bytes_out: bytes = bytes(output[self._number_of_bytes_yielded :])
+        self._number_of_bytes_yielded = len(output)
+
+        # drop output that is no longer referred to by the string table
+        n = self._table_start
+        if n > 0:
+            del output[0:n]
+            self._number_of_bytes_yielded -= n
+            self._table_start = 0
+            if self._previous_offset >= 0:
+                self._previous_offset -= n
+            for code in range(_LZWDecoder.FIRST_CODE, self._next_code):
+                starts[code] -= n
+                stops[code] -= n
+
+        return bytes_out
 
 
 class LZWDecode:
@@ -11,7 +180,14 @@ class LZWDecode:
     """
 
     @staticmethod
-    def decode(bytes_in: bytes) -> bytes:
+    def decode(
+        bytes_in: bytes,
+        early_change: int = 1,
+        predictor: int = 1,
+        bits_per_component: int = 8,
+        columns: int = 1,
+        colors: int = 1,
+    ) -> bytes:
         """
         Decompresses data encoded using the LZW (Lempel-Ziv-
         Welch) adaptive compression method
@@ -21,34 +197,51 @@ class LZWDecode:
         if len(bytes_in) == 0:
             return bytes_in
 
-        # Build the dictionary.
-        dict_size = 256
-        dictionary = {i: bytearray() for i in range(dict_size)}
-        for k, v in dictionary.items():
-            v.append(k)
-
-        # use bytearray, otherwise this becomes O(N^2)
-        # due to concatenation in a loop
-        bytes_out = bytearray()
-        w = bytearray()
-        w.append(bytes_in[0])
-        bytes_out.append(bytes_in[0])
-
-        for i in range(1, len(bytes_in)):
-            k = bytes_in[i]
-            if k in dictionary:
-                entry = dictionary[k]
-            elif k == dict_size:
-                entry = copy.deepcopy(w)
-                entry.append(w[0])
-            else:
-                raise PDFSyntaxError("malformed lzw byte stream")
-            bytes_out.extend(entry)
-
-            # Add w+entry[0] to the dictionary.
-            dictionary[dict_size] = copy.deepcopy(w)
-            dictionary[dict_size].append(entry[0])
-            dict_size += 1
-
-            w = entry
-        return bytes(bytes_out)
+        # initial transform
+        bytes_after_lzw: bytes = _LZWDecoder(early_change).decode(bytes_in)
+
+        # check predictor
+        if predictor == 1:
+            return bytes_after_lzw
+
+        # undo predictor
+        return Predictor.decode(
+            bytes_after_lzw,
+            predictor=predictor,
+            colors=colors,
+            bits_per_component=bits_per_component,
+            columns=columns,
+        )
+
+    @staticmethod
+    def decode_chunks(
+        chunks: Iterable[Union[bytes, memoryview]],
+        early_change: int = 1,
+        predictor: int = 1,
+        bits_per_component: int = 8,
+        columns: int = 1,
+        colors: int = 1,
+    ) -> Iterator[bytes]:
+        """
+        Decompresses data encoded using the LZW (Lempel-Ziv-
+        Welch) adaptive compression method, one chunk at a time
+        """
+        return Predictor.decode_chunks(
+            LZWDecode._decode_chunks(chunks, early_change),
+            predictor=predictor,
+            colors=colors,
+            bits_per_component=bits_per_component,
+            columns=columns,
+        )
+
+    @staticmethod
+    def _decode_chunks(
+        chunks: Iterable[Union[bytes, memoryview]], early_change: int
+    ) -> Iterator[bytes]:
+        decoder = _LZWDecoder(early_change)
+        for chunk in chunks:
+            bytes_out = decoder.decode(chunk)
+            if len(bytes_out) > 0:
+                yield bytes_out
+            if decoder.is_done:
+                break
@@ -0,0 +1,345 @@
+import array
+import itertools
+import operator
+import sys
+import typing
+from typing import Iterable, Iterator, Optional, Union
+
+try:
+    import numpy  # type: ignore [import]
+except ImportError:  # pragma: no cover (numpy is optional)
+    numpy = None
+
+# keeps the lowest 8 bits of an int (applied with map, without a python-level loop)
+_LOW_BYTE = (255).__and__
+
+
+class Predictor:
+    """
+    LZW and Flate encoding compress more compactly if their input data is highly predictable. One way of
+    increasing the predictability of many continuous-tone sampled images is to replace each sample with the
+    difference between that sample and a predictor function applied to earlier neighboring samples. If the predictor
+    function works well, the postprediction data clusters toward 0.
+    PDF supports two groups of Predictor functions. The first, the TIFF group, consists of the single function that is
+    Predictor 2 in the TIFF 6.0 specification. The second, the PNG group, consists of the filters
+    (None, Sub, Up, Average and Paeth) of the PNG specification (Predictor 10 to 15).
+
+    This class undoes a Predictor function, working on whole rows (rather than single bytes) where possible,
+    using numpy (if it is installed).
+    """
+
+    @staticmethod
+    def decode(
+        bytes_in: Union[bytes, bytearray, memoryview],
+        predictor: int = 1,
+        colors: int = 1,
+        bits_per_component: int = 8,
+        columns: int = 1,
+    ) -> bytes:
+        """
+        This function undoes the Predictor function applied to bytes_in
+        """
+
+        # check \Predictor
+        assert predictor in [1, 2, 10, 11, 12, 13, 14, 15]
+
+        # check \Colors
+        assert colors >= 1
+
+        # check \BitsPerComponent
+        assert bits_per_component in [1, 2, 4, 8, 16]
+
+        # check \Columns
+        assert columns >= 1
+
+        # no prediction
+        if predictor == 1:
+            return bytes(bytes_in)
+
+        # TIFF
+        if predictor == 2:
+            return Predictor._decode_tiff(
+                memoryview(bytes_in), colors, bits_per_component, columns
+            )
+
+        # PNG
+        return Predictor._decode_png(
+            memoryview(bytes_in), colors, bits_per_component, columns
+        )
+
+    @staticmethod
+    def decode_chunks(
+        chunks: Iterable[Union[bytes, bytearray, memoryview]],
+        predictor: int = 1,
+        colors: int = 1,
+        bits_per_component: int = 8,
+        columns: int = 1,
+    ) -> Iterator[bytes]:
+        """
+        This function undoes the Predictor function applied to the concatenation of chunks,
+        yielding (whole) rows as soon as they are available
+        """
+
+        # check \Predictor
+        assert predictor in [1, 2, 10, 11, 12, 13, 14, 15]
+
+        # no prediction
+        if predictor == 1:
+            for chunk in chunks:
+                yield bytes(chunk)
+            return
+
+        # each (PNG) row is preceded by its filter type
+        bytes_per_row: int = (columns * colors * bits_per_component + 7) // 8
+        row_length: int = bytes_per_row if predictor == 2 else bytes_per_row + 1
+
+        buffer = bytearray()
+        prior_row: bytes = bytes(bytes_per_row)
+        for chunk in chunks:
+            buffer += chunk
+            n: int = len(buffer) - len(buffer) % row_length
+            if n == 0:
+                continue
+            rows = bytes(buffer[0:n])
+            del buffer[0:n]
+            if predictor == 2:
+                yield Predictor._decode_tiff(
+                    memoryview(rows), colors, bits_per_component, columns
+                )
+                continue
+            bytes_out = Predictor._decode_png(
+                memoryview(rows), colors, bits_per_component, columns, prior_row
+            )
+            prior_row = bytes_out[-bytes_per_row:]
+            yield bytes_out
+
+        # remainder (less than a row)
+        if len(buffer) == 0:
+            return
+        if predictor == 2:
+            yield Predictor._decode_tiff(
+                memoryview(buffer), colors, bits_per_component, columns
+            )
+            return
+        yield Predictor._decode_png(
+            memoryview(buffer), colors, bits_per_component, columns, prior_row
+        )
+
+    #
+    # TIFF
+    #
+
+    @staticmethod
+    def _decode_tiff(
+        bytes_in: memoryview, colors: int, bits_per_component: int, columns: int
+    ) -> bytes:
+        bytes_per_row: int = (columns * colors * bits_per_component + 7) // 8
+        number_of_rows: int = len(bytes_in) // bytes_per_row
+        number_of_bytes: int = number_of_rows * bytes_per_row
+
+        # 8 bits per component (whole image at once)
+        if bits_per_component == 8 and numpy is not None:
+            a = numpy.frombuffer(bytes_in[0:number_of_bytes], dtype=numpy.uint8)
+            a = a.reshape((number_of_rows, columns, colors))
+            a = numpy.cumsum(a, axis=1, dtype=numpy.uint8)
+            return a.tobytes() + Predictor._undo_tiff_short_row(
+                bytes_in[number_of_bytes:], colors, bits_per_component, columns
+            )
+
+        # 16 bits per component (whole image at once)
+        if bits_per_component == 16 and numpy is not None:
+            a = numpy.frombuffer(bytes_in[0:number_of_bytes], dtype=">u2")
+            a = a.reshape((number_of_rows, columns, colors))
+            a = numpy.cumsum(a, axis=1, dtype=numpy.uint16).astype(">u2")
+            return a.tobytes() + Predictor._undo_tiff_short_row(
+                bytes_in[number_of_bytes:], colors, bits_per_component, columns
+            )
+
+        bytes_out = bytearray(bytes_in)
+        for row in range(0, number_of_rows):
+            i: int = row * bytes_per_row
+            bytes_out[i : i + bytes_per_row] = Predictor._undo_tiff_row(
+                bytes_in[i : i + bytes_per_row], colors, bits_per_component, columns
+            )
+        bytes_out[number_of_bytes:] = Predictor._undo_tiff_short_row(
+            bytes_in[number_of_bytes:], colors, bits_per_component, columns
+        )
+        return bytes(bytes_out)
+
+    @staticmethod
+    def _undo_tiff_short_row(
+        row: memoryview, colors: int, bits_per_component: int, columns: int
+    ) -> bytes:
+        # a final row that is shorter than bytes_per_row (e.g. a truncated stream)
+        # has its (complete) samples decoded, a trailing half of a 16-bit sample is kept as-is
+        if len(row) == 0:
+            return b""
+        if bits_per_component == 16 and len(row) % 2 == 1:
+            return bytes(
+                Predictor._undo_tiff_row(
+                    row[0:-1], colors, bits_per_component, columns
+                )
+            ) + bytes(row[-1:])
+        return bytes(Predictor._undo_tiff_row(row, colors, bits_per_component, columns))
+
+    @staticmethod
+    def _undo_tiff_row(
+        row: memoryview, colors: int, bits_per_component: int, columns: int
+    ) -> Union[bytes, bytearray]:
+
+        # 8 bits per component
+        if bits_per_component == 8:
+            return Predictor._undo_sub(row, colors)
+
+        # 16 bits per component
+        if bits_per_component == 16:
+            samples = array.array("H", row.tobytes())
+            if sys.byteorder == "little":
+                samples.byteswap()
+            for k in range(0, colors):
+                samples[k::colors] = array.array(
+                    "H",
+                    map((65535).__and__, itertools.accumulate(samples[k::colors])),
+                )
+            if sys.byteorder == "little":
+                samples.byteswap()
+            return samples.tobytes()
+
+        # 1, 2 or 4 bits per component (the bits padding the row are left 0)
+        samples_per_byte: int = 8 // bits_per_component
+        mask: int = (1 << bits_per_component) - 1
+        samples_in: typing.List[int] = [
+            (b >> (8 - bits_per_component * (j + 1))) & mask
+            for b in row
+            for j in range(0, samples_per_byte)
+        ][0 : columns * colors]
+        for k in range(0, colors):
+            samples_in[k::colors] = map(
+                mask.__and__, itertools.accumulate(samples_in[k::colors])
+            )
+        bytes_out = bytearray(len(row))
+        for i, s in enumerate(samples_in):
+            bytes_out[i // samples_per_byte] |= s << (
+                8 - bits_per_component * (i % samples_per_byte + 1)
+            )
+        return bytes_out
+
+    #
+    # PNG
+    #
+
+    @staticmethod
+    def _decode_png(
+        bytes_in: memoryview,
+        colors: int,
+        bits_per_component: int,
+        columns: int,
+        prior_row: Optional[Union[bytes, bytearray]] = None,
+    ) -> bytes:
+        bytes_per_row: int = (columns * colors * bits_per_component + 7) // 8
+        # bytes per (complete) pixel, rounded up (and at least 1)
+        bytes_per_pixel: int = (colors * bits_per_component + 7) // 8
+
+        # each row is preceded by its filter type
+        bytes_out = bytearray()
+        if prior_row is None:
+            prior_row = bytes(bytes_per_row)
+        pos: int = 0
+        while pos + bytes_per_row <= len(bytes_in):
+            filter_type: int = bytes_in[pos]
+            current_row: memoryview = bytes_in[pos + 1 : pos + 1 + bytes_per_row]
+            pos += 1 + bytes_per_row
+
+            # PNG_FILTER_SUB
+            # Predicts the same as the sample to the left
+            if filter_type == 1:
+                prior_row = Predictor._undo_sub(current_row, bytes_per_pixel)
+
+            # PNG_FILTER_UP
+            # Predicts the same as the sample above
+            elif filter_type == 2:
+                prior_row = Predictor._undo_up(current_row, prior_row)
+
+            # PNG_FILTER_AVERAGE
+            # Predicts the average of the sample to the left and the
+            # sample above
+            elif filter_type == 3:
+                prior_row = Predictor._undo_average(
+                    current_row, prior_row, bytes_per_pixel
+                )
+
+            # PNG_FILTER_PAETH
+            elif filter_type == 4:
+                prior_row = Predictor._undo_paeth(
+                    current_row, prior_row, bytes_per_pixel
+                )
+
+            # PNG_FILTER_NONE
+            else:
+                prior_row = current_row.tobytes()
+
+            # write current row
+            bytes_out += prior_row
+
+        # return
+        return bytes(bytes_out)
+
+    @staticmethod
+    def _undo_sub(row: memoryview, bytes_per_pixel: int) -> Union[bytes, bytearray]:
+        if numpy is not None and len(row) % bytes_per_pixel == 0:
+            a = numpy.frombuffer(row, dtype=numpy.uint8).reshape((-1, bytes_per_pixel))
+            return numpy.cumsum(a, axis=0, dtype=numpy.uint8).tobytes()
+        if bytes_per_pixel == 1:
+            return bytes(map(_LOW_BYTE, itertools.accumulate(row)))
+        row_out = bytearray(row)
+        for k in range(0, bytes_per_pixel):
+            row_out[k::bytes_per_pixel] = bytes(
+                map(_LOW_BYTE, itertools.accumulate(row[k::bytes_per_pixel]))
+            )
+        return row_out
+
+    @staticmethod
+    def _undo_up(
+        row: memoryview, prior_row: Union[bytes, bytearray]
+    ) -> Union[bytes, bytearray]:
+        if numpy is not None and len(row) == len(prior_row):
+            return numpy.add(
+                numpy.frombuffer(row, dtype=numpy.uint8),
+                numpy.frombuffer(prior_row, dtype=numpy.uint8),
+            ).tobytes()
+        return bytes(map(_LOW_BYTE, map(operator.add, row, prior_row)))
+
+    @staticmethod
+    def _undo_average(
+        row: memoryview, prior_row: Union[bytes, bytearray], bytes_per_pixel: int
+    ) -> bytearray:
+        row_out = bytearray(row)
+        for i in range(0, min(bytes_per_pixel, len(row_out))):
+            row_out[i] = (row_out[i] + (prior_row[i] >> 1)) & 255
+        for i in range(bytes_per_pixel, len(row_out)):
+            row_out[i] = (
+                row_out[i] + ((row_out[i - bytes_per_pixel] + prior_row[i]) >> 1)
+            ) & 255
+        return row_out
+
+    @staticmethod
+    def _undo_paeth(
+        row: memoryview, prior_row: Union[bytes, bytearray], bytes_per_pixel: int
+    ) -> bytearray:
+        row_out = bytearray(row)
+        for i in range(0, min(bytes_per_pixel, len(row_out))):
+            row_out[i] = (row_out[i] + prior_row[i]) & 255
+        for i in range(bytes_per_pixel, len(row_out)):
+            a = row_out[i - bytes_per_pixel]
+            b = prior_row[i]
+            c = prior_row[i - bytes_per_pixel]
+            pa = abs(b - c)
+            pb = abs(a - c)
+            pc = abs(a + b - c - c)
+            if pa <= pb and pa <= pc:
+                row_out[i] = (row_out[i] + a) & 255
+            elif pb <= pc:
+                row_out[i] = (row_out[i] + b) & 255
+            else:
+                row_out[i] = (row_out[i] + c) & 255
+        return row_out
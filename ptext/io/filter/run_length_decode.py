@@ -1,3 +1,6 @@
+from typing import Iterable, Iterator
+
+
 class RunLengthDecode:
     """
     Decompresses data encoded using a byte-oriented run-length
@@ -25,3 +28,17 @@ class RunLengthDecode:
                 bytes_out.append(b)
 
         return bytes(bytes_out)
+
+    @staticmethod
+    def decode_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Decompresses data encoded using a byte-oriented run-length
+        encoding algorithm, one chunk at a time
+        """
+        carry: bytes = b""
+        for chunk in chunks:
+            bytes_in: bytes = carry + bytes(chunk)
+            n: int = len(bytes_in) - len(bytes_in) % 2
+            carry = bytes_in[n:]
+            if n > 0:
+                yield RunLengthDecode.decode(bytes_in[0:n])
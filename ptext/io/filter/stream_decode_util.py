@@ -1,17 +1,158 @@
+import concurrent.futures
+import io
 import typing
+from typing import Iterable, Iterator, Optional, Union
 
 from ptext.exception.pdf_exception import PDFValueError
+from ptext.io.content_hash_cache import ContentHashCache
 from ptext.io.filter.ascii85_decode import ASCII85Decode
+from ptext.io.filter.decoded_stream_reader import DecodedStreamReader
 from ptext.io.filter.flate_decode import FlateDecode
 from ptext.io.filter.lzw_decode import LZWDecode
 from ptext.io.filter.run_length_decode import RunLengthDecode
 from ptext.io.read_transform.types import Stream, List, Decimal, Dictionary, Name
 
+# the (maximum) size of the chunks yielded by iter_decoded_stream_bytes
+DEFAULT_CHUNK_SIZE: int = 64 * 1024
 
-def decode_stream(s: Stream) -> Stream:
 
+def decode_stream(
+    s: Stream,
+    decoded_bytes_cache: Optional["DecodedBytesCache"] = None,  # type: ignore [name-defined]
+    max_decoded_size: Optional[int] = None,
+    decode_executor: Optional[concurrent.futures.Executor] = None,
+) -> Stream:
+    """
+    This function applies the filter(s) of a Stream to its Bytes, and stores the result as its DecodedBytes.
+    When a DecodedBytesCache is given, DecodedBytes is not computed (or stored) here,
+    but computed by the DecodedBytesCache the first time it is accessed.
+    When max_decoded_size is given, decoding the Stream (now or later) fails with a PDFValueError
+    as soon as any of its filter(s) produces more than max_decoded_size bytes.
+    When a decode executor is given, a Stream with a FlateDecode filter
+    is decoded by the executor (zlib releases the GIL, so several Stream objects can be decoded at once),
+    and the result is joined (stored as its DecodedBytes) the first time DecodedBytes is accessed.
+    A DecodedBytesCache and a decode executor can not both be given.
+    """
     assert isinstance(s, Stream)
     assert "Bytes" in s
+    assert decoded_bytes_cache is None or decode_executor is None
+
+    # set max_decoded_size
+    if max_decoded_size is not None:
+        setattr(s, "_max_decoded_size", max_decoded_size)
+
+    # set DecodedBytes
+    if decoded_bytes_cache is not None:
+        decoded_bytes_cache.add(s)
+    elif decode_executor is not None and _has_flate_filter(s):
+        setattr(
+            s,
+            "_decoded_bytes_future",
+            decode_executor.submit(decode_stream_bytes, _copy_stream_to_decode(s)),
+        )
+    else:
+        s[Name("DecodedBytes")] = decode_stream_bytes(s)
+
+    # set Type if not yet set
+    if "Type" not in s:
+        s[Name("Type")] = Name("Stream")
+
+    # return
+    return s
+
+
+def _has_flate_filter(s: Stream) -> bool:
+    filters = s.get("Filter", [])
+    if not isinstance(filters, list):
+        filters = [filters]
+    return "FlateDecode" in filters or "Fl" in filters
+
+
+def _copy_stream_to_decode(s: Stream) -> Stream:
+    # the Stream itself may still change (while it is being transformed),
+    # a decode executor is given a (shallow) copy of the entries it needs
+    out = Stream()
+    for k in ["Bytes", "Filter", "DecodeParms"]:
+        if k in s:
+            out[Name(k)] = s[k]
+    setattr(out, "_max_decoded_size", getattr(s, "_max_decoded_size", None))
+    return out
+
+
+def decode_stream_bytes(s: Stream, max_decoded_size: Optional[int] = None) -> bytes:
+    """
+    This function applies the filter(s) of a Stream to its Bytes, and returns the result.
+    When a (process) ContentHashCache is set, the result is looked up (and kept) by the hash
+    of the Bytes, Filter and DecodeParms of the Stream (unless those can not be hashed).
+    """
+    cache: Optional[ContentHashCache] = ContentHashCache.get_process_cache()
+    if cache is None or "Filter" not in s:
+        return b"".join(iter_decoded_stream_bytes(s, max_decoded_size=max_decoded_size))
+
+    # lookup
+    if max_decoded_size is None:
+        max_decoded_size = getattr(s, "_max_decoded_size", None)
+    key = ContentHashCache.get_stream_key("DecodedBytes", s)
+    if key is None:
+        return b"".join(iter_decoded_stream_bytes(s, max_decoded_size=max_decoded_size))
+    decoded_bytes: Optional[bytes] = cache.get(key)
+    if decoded_bytes is not None and (
+        max_decoded_size is None or len(decoded_bytes) <= max_decoded_size
+    ):
+        return decoded_bytes
+
+    # decode
+    decoded_bytes = b"".join(
+        iter_decoded_stream_bytes(s, max_decoded_size=max_decoded_size)
+    )
+    cache.put(key, decoded_bytes, len(decoded_bytes))
+    return decoded_bytes
+
+
+def open_decoded_stream(
+    s: Union[Stream, typing.List[Stream]], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> io.IOBase:
+    """
+    This function returns an io source for the DecodedBytes of a Stream
+    (or a List of Stream objects, each followed by a space, such as the Contents of a Page).
+    DecodedBytes that are available (stored in a Stream, or kept by its DecodedBytesCache) are used as is,
+    all other Stream objects are decoded (in chunks) as the io source is read.
+    """
+    if isinstance(s, list):
+        return DecodedStreamReader(_iter_decoded_stream_list_bytes(s, chunk_size))
+    if "DecodedBytes" in s:
+        return io.BytesIO(s["DecodedBytes"])
+    return DecodedStreamReader(iter_decoded_stream_bytes(s, chunk_size))
+
+
+def _iter_decoded_stream_list_bytes(
+    s: typing.List[Stream], chunk_size: int
+) -> Iterator[bytes]:
+    for x in s:
+        if "DecodedBytes" in x:
+            yield x["DecodedBytes"]
+        else:
+            yield from iter_decoded_stream_bytes(x, chunk_size)
+        yield b" "
+
+
+def iter_decoded_stream_bytes(
+    s: Stream,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_decoded_size: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    This function applies the filter(s) of a Stream to its Bytes, and yields the result in chunks,
+    without holding the output of any filter in memory all at once.
+    When max_decoded_size is given (or was given to decode_stream), a PDFValueError is raised
+    as soon as any of the filter(s) produces more than max_decoded_size bytes.
+    """
+    assert isinstance(s, Stream)
+    assert chunk_size > 0
+    if max_decoded_size is None:
+        max_decoded_size = getattr(s, "_max_decoded_size", None)
+
+    assert "Bytes" in s
 
     # determine filter(s) to apply
     filters: typing.List[str] = []
@@ -33,47 +174,76 @@ def decode_stream(s: Stream) -> Stream:
         decode_params = [Dictionary() for x in range(0, len(filters))]
 
     # apply filter(s)
-    transformed_bytes = s["Bytes"]
+    # Bytes may be a memoryview, it is read in chunks (without copying it)
+    bts = s["Bytes"]
+    transformed_bytes: Iterator[bytes] = iter([bts])
+    if len(bts) > chunk_size:
+        transformed_bytes = (
+            bts[i : i + chunk_size] for i in range(0, len(bts), chunk_size)
+        )
     for filter_index, filter_name in enumerate(filters):
+
         # FLATE
         if filter_name in ["FlateDecode", "Fl"]:
-            transformed_bytes = FlateDecode.decode(
-                bytes_in=transformed_bytes,
+            transformed_bytes = FlateDecode.decode_chunks(
+                transformed_bytes,
                 columns=int(decode_params[filter_index].get("Columns", Decimal(1))),
                 predictor=int(decode_params[filter_index].get("Predictor", Decimal(1))),
                 bits_per_component=int(
                     decode_params[filter_index].get("BitsPerComponent", Decimal(8))
                 ),
+                colors=int(decode_params[filter_index].get("Colors", Decimal(1))),
+                chunk_size=chunk_size,
             )
-            continue
 
         # ASCII85
-        if filter_name in ["ASCII85Decode"]:
-            transformed_bytes = ASCII85Decode.decode(transformed_bytes)
-            continue
+        elif filter_name in ["ASCII85Decode"]:
+            transformed_bytes = ASCII85Decode.decode_chunks(transformed_bytes)
 
         # LZW
-        if filter_name in ["LZWDecode"]:
-            transformed_bytes = LZWDecode.decode(transformed_bytes)
-            continue
+        elif filter_name in ["LZWDecode"]:
+            transformed_bytes = LZWDecode.decode_chunks(
+                transformed_bytes,
+                early_change=int(
+                    decode_params[filter_index].get("EarlyChange", Decimal(1))
+                ),
+                columns=int(decode_params[filter_index].get("Columns", Decimal(1))),
+                predictor=int(decode_params[filter_index].get("Predictor", Decimal(1))),
+                bits_per_component=int(
+                    decode_params[filter_index].get("BitsPerComponent", Decimal(8))
+                ),
+                colors=int(decode_params[filter_index].get("Colors", Decimal(1))),
+            )
 
         # RunLengthDecode
-        if filter_name in ["RunLengthDecode"]:
-            transformed_bytes = RunLengthDecode.decode(transformed_bytes)
-            continue
+        elif filter_name in ["RunLengthDecode"]:
+            transformed_bytes = RunLengthDecode.decode_chunks(transformed_bytes)
 
         # unknown filter
-        raise PDFValueError(
-            expected_value_description="[/ASCII85Decode, /FlateDecode, /Fl, /LZWDecode, /RunLengthDecode]",
-            received_value_description=str(filter_name),
-        )
+        else:
+            raise PDFValueError(
+                expected_value_description="[/ASCII85Decode, /FlateDecode, /Fl, /LZWDecode, /RunLengthDecode]",
+                received_value_description=str(filter_name),
+            )
 
-    # set DecodedBytes
-    s[Name("DecodedBytes")] = transformed_bytes
+        # guard against decompression bombs
+        if max_decoded_size is not None:
+            transformed_bytes = _check_decoded_size(transformed_bytes, max_decoded_size)
 
-    # set Type if not yet set
-    if "Type" not in s:
-        s[Name("Type")] = Name("Stream")
+    for chunk in transformed_bytes:
+        yield bytes(chunk)
 
-    # return
-    return s
+
+def _check_decoded_size(
+    chunks: Iterable[bytes], max_decoded_size: int
+) -> Iterator[bytes]:
+    number_of_bytes: int = 0
+    for chunk in chunks:
+        number_of_bytes += len(chunk)
+        if number_of_bytes > max_decoded_size:
+            raise PDFValueError(
+                expected_value_description="at most %d bytes" % max_decoded_size,
+                received_value_description="%d (or more) decoded bytes"
+                % number_of_bytes,
+            )
+        yield chunk
@@ -9,7 +9,7 @@ from ptext.io.read_transform.read_base_transformer import (
     ReadBaseTransformer,
     ReadTransformerContext,
 )
-from ptext.io.read_transform.types import AnyPDFType
+from ptext.io.read_transform.types import AnyPDFType, get_lazy_class
 from ptext.pdf.canvas.event.event_listener import EventListener
 from ptext.pdf.canvas.font.font import Font
 
@@ -24,6 +24,14 @@ class ReadFontDescriptorDictionaryTransformer(ReadBaseTransformer):
             and object["Type"] == "FontDescriptor"
         )
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (dict,)
+
+    def get_transformable_dictionary_keys(
+        self,
+    ) -> typing.Dict[str, typing.List[Optional[str]]]:
+        return {"Type": ["FontDescriptor"]}
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -41,7 +49,10 @@ class ReadFontDescriptorDictionaryTransformer(ReadBaseTransformer):
                     )
 
         # build intermittent Font object
-        tmp = Font().set_parent(parent_object)  # type: ignore [attr-defined]
+        font_class = (
+            get_lazy_class(Font) if context is not None and context.lazy else Font
+        )
+        tmp = font_class().set_parent(parent_object)  # type: ignore [attr-defined]
 
         # add listener(s)
         for l in event_listeners:
@@ -6,7 +6,11 @@ from ptext.io.read_transform.read_base_transformer import (
     ReadBaseTransformer,
     ReadTransformerContext,
 )
-from ptext.io.read_transform.types import AnyPDFType, Dictionary
+from ptext.io.read_transform.types import (
+    AnyPDFType,
+    Dictionary,
+    get_lazy_class,
+)
 from ptext.pdf.canvas.event.event_listener import EventListener
 from ptext.pdf.canvas.font.cid_font_type_0 import CIDFontType0
 from ptext.pdf.canvas.font.cid_font_type_2 import CIDFontType2
@@ -25,6 +29,14 @@ class ReadFontDictionaryTransformer(ReadBaseTransformer):
             isinstance(object, dict) and "Type" in object and object["Type"] == "Font"
         )
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (dict,)
+
+    def get_transformable_dictionary_keys(
+        self,
+    ) -> typing.Dict[str, typing.List[Optional[str]]]:
+        return {"Type": ["Font"]}
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -37,26 +49,31 @@ class ReadFontDictionaryTransformer(ReadBaseTransformer):
         assert isinstance(object_to_transform, Dictionary)
         subtype_name = object_to_transform["Subtype"]
 
-        font_obj: Optional[Font] = None
+        font_class: Optional[type] = None
         if subtype_name == "TrueType":
-            font_obj = TrueTypeFont()
+            font_class = TrueTypeFont
         elif subtype_name == "Type0":
-            font_obj = FontType0()
+            font_class = FontType0
         elif subtype_name == "Type1":
-            font_obj = FontType1()
+            font_class = FontType1
         elif subtype_name == "Type3":
-            font_obj = FontType3()
+            font_class = FontType3
         elif subtype_name == "CIDFontType0":
-            font_obj = CIDFontType0()
+            font_class = CIDFontType0
         elif subtype_name == "CIDFontType2":
-            font_obj = CIDFontType2()
+            font_class = CIDFontType2
         else:
             print("Unsupported font type %s" % subtype_name)
 
         # None
-        if font_obj is None:
+        if font_class is None:
             return None
 
+        # when lazy, this Font resolves the LazyObject(s) it holds when they are read
+        if context is not None and context.lazy:
+            font_class = get_lazy_class(font_class)
+        font_obj: Optional[Font] = font_class()
+
         # set parent
         assert font_obj is not None
         font_obj.set_parent(parent_object)  # type: ignore [attr-defined]
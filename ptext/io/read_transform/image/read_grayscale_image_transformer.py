@@ -5,7 +5,7 @@ from typing import Optional, Any, Union
 
 from PIL import Image  # type: ignore [import]
 
-from ptext.io.filter.stream_decode_util import decode_stream
+from ptext.io.filter.stream_decode_util import iter_decoded_stream_bytes
 from ptext.io.read_transform.image.read_jpeg_image_transformer import image_hash_method
 from ptext.io.read_transform.read_base_transformer import (
     ReadBaseTransformer,
@@ -39,6 +39,14 @@ class ReadGrayscaleImageTransformer(ReadBaseTransformer):
             and object.get("ColorSpace", None) == "DeviceGray"
         )
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (Stream,)
+
+    def get_transformable_dictionary_keys(
+        self,
+    ) -> typing.Dict[str, typing.List[Optional[str]]]:
+        return {"Type": ["XObject", None], "Subtype": ["Image"]}
+
     def transform(
         self,
         object_to_transform: Union["io.IOBase", AnyPDFType],
@@ -59,22 +67,32 @@ class ReadGrayscaleImageTransformer(ReadBaseTransformer):
                 v = xref.get_object(v, context.source, context.tokenizer)
                 object_to_transform[k] = v
 
-        grayscale_bytes = [
-            x for x in decode_stream(object_to_transform)["DecodedBytes"]
-        ]
-
         # use PIL to process image bytes
+        # the decoded bytes are read in chunks, and pasted (one strip at a time) into
+        # an image of h columns and w rows (which is transposed afterwards)
         w = int(object_to_transform["Width"])
         h = int(object_to_transform["Height"])
-        tmp = Image.new("RGB", (w, h))
-        for i in range(0, w):
-            for j in range(0, h):
-                k = i * h + j
-                try:
-                    c = (grayscale_bytes[k], grayscale_bytes[k], grayscale_bytes[k])
-                    tmp.putpixel((i, j), value=c)
-                except:
-                    pass
+        tmp = Image.new("L", (h, w))
+        row: int = 0
+        buffer = bytearray()
+        for chunk in iter_decoded_stream_bytes(
+            object_to_transform,
+            max_decoded_size=(context.max_decoded_stream_size if context else None),
+        ):
+            if row >= w or h == 0:
+                break
+            buffer += chunk
+            n: int = min(len(buffer) // h, w - row)
+            if n == 0:
+                continue
+            tmp.paste(Image.frombytes("L", (h, n), bytes(buffer[0 : n * h])), (0, row))
+            del buffer[0 : n * h]
+            row += n
+
+        # remainder (less than a row)
+        if len(buffer) > 0 and row < w:
+            tmp.paste(Image.frombytes("L", (len(buffer), 1), bytes(buffer)), (0, row))
+        tmp = tmp.transpose(Image.TRANSPOSE).convert("RGB")
 
         # add base methods
         add_base_methods(tmp.__class__)
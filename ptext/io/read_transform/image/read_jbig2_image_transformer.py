@@ -34,6 +34,14 @@ class ReadJBIG2ImageTransformer(ReadBaseTransformer):
             )
         )
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (Stream,)
+
+    def get_transformable_dictionary_keys(
+        self,
+    ) -> typing.Dict[str, typing.List[Optional[str]]]:
+        return {"Type": ["XObject", None], "Subtype": ["Image"]}
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -48,6 +48,14 @@ class ReadXMPMetadataTransformer(ReadStreamTransformer):
             and object["Subtype"] == "XML"
         )
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (Stream,)
+
+    def get_transformable_dictionary_keys(
+        self,
+    ) -> typing.Dict[str, typing.List[Optional[str]]]:
+        return {"Type": ["Metadata"], "Subtype": ["XML"]}
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -6,7 +6,11 @@ from ptext.io.read_transform.read_base_transformer import (
     ReadBaseTransformer,
     ReadTransformerContext,
 )
-from ptext.io.read_transform.types import List, AnyPDFType
+from ptext.io.read_transform.types import (
+    List,
+    AnyPDFType,
+    get_lazy_class,
+)
 from ptext.pdf.canvas.event.event_listener import EventListener
 
 
@@ -20,6 +24,9 @@ class ReadArrayTransformer(ReadBaseTransformer):
     ) -> bool:
         return isinstance(object, List)
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (List,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -29,7 +36,11 @@ class ReadArrayTransformer(ReadBaseTransformer):
     ) -> Any:
 
         # create root object
-        tmp = List().set_parent(parent_object)  # type: ignore [attr-defined]
+        # when lazy, this List resolves the LazyObject(s) it holds when they are read
+        list_class = (
+            get_lazy_class(List) if context is not None and context.lazy else List
+        )
+        tmp = list_class().set_parent(parent_object)  # type: ignore [attr-defined]
 
         # add listener(s)
         for l in event_listeners:
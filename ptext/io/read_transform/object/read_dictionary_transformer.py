@@ -6,7 +6,11 @@ from ptext.io.read_transform.read_base_transformer import (
     ReadBaseTransformer,
     ReadTransformerContext,
 )
-from ptext.io.read_transform.types import Dictionary, AnyPDFType
+from ptext.io.read_transform.types import (
+    Dictionary,
+    AnyPDFType,
+    copy_as_lazy,
+)
 from ptext.pdf.canvas.event.event_listener import EventListener
 
 
@@ -20,6 +24,9 @@ class ReadDictionaryTransformer(ReadBaseTransformer):
     ) -> bool:
         return isinstance(object, Dictionary)
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (Dictionary,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -29,7 +36,10 @@ class ReadDictionaryTransformer(ReadBaseTransformer):
     ) -> Any:
 
         # create root object
+        # when lazy, a copy of this Dictionary resolves the LazyObject(s) it holds
         assert isinstance(object_to_transform, Dictionary)
+        if context is not None and context.lazy:
+            object_to_transform = copy_as_lazy(object_to_transform)
         object_to_transform.set_parent(parent_object)  # type: ignore [attr-defined]
 
         # add listener(s)
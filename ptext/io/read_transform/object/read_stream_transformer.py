@@ -11,6 +11,7 @@ from ptext.io.read_transform.types import (
     Stream,
     Reference,
     AnyPDFType,
+    copy_as_lazy,
 )
 from ptext.pdf.canvas.event.event_listener import EventListener
 
@@ -21,6 +22,9 @@ class ReadStreamTransformer(ReadBaseTransformer):
     ) -> bool:
         return isinstance(object, Stream)
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (Stream,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -29,7 +33,10 @@ class ReadStreamTransformer(ReadBaseTransformer):
         event_listeners: typing.List[EventListener] = [],
     ) -> Any:
 
+        # when lazy, a copy of this Stream resolves the LazyObject(s) it holds
         assert isinstance(object_to_transform, Stream)
+        if context is not None and context.lazy:
+            object_to_transform = copy_as_lazy(object_to_transform)
         object_to_transform.set_parent(parent_object)  # type: ignore [attr-defined]
 
         # add listener(s)
@@ -46,7 +53,12 @@ class ReadStreamTransformer(ReadBaseTransformer):
                 object_to_transform[k] = v
 
         # apply filter(s)
-        object_to_transform = decode_stream(object_to_transform)
+        object_to_transform = decode_stream(
+            object_to_transform,
+            context.decoded_bytes_cache,
+            context.max_decoded_stream_size,
+            context.decode_executor,
+        )
 
         # convert (remainder of) stream dictionary
         for k, v in object_to_transform.items():
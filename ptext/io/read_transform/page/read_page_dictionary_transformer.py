@@ -2,15 +2,19 @@ import io
 import typing
 from typing import Optional, Any, Union, Dict
 
+from ptext.io.filter.stream_decode_util import open_decoded_stream
 from ptext.io.read_transform.read_base_transformer import (
     ReadBaseTransformer,
     ReadTransformerContext,
 )
 from ptext.io.read_transform.types import (
     Dictionary,
+    List,
     AnyPDFType,
+    get_lazy_class,
 )
 from ptext.pdf.canvas.canvas import Canvas
+from ptext.pdf.canvas.canvas_instruction_list import InstructionRecordingMode
 from ptext.pdf.canvas.event.begin_page_event import BeginPageEvent
 from ptext.pdf.canvas.event.end_page_event import EndPageEvent
 from ptext.pdf.canvas.event.event_listener import EventListener
@@ -25,6 +29,14 @@ class ReadPageDictionaryTransformer(ReadBaseTransformer):
             isinstance(object, Dict) and "Type" in object and object["Type"] == "Page"
         )
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (dict,)
+
+    def get_transformable_dictionary_keys(
+        self,
+    ) -> typing.Dict[str, typing.List[Optional[str]]]:
+        return {"Type": ["Page"]}
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -34,11 +46,19 @@ class ReadPageDictionaryTransformer(ReadBaseTransformer):
     ) -> Any:
 
         # convert dictionary like structure
-        tmp = Page().set_parent(parent_object)  # type: ignore [attr-defined]
+        # when lazy, this Page resolves the LazyObject(s) it holds when they are read
+        page_class = (
+            get_lazy_class(Page) if context is not None and context.lazy else Page
+        )
+        tmp = page_class().set_parent(parent_object)  # type: ignore [attr-defined]
+
+        # a Page that was not selected is read without sending events
+        mute_page_events: bool = context is not None and context.mute_page_events
 
         # add listener(s)
-        for l in event_listeners:
-            tmp.add_event_listener(l)  # type: ignore [attr-defined]
+        if not mute_page_events:
+            for l in event_listeners:
+                tmp.add_event_listener(l)  # type: ignore [attr-defined]
 
         # convert key/value pairs
         assert isinstance(object_to_transform, Dictionary)
@@ -50,6 +70,10 @@ class ReadPageDictionaryTransformer(ReadBaseTransformer):
             if v is not None:
                 tmp[k] = v
 
+        # return (without processing the content stream)
+        if mute_page_events:
+            return tmp
+
         # send out BeginPageEvent
         tmp.event_occurred(BeginPageEvent(tmp))
 
@@ -57,16 +81,25 @@ class ReadPageDictionaryTransformer(ReadBaseTransformer):
         assert "Contents" in tmp
         contents = tmp["Contents"]
         if contents is not None:
-            canvas = Canvas().set_parent(tmp)  # type: ignore [attr-defined]
+            # the Canvas is not kept, so neither are its instructions
+            canvas = Canvas(instruction_recording_mode=InstructionRecordingMode.NONE)
+            canvas.set_parent(tmp)  # type: ignore [attr-defined]
 
-            # process bytes in stream
-            if isinstance(contents, dict):
-                canvas.read(io.BytesIO(contents["DecodedBytes"]))
+            # when Stream objects are decoded by a decode executor, the (lazy) Contents
+            # and XObjects are resolved first, so they are all submitted before any is joined
+            # (accessing an entry of a lazily read List or Dictionary resolves it)
+            if context is not None and context.decode_executor is not None:
+                if isinstance(contents, List):
+                    for i in range(0, len(contents)):
+                        contents[i]
+                xobjects = tmp.get("Resources", {}).get("XObject", None)
+                if isinstance(xobjects, Dictionary):
+                    for k in xobjects.keys():
+                        xobjects[k]
 
-            # process bytes in array
-            if isinstance(contents, list):
-                bts = b"".join([x["DecodedBytes"] + b" " for x in contents])
-                canvas.read(io.BytesIO(bts))
+            # process bytes in stream (or array)
+            if isinstance(contents, (dict, list)):
+                canvas.read(open_decoded_stream(contents))
 
         # send out EndPageEvent
         tmp.event_occurred(EndPageEvent(tmp))
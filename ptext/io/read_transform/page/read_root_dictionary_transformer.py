@@ -1,3 +1,4 @@
+import functools
 import io
 import typing
 from typing import Optional, List, Any, Union, Dict
@@ -14,6 +15,8 @@ from ptext.io.read_transform.types import (
     List,
     AnyPDFType,
     Decimal,
+    LazyObject,
+    get_lazy_class,
 )
 from ptext.io.read_transform.types import List as pList
 from ptext.pdf.canvas.event.event_listener import EventListener
@@ -30,6 +33,14 @@ class ReadRootDictionaryTransformer(ReadBaseTransformer):
             and object["Type"] == "Catalog"
         )
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (dict,)
+
+    def get_transformable_dictionary_keys(
+        self,
+    ) -> typing.Dict[str, typing.List[Optional[str]]]:
+        return {"Type": ["Catalog"]}
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -56,6 +67,46 @@ class ReadRootDictionaryTransformer(ReadBaseTransformer):
         # rebuild /Pages if needed
         #
 
+        # lazy loading
+        # the Pages tree is only rebuilt when /Kids is first accessed
+        # if only some Page(s) are selected, those are read immediately (in order)
+        pages = transformed_root_dictionary["Pages"]
+        if (
+            context is not None
+            and context.lazy
+            and isinstance(pages.get("Kids", None), List)
+            and isinstance(pages.get("Count", None), Decimal)
+        ):
+            kids = pages["Kids"]
+
+            def rebuild_kids() -> pList:
+                pages_in_order: typing.List[Any] = []
+                self._collect_pages_lazily(kids, pages_in_order, context)
+                dict.__setitem__(pages, "Count", Decimal(len(pages_in_order)))
+                out = get_lazy_class(pList)()
+                for i, p in enumerate(pages_in_order):
+                    if context.selected_pages is not None and isinstance(
+                        p, LazyObject
+                    ):
+                        if context.selected_pages(i):
+                            p = p.resolve()
+                        elif not p.is_resolved():
+                            p = LazyObject(
+                                p.get_reference(),
+                                functools.partial(
+                                    self._read_page_without_events, p, context
+                                ),
+                            )
+                    out.append(p)
+                return out
+
+            # pages (read lazily) resolves /Kids when it is read
+            if context.selected_pages is None:
+                dict.__setitem__(pages, "Kids", LazyObject(None, rebuild_kids))
+            else:
+                dict.__setitem__(pages, "Kids", rebuild_kids())
+            return transformed_root_dictionary
+
         # list to hold Page objects (in order)
         pages_in_order: typing.List[Page] = []
 
@@ -86,3 +137,48 @@ class ReadRootDictionaryTransformer(ReadBaseTransformer):
 
         # return
         return transformed_root_dictionary
+
+    def _read_page_without_events(
+        self, page: LazyObject, context: ReadTransformerContext
+    ) -> Any:
+        """
+        This function reads a Page that was not selected (when it is first accessed),
+        without sending events to the EventListener(s) and without processing its content stream
+        """
+        mute_page_events: bool = context.mute_page_events
+        context.mute_page_events = True
+        try:
+            return page.resolve()
+        finally:
+            context.mute_page_events = mute_page_events
+
+    def _collect_pages_lazily(
+        self,
+        kids: List,
+        pages_in_order: typing.List[Any],
+        context: ReadTransformerContext,
+    ) -> None:
+        """
+        This function collects the Page(s) in a given /Kids array (DFS, in order).
+        Kids that have not been read yet are only read (not transformed) to determine
+        whether they are a Page (which is kept as a LazyObject) or another Pages node.
+        """
+        xref = context.root_object["XRef"]
+        for i in range(0, len(kids)):
+            kid = list.__getitem__(kids, i)
+            if isinstance(kid, LazyObject) and not kid.is_resolved():
+                obj = xref.get_object(
+                    kid.get_reference(), context.source, context.tokenizer
+                )
+                if isinstance(obj, Dictionary) and obj.get("Type", None) == "Page":
+                    pages_in_order.append(kid)
+                    continue
+            kid = kids[i]
+            if isinstance(kid, Page):
+                pages_in_order.append(kid)
+            if (
+                isinstance(kid, Dictionary)
+                and kid.get("Type", None) == "Pages"
+                and isinstance(kid.get("Kids", None), List)
+            ):
+                self._collect_pages_lazily(kid["Kids"], pages_in_order, context)
@@ -20,6 +20,9 @@ class ReadNumberTransformer(ReadBaseTransformer):
     ) -> bool:
         return isinstance(object, Decimal)
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (Decimal,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
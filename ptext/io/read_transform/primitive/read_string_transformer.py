@@ -25,6 +25,9 @@ class ReadStringTransformer(ReadBaseTransformer):
             or isinstance(object, Name)
         )
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (String, HexadecimalString, Name)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
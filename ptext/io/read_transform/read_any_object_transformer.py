@@ -98,6 +98,9 @@ class ReadAnyObjectTransformer(ReadBaseTransformer):
     ) -> bool:
         return isinstance(object, io.IOBase)
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (io.IOBase,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -1,11 +1,17 @@
+import concurrent.futures
 import io
 import typing
 from typing import Optional, Any, Union
 
+from ptext.io.filter.decoded_bytes_cache import DecodedBytesCache
 from ptext.io.read_transform.types import AnyPDFType, Reference
 from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
 from ptext.pdf.canvas.event.event_listener import EventListener
 
+# the value of /Type or /Subtype in a dispatch key, when that value is present but not a name
+# (it matches no value returned by get_transformable_dictionary_keys)
+_NOT_A_NAME = object()
+
 
 class ReadTransformerContext:
     def __init__(
@@ -13,11 +19,34 @@ class ReadTransformerContext:
         source: Optional[Union[io.BufferedIOBase, io.RawIOBase]] = None,
         tokenizer: Optional[HighLevelTokenizer] = None,
         root_object: Optional[Any] = None,
+        lazy: bool = False,
+        selected_pages: Optional[typing.Callable[[int], bool]] = None,
+        decoded_bytes_cache: Optional[DecodedBytesCache] = None,
+        max_decoded_stream_size: Optional[int] = None,
+        decode_executor: Optional[concurrent.futures.Executor] = None,
     ):
         self.source = source
         self.tokenizer = tokenizer
         self.root_object = root_object
         self.indirect_reference_chain: typing.Set[Reference] = set()
+        # the (transformed) objects that were read by Reference, in the order they were read
+        self.reference_cache: typing.Dict[Reference, AnyPDFType] = {}
+        # when lazy, references are only read (and transformed) when first accessed
+        self.lazy = lazy
+        # when set, only the Page(s) (by index) for which this returns True are read
+        self.selected_pages = selected_pages
+        # when set, a Page is read without sending events (or processing its content stream)
+        # this is the case for a Page that was not selected, but is accessed later on
+        self.mute_page_events: bool = False
+        # when set, Stream objects are only decoded when their DecodedBytes are accessed
+        self.decoded_bytes_cache = decoded_bytes_cache
+        # when set, decoding a Stream fails once a filter produces more bytes than this
+        self.max_decoded_stream_size = max_decoded_stream_size
+        # when set, (Flate) Stream objects are decoded by this executor,
+        # and joined when their DecodedBytes are first accessed
+        # a DecodedBytesCache decodes Stream objects when accessed, not by the decode executor
+        assert decoded_bytes_cache is None or decode_executor is None
+        self.decode_executor = decode_executor
 
 
 class ReadBaseTransformer:
@@ -31,6 +60,10 @@ class ReadBaseTransformer:
         self.parent = None
         self.level = 0
         self.invocation_count = 0
+        # children (in order) that may transform an object, by dispatch key
+        self._children_by_dispatch_key: typing.Dict[
+            typing.Tuple[type, Any, Any], typing.List["ReadBaseTransformer"]
+        ] = {}
 
     def add_child_transformer(self, child_transformer: "ReadBaseTransformer") -> "ReadBaseTransformer":  # type: ignore[name-defined]
         """
@@ -42,6 +75,7 @@ class ReadBaseTransformer:
         """
         self.children.append(child_transformer)
         child_transformer.parent = self
+        self._children_by_dispatch_key.clear()
         return self
 
     def get_root_transformer(self) -> "ReadBaseTransformer":  # type: ignore[name-defined]
@@ -55,6 +89,60 @@ class ReadBaseTransformer:
     ) -> bool:
         return False
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        """
+        This function returns the (Python) types of the objects this ReadBaseTransformer can transform,
+        or None if it can not be determined up front. can_be_transformed is only called
+        (by the parent ReadBaseTransformer) for objects of these types.
+        """
+        return None
+
+    def get_transformable_dictionary_keys(
+        self,
+    ) -> typing.Dict[str, typing.List[Optional[str]]]:
+        """
+        This function returns the values of /Type and /Subtype (None meaning the key is absent)
+        the dictionaries this ReadBaseTransformer can transform must have.
+        e.g. {"Type": ["XObject", None], "Subtype": ["Image"]}
+        can_be_transformed is only called (by the parent ReadBaseTransformer) for dictionaries
+        with one of these values, a key that is not present in the returned dictionary is not checked.
+        A dictionary whose /Type or /Subtype is not a name (e.g. a number) only matches if that key is not checked.
+        """
+        return {}
+
+    def _get_dispatch_key(self, object: Any) -> typing.Tuple[type, Any, Any]:
+        if not isinstance(object, dict):
+            return (type(object), None, None)
+        # /Type and /Subtype are converted to (plain) str
+        # a Name may have a parent, which would otherwise be kept by the dispatch key
+        values: typing.List[Any] = []
+        for k in ["Type", "Subtype"]:
+            v = object.get(k, None)
+            if v is not None:
+                v = str(v) if isinstance(v, str) else _NOT_A_NAME
+            values.append(v)
+        return (type(object), values[0], values[1])
+
+    def _get_children_by_dispatch_key(
+        self, key: typing.Tuple[type, Any, Any]
+    ) -> typing.List["ReadBaseTransformer"]:
+        children: typing.List["ReadBaseTransformer"] = []
+        for h in self.children:
+            transformable_types = h.get_transformable_types()
+            if transformable_types is not None and not issubclass(
+                key[0], transformable_types
+            ):
+                continue
+            if issubclass(key[0], dict) and any(
+                [
+                    v not in h.get_transformable_dictionary_keys().get(k, [v])
+                    for k, v in [("Type", key[1]), ("Subtype", key[2])]
+                ]
+            ):
+                continue
+            children.append(h)
+        return children
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -62,7 +150,14 @@ class ReadBaseTransformer:
         context: Optional[ReadTransformerContext] = None,
         event_listeners: typing.List[EventListener] = [],
     ) -> Any:
-        for h in self.children:
+        # only consider the children that may transform an object of this type
+        # (with this /Type and /Subtype), in the order in which they were added
+        key = self._get_dispatch_key(object_to_transform)
+        children = self._children_by_dispatch_key.get(key, None)
+        if children is None:
+            children = self._get_children_by_dispatch_key(key)
+            self._children_by_dispatch_key[key] = children
+        for h in children:
             if h.can_be_transformed(object_to_transform):
                 # print("%s<%s level='%d' invocation='%d'>" % ("   " * self.level, h.__class__.__name__, self.level, self.invocation_count), flush=True)
                 self.level += 1
@@ -20,6 +20,9 @@ class DefaultIndirectObjectTransformer(ReadBaseTransformer):
     ) -> bool:
         return False
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return ()
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -6,20 +6,24 @@ from ptext.io.read_transform.read_base_transformer import (
     ReadBaseTransformer,
     ReadTransformerContext,
 )
-from ptext.io.read_transform.types import Reference, AnyPDFType
+from ptext.io.read_transform.types import (
+    Reference,
+    AnyPDFType,
+    LazyObject,
+)
 from ptext.pdf.canvas.event.event_listener import EventListener
 from ptext.pdf.xref.xref import XREF
 
 
 class DefaultReferenceTransformer(ReadBaseTransformer):
-    def __init__(self):
-        self.cache: typing.Dict[Reference, AnyPDFType] = {}
-
     def can_be_transformed(
         self, object: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType]
     ) -> bool:
         return isinstance(object, Reference)
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (Reference,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -29,14 +33,43 @@ class DefaultReferenceTransformer(ReadBaseTransformer):
     ) -> Any:
 
         assert isinstance(object_to_transform, Reference)
+        assert context is not None
+
+        # lazy loading
+        # the referenced object is read (and transformed) the first time it is accessed
+        if context.lazy:
+            ref_from_cache = context.reference_cache.get(object_to_transform, None)
+            if ref_from_cache is not None:
+                return ref_from_cache
+
+            def resolve() -> Any:
+                obj = self._read_referenced_object(
+                    object_to_transform, parent_object, context, event_listeners
+                )
+                return obj if obj is not None else object_to_transform
+
+            # the (lazy) Dictionary (or List) holding the LazyObject resolves it
+            return LazyObject(object_to_transform, resolve)
+
+        # return
+        return self._read_referenced_object(
+            object_to_transform, parent_object, context, event_listeners
+        )
+
+    def _read_referenced_object(
+        self,
+        object_to_transform: Reference,
+        parent_object: Any,
+        context: ReadTransformerContext,
+        event_listeners: typing.List[EventListener] = [],
+    ) -> Any:
 
         # check for circular reference
-        assert context is not None
         if object_to_transform in context.indirect_reference_chain:
             return None
 
         # lookup in cache
-        ref_from_cache = self.cache.get(object_to_transform, None)
+        ref_from_cache = context.reference_cache.get(object_to_transform, None)
         if ref_from_cache is not None:
             return ref_from_cache
 
@@ -67,7 +100,7 @@ class DefaultReferenceTransformer(ReadBaseTransformer):
 
         # update cache
         if transformed_referenced_object is not None:
-            self.cache[object_to_transform] = transformed_referenced_object
+            context.reference_cache[object_to_transform] = transformed_referenced_object
 
         # return
         return transformed_referenced_object
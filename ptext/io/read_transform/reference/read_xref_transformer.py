@@ -11,6 +11,7 @@ from ptext.io.read_transform.read_base_transformer import (
 )
 from ptext.io.read_transform.types import AnyPDFType, Dictionary
 from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
+from ptext.io.tokenize.memory_view_source import MemoryViewSource
 from ptext.pdf.canvas.event.event_listener import EventListener
 from ptext.pdf.document import Document
 from ptext.pdf.xref.plaintext_xref import PlainTextXREF
@@ -28,6 +29,9 @@ class DefaultXREFTransformer(ReadBaseTransformer):
     ) -> bool:
         return isinstance(object, io.IOBase)
 
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return (io.IOBase,)
+
     def transform(
         self,
         object_to_transform: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType],
@@ -88,6 +92,11 @@ class DefaultXREFTransformer(ReadBaseTransformer):
             if k in xref["Trailer"]:
                 xref["Trailer"].pop(k)
 
+        # read selected Page(s)
+        # accessing /Root reads (and transforms) the selected Page(s)
+        if context.selected_pages is not None:
+            trailer.get("Root", None)
+
         # return
         return context.root_object
 
@@ -111,7 +120,11 @@ class DefaultXREFTransformer(ReadBaseTransformer):
             pass
 
         # truncate
-        if index_of_pdf_comment > 0:
+        # a MemoryViewSource is truncated by offsetting it (rather than copying it)
+        if index_of_pdf_comment > 0 and isinstance(context.source, MemoryViewSource):
+            context.source = context.source.get_view(index_of_pdf_comment)
+            context.tokenizer.io_source = context.source
+        elif index_of_pdf_comment > 0:
             # determine end of file
             end_of_file = context.source.seek(0, os.SEEK_END)
             context.source.seek(0)
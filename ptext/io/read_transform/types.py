@@ -1,5 +1,7 @@
+import copy
+import typing
 from decimal import Decimal
-from typing import Union, Optional
+from typing import Union, Optional, Any
 
 
 def add_base_methods(cls):
@@ -59,19 +61,29 @@ def add_base_methods(cls):
         """
         Add an EventListener to this object
         """
-        if not hasattr(self, "_event_listeners"):
+        # each object keeps its own EventListener(s)
+        if "_event_listeners" not in vars(self):
             setattr(self, "_event_listeners", [])
         getattr(self, "_event_listeners").append(event_listener)
         return self
 
+    def get_event_listeners(self):
+        """
+        Get the EventListeners registered to this object, and to its parent(s)
+        """
+        out = []
+        tmp = self
+        while tmp is not None:
+            out.extend(getattr(tmp, "__dict__", {}).get("_event_listeners", []))
+            tmp = getattr(tmp, "_parent", None)
+        return out
+
     def event_occurred(self, event):
         """
         Notify the EventListeners registered
-        to this object that an Event has occurred
+        to this object (and to its parent(s)) that an Event has occurred
         """
-        if not hasattr(self, "_event_listeners"):
-            setattr(self, "_event_listeners", [])
-        for l in getattr(self, "_event_listeners"):
+        for l in self.get_event_listeners():
             l.event_occurred(event)
         return self
 
@@ -104,6 +116,7 @@ def add_base_methods(cls):
     setattr(cls, "get_root", get_root)
     # event listener methods
     setattr(cls, "add_event_listener", add_event_listener)
+    setattr(cls, "get_event_listeners", get_event_listeners)
     setattr(cls, "event_occurred", event_occurred)
     # pdf methods
     setattr(cls, "set_reference", set_reference)
@@ -114,7 +127,6 @@ def add_base_methods(cls):
     setattr(cls, "to_json_serializable", to_json_serializable)
     # initialize fields
     setattr(cls, "_parent", None)
-    setattr(cls, "_event_listeners", [])
     setattr(cls, "_can_be_referenced", True)
     return cls
 
@@ -287,10 +299,79 @@ class Dictionary(dict):
             hashcode = 31 * hashcode + (0 if e is None else hash(e))
         return hashcode
 
+    def __deepcopy__(self, memodict=None):
+        # Stream bytes may be a (read-only) memoryview, which is shared rather than copied
+        memodict = {} if memodict is None else memodict
+        out = self.__class__.__new__(self.__class__)
+        memodict[id(self)] = out
+        for k, v in dict.items(self):
+            if not isinstance(v, memoryview):
+                v = copy.deepcopy(v, memodict)
+            dict.__setitem__(out, copy.deepcopy(k, memodict), v)
+        for k, v in self.__dict__.items():
+            setattr(out, k, copy.deepcopy(v, memodict))
+        return out
+
 
 @add_base_methods
 class Stream(Dictionary):
-    pass
+
+    # when set, DecodedBytes is not stored in this Stream,
+    # but computed (and kept) by this DecodedBytesCache when accessed
+    _decoded_bytes_cache = None
+
+    # when set, decoding this Stream fails once a filter produces more bytes than this
+    _max_decoded_size = None
+
+    # when set, DecodedBytes is being computed (by a decode executor),
+    # and this Future is joined when DecodedBytes is first accessed
+    _decoded_bytes_future = None
+
+    def _join_decoded_bytes(self) -> None:
+        # the Future is kept (and raises again) when decoding failed
+        future = self._decoded_bytes_future
+        if future is None:
+            return
+        self[Name("DecodedBytes")] = future.result()
+        self._decoded_bytes_future = None
+
+    def __getitem__(self, key):
+        if self._decoded_bytes_future is not None and key == "DecodedBytes":
+            self._join_decoded_bytes()
+        if (
+            self._decoded_bytes_cache is not None
+            and key == "DecodedBytes"
+            and not dict.__contains__(self, key)
+        ):
+            return self._decoded_bytes_cache.get(self)
+        return super(Stream, self).__getitem__(key)
+
+    def get(self, key, default=None):
+        # DecodedBytes may be kept (or computed) outside of this Stream
+        if key in self:
+            return self[key]
+        return default
+
+    def __contains__(self, key):
+        if dict.__contains__(self, key):
+            return True
+        return key == "DecodedBytes" and (
+            self._decoded_bytes_cache is not None
+            or self._decoded_bytes_future is not None
+        )
+
+    def __deepcopy__(self, memodict=None):
+        # a Future can not be copied, DecodedBytes is joined first
+        self._join_decoded_bytes()
+        # the DecodedBytesCache is shared rather than copied
+        memodict = {} if memodict is None else memodict
+        if self._decoded_bytes_cache is None:
+            return super(Stream, self).__deepcopy__(memodict)
+        memodict[id(self._decoded_bytes_cache)] = self._decoded_bytes_cache
+        out = super(Stream, self).__deepcopy__(memodict)
+        # the copy is linked to the DecodedBytesCache on its own,
+        # its DecodedBytes are not discarded along with this Stream
+        return self._decoded_bytes_cache.add(out)
 
 
 @add_base_methods
@@ -371,6 +452,322 @@ class Reference:
         )
 
 
+class LazyObject:
+    """
+    A LazyObject takes the place of an indirect object that has not been read yet.
+    It is resolved (and replaced by the object it stands for) the first time it is accessed
+    in the Dictionary or List that contains it.
+    """
+
+    def __init__(
+        self, reference: Optional[Reference], resolver: typing.Callable[[], Any]
+    ):
+        self._reference: Optional[Reference] = reference
+        self._resolver: Optional[typing.Callable[[], Any]] = resolver
+        self._resolved_object: Any = None
+
+    def get_reference(self) -> Optional[Reference]:
+        """
+        This function returns the Reference this LazyObject stands for (if any)
+        """
+        return self._reference
+
+    def is_resolved(self) -> bool:
+        """
+        This function returns True if this LazyObject has been resolved, False otherwise
+        """
+        return self._resolver is None
+
+    def resolve(self) -> Any:
+        """
+        This function returns the object this LazyObject stands for,
+        reading (and transforming) it the first time it is called
+        """
+        if self._resolver is not None:
+            resolver = self._resolver
+            self._resolver = None
+            self._resolved_object = resolver()
+        return self._resolved_object
+
+
+class _LazyList:
+    """
+    This class (mixed into a List that may hold LazyObject(s)) resolves
+    a LazyObject (and replaces it by the object it stands for) when it is read
+    """
+
+    # the (plain) List class this class was built from (by get_lazy_class)
+    _lazy_base_class: type
+
+    def __getitem__(self, index):
+        value = super().__getitem__(index)  # type: ignore [misc]
+        if isinstance(index, slice):
+            if LazyObject in map(type, value):
+                for i in range(*index.indices(len(self))):  # type: ignore [arg-type]
+                    self.__getitem__(i)
+                value = super().__getitem__(index)  # type: ignore [misc]
+        elif isinstance(value, LazyObject):
+            value = value.resolve()
+            list.__setitem__(self, index, value)  # type: ignore [call-overload]
+        return value
+
+    def __iter__(self):
+        if LazyObject not in map(type, list.__iter__(self)):  # type: ignore [arg-type]
+            return list.__iter__(self)  # type: ignore [arg-type]
+        return (self[i] for i in range(0, len(self)))  # type: ignore [arg-type]
+
+    def pop(self, index=-1):
+        value = super().pop(index)  # type: ignore [misc]
+        if isinstance(value, LazyObject):
+            value = value.resolve()
+        return value
+
+    def _resolve_all(self) -> None:
+        if LazyObject not in map(type, list.__iter__(self)):  # type: ignore [arg-type]
+            return
+        for i in range(0, len(self)):  # type: ignore [arg-type]
+            self.__getitem__(i)
+
+    # reading the List (as a whole) first resolves its LazyObject(s)
+
+    def __add__(self, other):
+        self._resolve_all()
+        if isinstance(other, _LazyList):
+            other._resolve_all()
+        return super().__add__(other)  # type: ignore [misc]
+
+    def __contains__(self, other):
+        self._resolve_all()
+        return super().__contains__(other)  # type: ignore [misc]
+
+    def __eq__(self, other):
+        self._resolve_all()
+        if isinstance(other, _LazyList):
+            other._resolve_all()
+        return super().__eq__(other)  # type: ignore [misc]
+
+    def __ne__(self, other):
+        self._resolve_all()
+        if isinstance(other, _LazyList):
+            other._resolve_all()
+        return super().__ne__(other)  # type: ignore [misc]
+
+    def __lt__(self, other):
+        self._resolve_all()
+        if isinstance(other, _LazyList):
+            other._resolve_all()
+        return super().__lt__(other)  # type: ignore [misc]
+
+    def __le__(self, other):
+        self._resolve_all()
+        if isinstance(other, _LazyList):
+            other._resolve_all()
+        return super().__le__(other)  # type: ignore [misc]
+
+    def __gt__(self, other):
+        self._resolve_all()
+        if isinstance(other, _LazyList):
+            other._resolve_all()
+        return super().__gt__(other)  # type: ignore [misc]
+
+    def __ge__(self, other):
+        self._resolve_all()
+        if isinstance(other, _LazyList):
+            other._resolve_all()
+        return super().__ge__(other)  # type: ignore [misc]
+
+    def __mul__(self, other):
+        self._resolve_all()
+        return super().__mul__(other)  # type: ignore [misc]
+
+    def __rmul__(self, other):
+        self._resolve_all()
+        return super().__rmul__(other)  # type: ignore [misc]
+
+    def __repr__(self):
+        self._resolve_all()
+        return super().__repr__()  # type: ignore [misc]
+
+    def __reversed__(self):
+        self._resolve_all()
+        return super().__reversed__()  # type: ignore [misc]
+
+    def copy(self):
+        self._resolve_all()
+        return super().copy()  # type: ignore [misc]
+
+    def count(self, other):
+        self._resolve_all()
+        return super().count(other)  # type: ignore [misc]
+
+    def index(self, *args):
+        self._resolve_all()
+        return super().index(*args)  # type: ignore [misc]
+
+    def sort(self, *args, **kwargs):
+        self._resolve_all()
+        return super().sort(*args, **kwargs)  # type: ignore [misc]
+
+    def __reduce_ex__(self, protocol):
+        # a pickled (or copied) List is a plain List (of the same class),
+        # holding the objects its LazyObject(s) stand for (this List is not changed)
+        base_cls = self._lazy_base_class
+        items = [
+            x.resolve() if isinstance(x, LazyObject) else x
+            for x in list.__iter__(self)  # type: ignore [arg-type]
+        ]
+        return base_cls.__new__, (base_cls,), vars(self) or None, iter(items), None
+
+
+class _LazyDictionary:
+    """
+    This class (mixed into a Dictionary that may hold LazyObject(s)) resolves
+    a LazyObject (and replaces it by the object it stands for) when it is read
+    """
+
+    # the (plain) Dictionary class this class was built from (by get_lazy_class)
+    _lazy_base_class: type
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)  # type: ignore [misc]
+        if isinstance(value, LazyObject):
+            value = value.resolve()
+            dict.__setitem__(self, key, value)  # type: ignore [index]
+        return value
+
+    def __iter__(self):
+        # dict(...), {**...} and dict.update(...) copy the (unresolved) values of a dict,
+        # unless it overrides __iter__, then they read every value by key
+        return dict.__iter__(self)  # type: ignore [arg-type]
+
+    def get(self, key, default=None):
+        if key in self:  # type: ignore [operator]
+            return self[key]
+        return default
+
+    def setdefault(self, key, default=None):
+        if key in self:  # type: ignore [operator]
+            return self[key]
+        return super().setdefault(key, default)  # type: ignore [misc]
+
+    def pop(self, key, *args):
+        value = super().pop(key, *args)  # type: ignore [misc]
+        if isinstance(value, LazyObject):
+            value = value.resolve()
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()  # type: ignore [misc]
+        if isinstance(value, LazyObject):
+            value = value.resolve()
+        return key, value
+
+    def _resolve_all(self) -> None:
+        if LazyObject not in map(type, dict.values(self)):  # type: ignore [arg-type]
+            return
+        for k, v in list(dict.items(self)):  # type: ignore [arg-type]
+            if isinstance(v, LazyObject):
+                dict.__setitem__(self, k, v.resolve())  # type: ignore [index]
+
+    # reading the Dictionary (as a whole) first resolves its LazyObject(s)
+
+    def __deepcopy__(self, memodict=None):
+        self._resolve_all()
+        return super().__deepcopy__(memodict)  # type: ignore [misc]
+
+    def __eq__(self, other):
+        self._resolve_all()
+        if isinstance(other, _LazyDictionary):
+            other._resolve_all()
+        return super().__eq__(other)  # type: ignore [misc]
+
+    def __ne__(self, other):
+        self._resolve_all()
+        if isinstance(other, _LazyDictionary):
+            other._resolve_all()
+        return super().__ne__(other)  # type: ignore [misc]
+
+    def __or__(self, other):
+        self._resolve_all()
+        if isinstance(other, _LazyDictionary):
+            other._resolve_all()
+        return super().__or__(other)  # type: ignore [misc]
+
+    def __repr__(self):
+        self._resolve_all()
+        return super().__repr__()  # type: ignore [misc]
+
+    def copy(self):
+        self._resolve_all()
+        return super().copy()  # type: ignore [misc]
+
+    def items(self):
+        self._resolve_all()
+        return super().items()  # type: ignore [misc]
+
+    def values(self):
+        self._resolve_all()
+        return super().values()  # type: ignore [misc]
+
+    def __reduce_ex__(self, protocol):
+        # a pickled (or copied) Dictionary is a plain Dictionary (of the same class),
+        # holding the objects its LazyObject(s) stand for (this Dictionary is not changed)
+        base_cls = self._lazy_base_class
+        items = [
+            (k, v.resolve() if isinstance(v, LazyObject) else v)
+            for k, v in dict.items(self)  # type: ignore [arg-type]
+        ]
+        return base_cls.__new__, (base_cls,), vars(self) or None, None, iter(items)
+
+
+# Dictionary (or List) class -> its subclass that resolves LazyObject(s)
+_lazy_classes: typing.Dict[type, type] = {}
+
+
+def get_lazy_class(cls: type) -> type:
+    """
+    This function returns the subclass of a Dictionary (or List) class
+    that resolves LazyObject(s) when they are read.
+    A lazily read Document is built from these classes,
+    an eagerly read Document keeps plain dict (and list) access.
+    """
+    if issubclass(cls, (_LazyDictionary, _LazyList)):
+        return cls
+    lazy_cls = _lazy_classes.get(cls, None)
+    if lazy_cls is None:
+        lazy_cls = type(
+            cls.__name__,
+            (_LazyDictionary if issubclass(cls, dict) else _LazyList, cls),
+            {
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                # defining __eq__ would otherwise unset __hash__
+                "__hash__": cls.__hash__,
+                # the (plain) class a pickled (or copied) object of this class is restored as
+                "_lazy_base_class": cls,
+            },
+        )
+        _lazy_classes[cls] = lazy_cls
+    return lazy_cls
+
+
+def copy_as_lazy(obj: Union["Dictionary", "List"]) -> Union["Dictionary", "List"]:
+    """
+    This function returns a (shallow) copy of a Dictionary (or List),
+    built from the class returned by get_lazy_class
+    """
+    lazy_cls = get_lazy_class(obj.__class__)
+    if obj.__class__ is lazy_cls:
+        return obj
+    out = lazy_cls.__new__(lazy_cls)
+    if isinstance(obj, dict):
+        dict.update(out, obj)
+    else:
+        list.extend(out, obj)
+    vars(out).update(vars(obj))
+    return out
+
+
 AnyPDFType = Union[
     Boolean,
     CanvasOperatorName,
@@ -16,6 +16,7 @@ from ptext.io.read_transform.types import (
     Stream,
 )
 from ptext.io.tokenize.low_level_tokenizer import LowLevelTokenizer, TokenType
+from ptext.io.tokenize.memory_view_source import MemoryViewSource
 
 
 class HighLevelTokenizer(LowLevelTokenizer):
@@ -33,10 +34,11 @@ class HighLevelTokenizer(LowLevelTokenizer):
         out = List()
 
         while True:
-            token = self.next_non_comment_token()
+            token = self.peek_non_comment_token()
             if token is None:
                 raise PDFEOFError()
             if token.token_type == TokenType.END_ARRAY:
+                self.next_non_comment_token()
                 break
             if token.token_type == TokenType.END_DICT:
                 raise PDFSyntaxError(
@@ -44,9 +46,6 @@ class HighLevelTokenizer(LowLevelTokenizer):
                     byte_offset=token.byte_offset,
                 )
 
-            # go back
-            self.seek(token.byte_offset)
-
             # read
             obj = self.read_object()
 
@@ -194,33 +193,43 @@ class HighLevelTokenizer(LowLevelTokenizer):
             return self.read_array()
 
         # <number> <number> "R"
-        if token.token_type == TokenType.NUMBER:
-            self.seek(token.byte_offset)  # go to start of indirect reference
-            potential_indirect_reference = self.read_indirect_reference()
-            if potential_indirect_reference is not None:
-                return potential_indirect_reference
-
-        # <number> <number> "obj"
-        # <<dictionary>>
-        # "stream"
-        # <bytes>
-        # "endstream"
-        if token.token_type == TokenType.NUMBER:
-            self.seek(token.byte_offset)
-            potential_stream = self.read_stream(xref)
-            if potential_stream is not None:
-                return potential_stream
-
         # <number> <number> "obj"
-        if token.token_type == TokenType.NUMBER:
-            self.seek(token.byte_offset)
-            potential_indirect_object = self.read_indirect_object()
-            if potential_indirect_object is not None:
-                return potential_indirect_object
+        # the next two Token(s) are looked ahead (rather than re-reading the number)
+        # to decide between a number, an indirect reference and an indirect object
+        if token.token_type == TokenType.NUMBER and token.text.isdigit():
+            generation_number_token = self.peek_non_comment_token(0)
+            keyword_token = self.peek_non_comment_token(1)
+            if (
+                generation_number_token is not None
+                and keyword_token is not None
+                and generation_number_token.token_type == TokenType.NUMBER
+                and generation_number_token.text.isdigit()
+                and keyword_token.token_type == TokenType.OTHER
+            ):
+                if keyword_token.text == "R":
+                    self.next_non_comment_token()
+                    self.next_non_comment_token()
+                    return Reference(
+                        object_number=int(token.text),
+                        generation_number=int(generation_number_token.text),
+                    )
+                if keyword_token.text == "obj":
+                    byte_offset_after_number = self.tell()
+                    self.next_non_comment_token()
+                    self.next_non_comment_token()
+                    potential_indirect_object = self._read_indirect_object_value(
+                        Reference(
+                            object_number=int(token.text),
+                            generation_number=int(generation_number_token.text),
+                        ),
+                        xref,
+                    )
+                    if potential_indirect_object is not None:
+                        return potential_indirect_object
+                    self.seek(byte_offset_after_number)
 
         # numbers
         if token.token_type == TokenType.NUMBER:
-            self.seek(self.tell() + len(token.text))
             return Decimal(Decimal(token.text))
 
         # boolean
@@ -266,6 +275,45 @@ class HighLevelTokenizer(LowLevelTokenizer):
             self.seek(byte_offset)
             return None
 
+        # read bytes
+        return self._read_stream_bytes(stream_dictionary, xref)
+
+    def _read_indirect_object_value(
+        self, reference: Reference, xref: Optional["XREF"] = None  # type: ignore [name-defined]
+    ) -> Optional[AnyPDFType]:
+        """
+        This method processes the value of an indirect object (the Token(s) <number> <number> "obj" having been read)
+        If the value is a dictionary, followed by the keyword "stream", a Stream is returned.
+        """
+
+        # read obj
+        value = self.read_object()
+        if value is None:
+            return None
+        value.set_reference(reference)  # type: ignore[union-attr]
+
+        # <<dictionary>>
+        # "stream"
+        # <bytes>
+        # "endstream"
+        if isinstance(value, dict):
+            stream_token = self.peek_non_comment_token()
+            if (
+                stream_token is not None
+                and stream_token.token_type == TokenType.OTHER
+                and stream_token.text == "stream"
+            ):
+                self.next_non_comment_token()
+                return self._read_stream_bytes(value, xref)
+
+        # return
+        return value
+
+    def _read_stream_bytes(self, stream_dictionary: Dictionary, xref: Optional["XREF"] = None) -> Stream:  # type: ignore [name-defined]
+        """
+        This method processes the bytes of a Stream (the keyword "stream" having been read)
+        """
+
         # process \Length
         if "Length" not in stream_dictionary:
             raise PDFTypeError(received_type=None, expected_type=int)
@@ -273,7 +321,7 @@ class HighLevelTokenizer(LowLevelTokenizer):
         if isinstance(length_of_stream, Reference):
             if xref is None:
                 raise RuntimeError(
-                    "unable to process reference \Length when no XREF is given"
+                    "unable to process reference \\Length when no XREF is given"
                 )
             pos_before = self.tell()
             length_of_stream = int(
@@ -296,7 +344,11 @@ class HighLevelTokenizer(LowLevelTokenizer):
                     byte_offset=self.tell(),
                 )
 
-        bytes = self.io_source.read(int(length_of_stream))
+        # a MemoryViewSource offers the bytes without copying them
+        if isinstance(self.io_source, MemoryViewSource):
+            bytes = self.io_source.read_view(int(length_of_stream))
+        else:
+            bytes = self.io_source.read(int(length_of_stream))
 
         # attempt to read token "endstream"
         end_of_stream_token = self.next_non_comment_token()
@@ -1,8 +1,32 @@
 import enum
 import io
-from typing import Optional
+import mmap
+import re
+from typing import Optional, List, Tuple
 
 from ptext.exception.pdf_exception import PDFEOFError, PDFSyntaxError
+from ptext.io.tokenize.memory_view_source import MemoryViewSource
+
+
+# fmt: off
+# each alternative captures one kind of Token, in the same order in which LowLevelTokenizer checks them
+_TOKEN = re.compile(
+    rb"[\x00\t\n\x0c\r ]*(?:"
+    rb"(\[)"                                  # START_ARRAY
+    rb"|(\])"                                 # END_ARRAY
+    rb"|(/[^\x00\t\n\x0c\r %()/<>\[\]]*)"      # NAME
+    rb"|(>>)"                                 # END_DICT
+    rb"|(%[^\r\n]*)"                          # COMMENT
+    rb"|(<<)"                                 # START_DICT
+    rb"|(<[^>]*>?)"                           # HEX_STRING
+    rb"|([-+.0-9]+)"                          # NUMBER
+    rb"|(\()"                                 # STRING
+    rb"|(>)"                                  # (invalid) END_DICT
+    rb"|([^\x00\t\n\x0c\r %()/<>\[\]]*)"       # OTHER
+    rb")"
+)
+_STRING_SPECIAL_CHARACTER = re.compile(rb"[()\\]")
+# fmt: on
 
 
 class TokenType(enum.IntEnum):
@@ -60,9 +84,41 @@ class LowLevelTokenizer:
     and so forth.
     """
 
-    def __init__(self, io_source):
+    # fmt: off
+    _TOKEN_TYPE_PER_GROUP = [
+        None,
+        TokenType.START_ARRAY, TokenType.END_ARRAY, TokenType.NAME, TokenType.END_DICT,
+        TokenType.COMMENT, TokenType.START_DICT, TokenType.HEX_STRING, TokenType.NUMBER,
+        TokenType.STRING, None, TokenType.OTHER,
+    ]
+    # fmt: on
+
+    def __init__(self, io_source, use_buffer: bool = True):
+        self._use_buffer = use_buffer
+        self._buffer = None
+        # Token(s) that have been read ahead, along with the byte offset right after each Token
+        # these are only valid as long as the io source is positioned at _lookahead_byte_offset
+        self._lookahead: List[Tuple[Token, int]] = []
+        self._lookahead_byte_offset: int = -1
         self.io_source = io_source
 
+    @property
+    def io_source(self):
+        """
+        The io source this LowLevelTokenizer reads from
+        """
+        return self._io_source
+
+    @io_source.setter
+    def io_source(self, io_source):
+        # bytes-like objects are wrapped, so that seek/tell/read keep working
+        if isinstance(io_source, (bytes, bytearray, memoryview)):
+            io_source = io.BytesIO(io_source)
+        self._io_source = io_source
+        self._buffer = self._get_buffer(io_source) if self._use_buffer else None
+        self._lookahead = []
+        self._lookahead_byte_offset = -1
+
     def next_non_comment_token(self) -> Optional[Token]:
         """
         This function retrieves the next non-comment Token.
@@ -78,6 +134,58 @@ class LowLevelTokenizer:
         This function retrieves the next Token.
         It returns None if no such Token exists (end of stream/file)
         """
+        # Token(s) that were already read ahead
+        if len(self._lookahead) > 0:
+            if self._io_source.tell() == self._lookahead_byte_offset:
+                token, byte_offset_after_token = self._lookahead.pop(0)
+                self._io_source.seek(byte_offset_after_token)
+                self._lookahead_byte_offset = byte_offset_after_token
+                return token
+            self._lookahead = []
+        return self._scan_token()
+
+    def peek_non_comment_token(self, index: int = 0) -> Optional[Token]:
+        """
+        This function returns the index-th upcoming non-comment Token, without consuming it.
+        Token(s) that are read ahead are kept, so subsequent calls to next_token do not need to scan them again.
+        It returns None if no such Token exists (end of stream/file)
+        """
+        byte_offset = self._io_source.tell()
+        if byte_offset != self._lookahead_byte_offset:
+            self._lookahead = []
+            self._lookahead_byte_offset = byte_offset
+
+        # Token(s) that were already read ahead
+        non_comment_token_index = -1
+        for token, _ in self._lookahead:
+            if token.token_type != TokenType.COMMENT:
+                non_comment_token_index += 1
+                if non_comment_token_index == index:
+                    return token
+
+        # read ahead
+        try:
+            if len(self._lookahead) > 0:
+                self._io_source.seek(self._lookahead[-1][1])
+            while True:
+                token = self._scan_token()
+                if token is None:
+                    return None
+                self._lookahead.append((token, self._io_source.tell()))
+                if token.token_type != TokenType.COMMENT:
+                    non_comment_token_index += 1
+                    if non_comment_token_index == index:
+                        return token
+        finally:
+            self._io_source.seek(byte_offset)
+
+    def _scan_token(self) -> Optional[Token]:
+        """
+        This function scans the next Token from the io source (ignoring Token(s) that were read ahead)
+        """
+        if self._buffer is not None:
+            return self._next_token_from_buffer()
+
         ch = self._next_char()
         if len(ch) == 0:
             return None
@@ -223,6 +331,89 @@ class LowLevelTokenizer:
         """
         return self.io_source.tell()
 
+    def _get_buffer(self, io_source):
+        """
+        This function returns the entire content of the io source as a bytes-like object
+        (a view on the content of a MemoryViewSource or BytesIO, or a memory map of a file, rather than a copy),
+        or None if the content can not be obtained (in which case tokenization falls back to reading
+        the io source one byte at a time)
+        """
+        if isinstance(io_source, mmap.mmap):
+            return io_source
+        if isinstance(io_source, (MemoryViewSource, io.BytesIO)):
+            return io_source.getbuffer()
+        # files are mapped (rather than read) into memory
+        try:
+            return mmap.mmap(io_source.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            pass
+        try:
+            pos = io_source.tell()
+            io_source.seek(0)
+            bts = io_source.read()
+            io_source.seek(pos)
+            return bts
+        except Exception:
+            return None
+
+    def _next_token_from_buffer(self) -> Optional[Token]:
+        """
+        This function retrieves the next Token by matching the buffered content of the io source
+        against a (precompiled) regular expression. It produces the same Token(s) as reading the io source
+        one byte at a time, but only needs to synchronize its position with the io source once per Token.
+        """
+        buf = self._buffer
+        assert buf is not None
+        n = len(buf)
+        pos = self._io_source.tell()
+        if pos >= n:
+            return None
+
+        m = _TOKEN.match(buf, pos)
+        assert m is not None
+        group = m.lastindex
+        assert group is not None
+        start = m.start(group)
+        end = m.end(group)
+
+        # trailing whitespace yields an empty NUMBER token (as it always has)
+        if start >= n:
+            self.io_source.seek(n)
+            return Token(n - 1, TokenType.NUMBER, "")
+
+        # STRING
+        if group == 9:
+            bracket_nesting_level = 1
+            while bracket_nesting_level > 0:
+                m = _STRING_SPECIAL_CHARACTER.search(buf, end)
+                if m is None:
+                    self.io_source.seek(n)
+                    raise PDFEOFError()
+                end = m.end()
+                ch = buf[m.start()]
+                if ch == 0x5C:
+                    end += 1
+                elif ch == 0x28:
+                    bracket_nesting_level += 1
+                else:
+                    bracket_nesting_level -= 1
+
+        # UNEXPECTED CHARACTER AFTER >
+        if group == 10:
+            self.io_source.seek(min(end + 1, n))
+            raise PDFSyntaxError(
+                message="invalid character, expected >, received %s"
+                % (chr(buf[end]) if end < n else ""),
+                byte_offset=self.io_source.tell(),
+            )
+
+        self._io_source.seek(end)
+        return Token(
+            start,
+            LowLevelTokenizer._TOKEN_TYPE_PER_GROUP[group],
+            str(buf[start:end], "latin-1"),
+        )
+
     def _is_delimiter(self, ch: str) -> bool:
         # fmt: off
         return ord(ch) in [ -1, 0, 9, 10, 12, 13, 32, 37, 40, 41, 47, 60, 62, 91, 93,]
@@ -232,6 +423,12 @@ class LowLevelTokenizer:
         return ord(ch) in [0, 9, 10, 12, 13, 32]
 
     def _next_char(self):
+        if self._buffer is not None:
+            pos = self.io_source.tell()
+            if pos >= len(self._buffer):
+                return ""
+            self.io_source.seek(pos + 1)
+            return chr(self._buffer[pos])
         return self.io_source.read(1).decode("latin-1")
 
     def _prev_char(self):
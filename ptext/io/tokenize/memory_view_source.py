@@ -0,0 +1,114 @@
+import io
+import mmap
+import os
+import typing
+from pathlib import Path
+from typing import Union
+
+
+class MemoryViewSource(io.RawIOBase):
+    """
+    This class offers a (read-only, seekable) io source on top of a bytes-like object,
+    such as a memory-mapped file, without copying it.
+    Tokenizer(s) read straight from its buffer, and Stream(s) read from it keep a memoryview
+    (of their bytes) into that buffer rather than a copy.
+    """
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview, mmap.mmap]):
+        super(MemoryViewSource, self).__init__()
+        self._buffer: memoryview = memoryview(buffer).cast("B")
+        self._position: int = 0
+        # the memory-mapped file (if any) opened by (and closed with) this source
+        self._mmap: typing.Optional[mmap.mmap] = None
+
+    @staticmethod
+    def open(file: Union[str, Path, int]) -> "MemoryViewSource":
+        """
+        This function memory-maps a file (given by its path or file descriptor)
+        and returns a MemoryViewSource for it
+        """
+        if isinstance(file, int):
+            m = mmap.mmap(file, 0, access=mmap.ACCESS_READ)
+        else:
+            fd = os.open(file, os.O_RDONLY)
+            try:
+                m = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            finally:
+                os.close(fd)
+        out = MemoryViewSource(m)
+        out._mmap = m
+        return out
+
+    def getbuffer(self) -> memoryview:
+        """
+        This function returns the content of this MemoryViewSource (as a memoryview)
+        """
+        return self._buffer
+
+    def get_view(self, offset: int) -> "MemoryViewSource":
+        """
+        This function returns a MemoryViewSource for the content of this MemoryViewSource,
+        starting at a given byte offset (without copying)
+        """
+        return MemoryViewSource(self._buffer[offset:])
+
+    def read_view(self, size: int = -1) -> memoryview:
+        """
+        This function reads (at most) size bytes, and returns them as a memoryview
+        (rather than a copy)
+        """
+        if size is None or size < 0:
+            size = len(self._buffer)
+        out = self._buffer[self._position : self._position + size]
+        self._position += len(out)
+        return out
+
+    def close(self) -> None:
+        """
+        This function closes this MemoryViewSource, and the memory-mapped file it opened (if any).
+        Stream(s) that still refer to the mapped bytes keep them readable,
+        the file is then unmapped once the last of them is released.
+        """
+        if not self.closed:
+            try:
+                self._buffer.release()
+                if self._mmap is not None:
+                    self._mmap.close()
+            except BufferError:
+                pass
+        super(MemoryViewSource, self).close()
+
+    def __deepcopy__(self, memodict=None):
+        # the (read-only) buffer is shared rather than copied
+        return self
+
+    #
+    # RawIOBase
+    #
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: typing.Optional[int] = -1) -> bytes:
+        return self.read_view(-1 if size is None else size).tobytes()
+
+    def readinto(self, b) -> int:
+        out = self.read_view(len(b))
+        b[0 : len(out)] = out
+        return len(out)
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = pos
+        elif whence == io.SEEK_CUR:
+            self._position += pos
+        elif whence == io.SEEK_END:
+            self._position = len(self._buffer) + pos
+        self._position = max(self._position, 0)
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
@@ -0,0 +1,236 @@
+import multiprocessing
+import multiprocessing.connection
+import os
+import sys
+import time
+import traceback
+import typing
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+try:
+    import resource
+except ImportError:  # pragma: no cover (not available on Windows)
+    resource = None  # type: ignore [assignment]
+
+
+class BatchResult:
+    """
+    This class represents the outcome of processing a single Document in a batch,
+    it holds the value returned by the processing function (if any), the time spent,
+    and whether processing failed (with an exception) or timed out.
+    """
+
+    def __init__(
+        self,
+        file: Path,
+        time_in_seconds: float,
+        result: Any = None,
+        exception: Optional[str] = None,
+        exception_traceback: Optional[str] = None,
+        timed_out: bool = False,
+    ):
+        self.file: Path = file
+        self.time_in_seconds: float = time_in_seconds
+        self.result: Any = result
+        self.exception: Optional[str] = exception
+        self.exception_traceback: Optional[str] = exception_traceback
+        self.timed_out: bool = timed_out
+
+    def passed(self) -> bool:
+        """
+        This function returns True if the Document was processed without exception (or timeout)
+        """
+        return self.exception is None and not self.timed_out
+
+    def __repr__(self):
+        return "BatchResult(file=%s, time_in_seconds=%f, passed=%s, timed_out=%s)" % (
+            self.file,
+            self.time_in_seconds,
+            self.passed(),
+            self.timed_out,
+        )
+
+
+def _get_peak_memory_usage_in_mb() -> float:
+    if resource is None:
+        return 0
+    # ru_maxrss is expressed in kilobytes on Linux (and in bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _batch_worker(
+    connection: multiprocessing.connection.Connection,
+    function: Callable[[Any], Any],
+    max_tasks: int,
+    max_memory_in_mb: float,
+) -> None:
+    # imported here, ptext.pdf.pdf imports this module
+    from ptext.pdf.pdf import PDF
+
+    number_of_tasks: int = 0
+    while True:
+        try:
+            file = connection.recv()
+        except EOFError:
+            return
+        if file is None:
+            return
+
+        # process Document
+        before = time.time()
+        try:
+            with PDF.loads(file) as doc:
+                out = BatchResult(file, 0, result=function(doc))
+        except BaseException as e:
+            out = BatchResult(
+                file,
+                0,
+                exception="%s: %s" % (e.__class__.__name__, str(e)),
+                exception_traceback=traceback.format_exc(),
+            )
+        out.time_in_seconds = time.time() - before
+
+        # recycle (this worker) after max_tasks, or when it uses too much memory
+        number_of_tasks += 1
+        retire: bool = (
+            number_of_tasks >= max_tasks
+            or _get_peak_memory_usage_in_mb() > max_memory_in_mb
+        )
+
+        # send result
+        try:
+            connection.send((out, retire))
+        except BaseException as e:
+            out.result = None
+            out.exception = "%s: %s" % (e.__class__.__name__, str(e))
+            out.exception_traceback = traceback.format_exc()
+            connection.send((out, retire))
+        if retire:
+            return
+
+
+class _Worker:
+    def __init__(
+        self,
+        function: Callable[[Any], Any],
+        max_tasks: int,
+        max_memory_in_mb: float,
+    ):
+        self.connection, worker_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_batch_worker,
+            args=(worker_connection, function, max_tasks, max_memory_in_mb),
+            daemon=True,
+        )
+        self.process.start()
+        worker_connection.close()
+        self.file: Optional[Path] = None
+        self.started_at: float = 0
+
+    def submit(self, file: Path) -> None:
+        self.file = file
+        self.started_at = time.time()
+        self.connection.send(file)
+
+    def stop(self, terminate: bool = False) -> None:
+        if terminate:
+            self.process.terminate()
+        else:
+            try:
+                self.connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        self.process.join()
+        self.connection.close()
+
+
+def process_batch(
+    files: Iterable[Union[str, Path]],
+    function: Callable[[Any], Any],
+    max_workers: Optional[int] = None,
+    timeout_in_seconds: float = 30,
+    max_tasks_per_worker: int = 100,
+    max_memory_per_worker_in_mb: float = 1024,
+) -> Iterator[BatchResult]:
+    """
+    This function reads each Document (given by its path) in a pool of worker processes,
+    calls function on it (in the worker process) and yields a BatchResult for each Document,
+    in the order in which they complete.
+    A worker is replaced after it has processed max_tasks_per_worker Document(s),
+    when its (peak) memory usage exceeds max_memory_per_worker_in_mb,
+    or when it has spent more than timeout_in_seconds on a single Document.
+    Files are only taken from files when a worker is available, so files may be a (lazy) iterator.
+    function (and its return value) must be picklable.
+    """
+    assert max_tasks_per_worker > 0
+    assert timeout_in_seconds > 0
+    max_workers = max_workers or os.cpu_count() or 1
+
+    def new_worker() -> _Worker:
+        return _Worker(function, max_tasks_per_worker, max_memory_per_worker_in_mb)
+
+    files_iterator = iter(files)
+    idle_workers: typing.List[_Worker] = []
+    busy_workers: typing.List[_Worker] = []
+    try:
+        while True:
+
+            # hand out files to idle workers
+            while len(busy_workers) < max_workers:
+                file = next(files_iterator, None)
+                if file is None:
+                    break
+                w = idle_workers.pop() if len(idle_workers) > 0 else new_worker()
+                w.submit(Path(file))
+                busy_workers.append(w)
+
+            # done
+            if len(busy_workers) == 0:
+                return
+
+            # wait for (at least) one result, or the first timeout
+            now = time.time()
+            first_deadline = min(
+                [w.started_at + timeout_in_seconds for w in busy_workers]
+            )
+            ready = multiprocessing.connection.wait(
+                [w.connection for w in busy_workers],
+                timeout=max(first_deadline - now, 0),
+            )
+
+            # collect results
+            now = time.time()
+            for w in list(busy_workers):
+                if w.connection in ready:
+                    busy_workers.remove(w)
+                    try:
+                        out, retire = w.connection.recv()
+                    except (EOFError, OSError):
+                        # worker died (e.g. killed by the OS)
+                        out = BatchResult(
+                            w.file,  # type: ignore [arg-type]
+                            now - w.started_at,
+                            exception="worker exited with code %s"
+                            % str(w.process.exitcode),
+                        )
+                        retire = True
+                    if retire:
+                        w.stop()
+                    else:
+                        idle_workers.append(w)
+                    yield out
+                elif now - w.started_at >= timeout_in_seconds:
+                    busy_workers.remove(w)
+                    w.stop(terminate=True)
+                    yield BatchResult(
+                        w.file,  # type: ignore [arg-type]
+                        now - w.started_at,
+                        timed_out=True,
+                    )
+    finally:
+        for w in idle_workers:
+            w.stop()
+        for w in busy_workers:
+            w.stop(terminate=True)
@@ -4,12 +4,17 @@ import os
 import typing
 
 from ptext.io.read_transform.types import (
+    AnyPDFType,
     Dictionary,
     List,
     CanvasOperatorName,
 )
 from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
 from ptext.pdf.canvas.canvas_graphics_state import CanvasGraphicsState
+from ptext.pdf.canvas.canvas_instruction_list import (
+    CanvasInstructionList,
+    InstructionRecordingMode,
+)
 from ptext.pdf.canvas.operator.color.set_cmyk_non_stroking import SetCMYKNonStroking
 from ptext.pdf.canvas.operator.color.set_cmyk_stroking import SetCMYKStroking
 from ptext.pdf.canvas.operator.color.set_color_non_stroking import (
@@ -90,8 +95,13 @@ logger = logging.getLogger(__name__)
 
 
 class Canvas(Dictionary):
-    def __init__(self):
+    def __init__(
+        self,
+        instruction_recording_mode: InstructionRecordingMode = InstructionRecordingMode.DICTIONARY,
+    ):
         super(Canvas, self).__init__()
+        # determines how processed instructions are kept (in self["Instructions"])
+        self.instruction_recording_mode = instruction_recording_mode
         # initialize operators
         self.canvas_operators = {
             x.get_text(): x
@@ -163,11 +173,52 @@ class Canvas(Dictionary):
         """
         This method adds a generic EventListener to this Canvas
         """
-        self._event_listeners.append(event_listener)  # type: ignore [attr-defined]
+        self.add_event_listener(event_listener)  # type: ignore [attr-defined]
         return self
 
+    def has_event_listeners_for(self, event_type: type) -> bool:
+        """
+        This method returns True if any EventListener (of this Canvas) consumes Event(s) of a given type,
+        Event(s) of other types need not be built.
+        """
+        for l in self.get_event_listeners():  # type: ignore [attr-defined]
+            supported_event_types = l.get_supported_event_types()
+            if supported_event_types is None or any(
+                [issubclass(event_type, t) for t in supported_event_types]
+            ):
+                return True
+        return False
+
+    def _record_instruction(self, name: str, operands: typing.List[AnyPDFType]):
+        if self.instruction_recording_mode == InstructionRecordingMode.NONE:
+            return
+
+        # compact
+        if self.instruction_recording_mode == InstructionRecordingMode.COMPACT:
+            if "Instructions" not in self:
+                self["Instructions"] = CanvasInstructionList()
+            self["Instructions"].append(name, operands)
+            return
+
+        # dictionary
+        if "Instructions" not in self:
+            self["Instructions"] = List().set_parent(self)  # type: ignore [attr-defined]
+        instruction_dictionary = Dictionary()
+        instruction_dictionary["Name"] = name
+        instruction_dictionary["Args"] = List().set_parent(  # type: ignore [attr-defined]
+            instruction_dictionary
+        )
+        for x in operands:
+            instruction_dictionary["Args"].append(x)
+        self["Instructions"].append(instruction_dictionary)
+
     def read(self, io_source: io.IOBase) -> "Canvas":
 
+        # io sources that can not seek (such as a DecodedStreamReader) are read up front,
+        # the tokenizer needs random access to the content
+        if not io_source.seekable():
+            io_source = io.BytesIO(io_source.read())
+
         io_source.seek(0, os.SEEK_END)
         length = io_source.tell()
         io_source.seek(0)
@@ -176,6 +227,7 @@ class Canvas(Dictionary):
 
         # process content
         operand_stk = []
+        instruction_number = 0
         while canvas_tokenizer.tell() != length:
 
             # print("<canvas pos='%d' length='%d' percentage='%d'/>" % ( canvas_tokenizer.tell(), length, int(canvas_tokenizer.tell() * 100 / length)))
@@ -203,30 +255,19 @@ class Canvas(Dictionary):
                 operands.insert(0, operand_stk.pop(-1))
 
             # append
-            if "Instructions" not in self:
-                self["Instructions"] = List().set_parent(self)  # type: ignore [attr-defined]
-
-            instruction_number = len(self["Instructions"])
-            instruction_dictionary = Dictionary()
-            instruction_dictionary["Name"] = operator.get_text()
-            instruction_dictionary["Args"] = List().set_parent(  # type: ignore [attr-defined]
-                instruction_dictionary
-            )
-
-            if len(operands) > 0:
-                for i in range(0, len(operands)):
-                    instruction_dictionary["Args"].append(operands[i])
-            self["Instructions"].append(instruction_dictionary)
+            self._record_instruction(operator.get_text(), operands)
 
             # debug
-            logger.debug(
-                "%d %s %s"
-                % (
-                    instruction_number,
-                    operator.text,
-                    str([str(x) for x in operands]),
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "%d %s %s"
+                    % (
+                        instruction_number,
+                        operator.text,
+                        str([str(x) for x in operands]),
+                    )
                 )
-            )
+            instruction_number += 1
 
             # invoke
             try:
@@ -3,7 +3,7 @@ import typing
 from decimal import Decimal
 
 from ptext.pdf.canvas.color.color import RGBColor
-from ptext.pdf.canvas.geometry.matrix import Matrix
+from ptext.pdf.canvas.geometry.affine_transform import AffineTransform
 
 
 class CanvasGraphicsState:
@@ -24,9 +24,9 @@ class CanvasGraphicsState:
     """
 
     def __init__(self):
-        self.ctm = Matrix.identity_matrix()
-        self.text_matrix = Matrix.identity_matrix()
-        self.text_line_matrix = Matrix.identity_matrix()
+        self.ctm = AffineTransform.identity_matrix()
+        self.text_matrix = AffineTransform.identity_matrix()
+        self.text_line_matrix = AffineTransform.identity_matrix()
         self.text_rise = Decimal(0)
         self.character_spacing = Decimal(0)
         self.word_spacing = Decimal(0)
@@ -52,6 +52,29 @@ class CanvasGraphicsState:
         self.alpha_constant = None
         self.alpha_source = None
 
+    def __copy__(self):
+        """
+        This function returns a copy of this CanvasGraphicsState (as saved by the q operator),
+        it holds the same parameters as a deep copy would, but shares (rather than copies) its font and colors.
+        Only the transformation matrices are copied, since operators update those in place.
+        """
+        out = CanvasGraphicsState()
+        out.ctm = copy.deepcopy(self.ctm)
+        out.text_matrix = copy.deepcopy(self.text_matrix)
+        out.text_line_matrix = copy.deepcopy(self.text_line_matrix)
+        out.text_rise = self.text_rise
+        out.character_spacing = self.character_spacing
+        out.word_spacing = self.word_spacing
+        out.horizontal_scaling = self.horizontal_scaling
+        out.leading = self.leading
+        out.font = self.font
+        out.font_size = self.font_size
+        out.non_stroke_color = self.non_stroke_color
+        out.stroke_color = self.stroke_color
+        out.line_width = self.line_width
+        out.miter_limit = self.miter_limit
+        return out
+
     def __deepcopy__(self, memodict={}):
         out = CanvasGraphicsState()
         out.ctm = copy.deepcopy(self.ctm)
@@ -0,0 +1,88 @@
+import array
+import enum
+import typing
+
+from ptext.io.read_transform.types import AnyPDFType, Dictionary, List
+
+
+class InstructionRecordingMode(enum.Enum):
+    """
+    This enum determines how a Canvas records the instructions it has processed (in Canvas["Instructions"]):
+    - NONE: instructions are not recorded
+    - COMPACT: instructions are recorded in a CanvasInstructionList
+    - DICTIONARY: instructions are recorded as a List of Dictionary objects (with a Name and Args entry)
+    """
+
+    NONE = 0
+    COMPACT = 1
+    DICTIONARY = 2
+
+
+class CanvasInstructionList:
+    """
+    This class stores the instructions processed by a Canvas in a compact form,
+    as an array of opcodes (one for each instruction) and a flat list of operands.
+    The operands of instruction i are found in between offsets i and i + 1.
+    Iterating over a CanvasInstructionList (or indexing it) yields the same Dictionary objects
+    (with a Name and Args entry) a Canvas records in InstructionRecordingMode.DICTIONARY,
+    these are built on demand.
+    """
+
+    # opcodes are shared among all CanvasInstructionList objects
+    _opcode_names: typing.List[str] = []
+    _opcode_by_name: typing.Dict[str, int] = {}
+
+    def __init__(self):
+        self._opcodes: array.array = array.array("H")
+        self._offsets: array.array = array.array("L", [0])
+        self._operands: typing.List[AnyPDFType] = []
+
+    @staticmethod
+    def _get_opcode(name: str) -> int:
+        opcode = CanvasInstructionList._opcode_by_name.get(name, None)
+        if opcode is None:
+            opcode = len(CanvasInstructionList._opcode_names)
+            CanvasInstructionList._opcode_names.append(name)
+            CanvasInstructionList._opcode_by_name[name] = opcode
+        return opcode
+
+    def append(self, name: str, operands: typing.List[AnyPDFType]) -> None:
+        """
+        This function appends an instruction (given by its name and operands)
+        """
+        self._opcodes.append(CanvasInstructionList._get_opcode(name))
+        self._operands.extend(operands)
+        self._offsets.append(len(self._operands))
+
+    def get_name(self, index: int) -> str:
+        """
+        This function returns the name of the instruction at a given index
+        """
+        return CanvasInstructionList._opcode_names[self._opcodes[index]]
+
+    def get_operands(self, index: int) -> typing.List[AnyPDFType]:
+        """
+        This function returns the operands of the instruction at a given index
+        """
+        if index < 0:
+            index += len(self)
+        return self._operands[self._offsets[index] : self._offsets[index + 1]]
+
+    def __len__(self) -> int:
+        return len(self._opcodes)
+
+    def __getitem__(self, index: int) -> Dictionary:
+        if index < -len(self) or index >= len(self):
+            raise IndexError("instruction index out of range")
+        instruction_dictionary = Dictionary()
+        instruction_dictionary["Name"] = self.get_name(index)
+        instruction_dictionary["Args"] = List().set_parent(  # type: ignore [attr-defined]
+            instruction_dictionary
+        )
+        for x in self.get_operands(index):
+            instruction_dictionary["Args"].append(x)
+        return instruction_dictionary
+
+    def __iter__(self) -> typing.Iterator[Dictionary]:
+        for i in range(0, len(self)):
+            yield self[i]
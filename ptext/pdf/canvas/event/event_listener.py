@@ -1,3 +1,6 @@
+import typing
+
+
 class Event:
     pass
 
@@ -10,3 +13,11 @@ class EventListener:
 
     def event_occurred(self, event: Event) -> None:
         pass
+
+    def get_supported_event_types(self) -> typing.Optional[typing.List[type]]:
+        """
+        This function returns the types of Event this EventListener consumes,
+        or None if it consumes every type of Event.
+        The Canvas does not build Event(s) no EventListener consumes.
+        """
+        return None
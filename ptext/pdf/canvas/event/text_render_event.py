@@ -1,6 +1,7 @@
 import copy
 import typing
 from decimal import Decimal
+from math import hypot
 
 from ptext.io.read_transform.types import String
 from ptext.pdf.canvas.canvas_graphics_state import CanvasGraphicsState
@@ -51,8 +52,8 @@ class TextRenderEvent(Event):
 
     def split_on_glyphs(self) -> typing.List["TextRenderEvent"]:
         split_events = []
-        y: Decimal = self.graphics_state.text_rise
-        prev_x: Decimal = Decimal(0)
+        y: float = float(self.graphics_state.text_rise)
+        prev_x: float = 0.0
         for g in self.glyph_line.glyphs:
             e = TextRenderEvent(self.graphics_state, String(" "))
             e.glyph_line = GlyphLine([g])
@@ -67,12 +68,12 @@ class TextRenderEvent(Event):
 
             # calculate end of LineSegment
             w = (
-                Decimal(g.width)
-                * Decimal(self.graphics_state.font_size)
-                * Decimal(0.001)
-                * Decimal(self.graphics_state.horizontal_scaling / 100)
-                + (self.graphics_state.word_spacing if g == " " else Decimal(0))
-                + self.graphics_state.character_spacing
+                float(g.width)
+                * float(self.graphics_state.font_size)
+                * 0.001
+                * float(self.graphics_state.horizontal_scaling / 100)
+                + (float(self.graphics_state.word_spacing) if g == " " else 0.0)
+                + float(self.graphics_state.character_spacing)
             )
 
             # set LineSegment
@@ -107,9 +108,9 @@ class TextRenderEvent(Event):
     def _get_baseline(self, graphics_state: CanvasGraphicsState) -> LineSegment:
         # build and transform line segment
         return LineSegment(
-            Decimal(0),
+            0.0,
             graphics_state.text_rise,
-            self._get_pdf_string_width_in_text_space(graphics_state) or Decimal(0),
+            self._get_pdf_string_width_in_text_space(graphics_state),
             graphics_state.text_rise,
         ).transform_by(self.text_to_user_space_transform_matrix)
 
@@ -119,33 +120,59 @@ class TextRenderEvent(Event):
     def get_space_character_width_in_text_space(self):
         return self.space_character_width
 
+    @staticmethod
+    def get_baseline_length(
+        graphics_state: CanvasGraphicsState, raw_bytes: String
+    ) -> float:
+        """
+        Get the length of the baseline of a String (as it would be set by TextRenderEvent),
+        without building a TextRenderEvent. The length is computed (and returned) as a float.
+        """
+        width = TextRenderEvent._get_glyph_line_width_in_text_space(
+            graphics_state.font.build_glyph_line(raw_bytes), graphics_state
+        )
+        text_to_user_space = graphics_state.text_matrix.mul(graphics_state.ctm)
+        x0, y0 = text_to_user_space.apply(0.0, graphics_state.text_rise)
+        x1, y1 = text_to_user_space.apply(width, graphics_state.text_rise)
+        return hypot(x0 - x1, y0 - y1)
+
     def _get_pdf_string_width_in_text_space(
         self, graphics_state: CanvasGraphicsState
-    ) -> Decimal:
+    ) -> float:
         """
         Get the width of a String in text space units
         """
-        total_width = Decimal(0)
-        for g in self.glyph_line:
-            character_width = (
-                Decimal(g.width) * Decimal(graphics_state.font_size) * Decimal(0.001)
-            )
+        return TextRenderEvent._get_glyph_line_width_in_text_space(
+            self.glyph_line, graphics_state
+        )
+
+    @staticmethod
+    def _get_glyph_line_width_in_text_space(
+        glyph_line: GlyphLine, graphics_state: CanvasGraphicsState
+    ) -> float:
+        font_size: float = float(graphics_state.font_size)
+        word_spacing: float = float(graphics_state.word_spacing)
+        horizontal_scaling: float = float(graphics_state.horizontal_scaling) / 100
+        character_spacing: float = float(graphics_state.character_spacing)
+        total_width: float = 0.0
+        for g in glyph_line:
+            character_width = float(g.width) * font_size * 0.001
 
             # add word spacing where applicable
             if g.unicode == " ":
-                character_width += Decimal(graphics_state.word_spacing)
+                character_width += word_spacing
 
             # horizontal scaling
-            character_width *= Decimal(graphics_state.horizontal_scaling / 100)
+            character_width *= horizontal_scaling
 
             # add character spacing to character_width
-            character_width += graphics_state.character_spacing
+            character_width += character_spacing
 
             # add character width to total
             total_width += character_width
 
         # subtract character spacing once (there are only N-1 spacings in a string of N characters)
-        total_width -= Decimal(graphics_state.character_spacing)
+        total_width -= character_spacing
 
         # return
         return total_width
@@ -19,27 +19,43 @@ class AdobeFontMetrics:
     contains the master design of a specific font, which defines the way each character of the font looks.
     """
 
+    # afm file name -> Font
     _font_cache: typing.Dict[str, Optional[Font]] = {}
 
+    # canonical name -> afm file name (built once)
+    _afm_file_name_by_canonical_name: Optional[typing.Dict[str, str]] = None
+
+    # name -> Font (as given to get)
+    # only names of available fonts are kept, misses are not memoized
+    # names are kept as (plain) str, a Name would keep the Document it was read from
+    _font_by_name: typing.Dict[str, Font] = {}
+
     @staticmethod
     def get(name: str) -> Optional[Font]:
         """
         Get the Font (only the metrics will be filled in) with a given name
         """
-        # standardize names
-        canonical_name = re.sub("[^A-Z]+", "", name.upper())
+        name = str(name)
+        font: Optional[Font] = AdobeFontMetrics._font_by_name.get(name, None)
+        if font is not None:
+            return font
 
-        # find all available afm files
+        # find all available afm files (once)
         parent_dir = pathlib.Path(__file__).parent
-        available_font_metrics = [
-            (re.sub("[^A-Z]+", "", x.upper()[:-4]), x)
-            for x in os.listdir(parent_dir)
-            if x.endswith(".afm")
-        ]
+        if AdobeFontMetrics._afm_file_name_by_canonical_name is None:
+            AdobeFontMetrics._afm_file_name_by_canonical_name = {
+                re.sub("[^A-Z]+", "", x.upper()[:-4]): x
+                for x in os.listdir(parent_dir)
+                if x.endswith(".afm")
+            }
+
+        # standardize names
+        canonical_name = re.sub("[^A-Z]+", "", name.upper())
 
         # check whether given name is present
-        afm_file_name = [x for x in available_font_metrics if x[0] == canonical_name]
-        afm_file_name = None if len(afm_file_name) == 0 else afm_file_name[0][1]
+        afm_file_name = AdobeFontMetrics._afm_file_name_by_canonical_name.get(
+            canonical_name, None
+        )
         if afm_file_name is None:
             return None
 
@@ -51,11 +67,10 @@ class AdobeFontMetrics:
                 ] = AdobeFontMetrics._read_file(afm_file_handle)
 
         # read cache
-        if afm_file_name in AdobeFontMetrics._font_cache:
-            return AdobeFontMetrics._font_cache[afm_file_name]
-
-        # default
-        return None
+        font = AdobeFontMetrics._font_cache[afm_file_name]
+        if font is not None:
+            AdobeFontMetrics._font_by_name[name] = font
+        return font
 
     @staticmethod
     def _read_file(input: io.BufferedIOBase) -> Optional[Font]:
@@ -69,7 +84,8 @@ class AdobeFontMetrics:
         ):
             return None
 
-        out_font = Font()
+        # this Font is shared (by every Document), it does not belong to any of them
+        out_font = Font().set_parent(None)  # type: ignore [attr-defined]
 
         # FontDescriptor
         out_font_descriptor = FontDescriptor().set_parent(out_font)  # type: ignore [attr-defined]
@@ -130,7 +146,8 @@ class AdobeFontMetrics:
         out_font["Name"] = out_font_descriptor["FontName"]
         out_font["BaseFont"] = out_font_descriptor["FontName"]
 
-        widths = List().set_parent(out_font)  # type: ignore [attr-defined]
+        widths_by_character_code: typing.Dict[int, Decimal] = {}
+        max_char_width: Optional[Decimal] = None
         avg_char_width: float = 0
         avg_char_width_norm: float = 0
         first_char = None
@@ -167,11 +184,19 @@ class AdobeFontMetrics:
                 avg_char_width += w
                 avg_char_width_norm += 1
 
-            widths.append(Decimal(w))
+            if ch != -1:
+                widths_by_character_code[ch] = Decimal(w)
+            if max_char_width is None or Decimal(w) > max_char_width:
+                max_char_width = Decimal(w)
 
         assert first_char is not None
         assert last_char is not None
 
+        # Widths is indexed by (character code - FirstChar)
+        widths = List().set_parent(out_font)  # type: ignore [attr-defined]
+        for ch in range(first_char, last_char + 1):
+            widths.append(widths_by_character_code.get(ch, Decimal(0)))
+
         out_font["FirstChar"] = Decimal(first_char)
         out_font["LastChar"] = Decimal(last_char)
         out_font["Widths"] = widths
@@ -181,7 +206,7 @@ class AdobeFontMetrics:
                 Decimal(avg_char_width / avg_char_width_norm), 2
             )
         if out_font_descriptor["MaxWidth"] is None:
-            out_font_descriptor["MaxWidth"] = max(widths)
+            out_font_descriptor["MaxWidth"] = max_char_width
         out_font["FontDescriptor"] = out_font_descriptor
 
         # return
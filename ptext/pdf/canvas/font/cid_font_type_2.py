@@ -1,7 +1,8 @@
 import copy
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, Optional, Union
 
+from ptext.io.content_hash_cache import ContentHashCache
 from ptext.pdf.canvas.font.glyph_line import GlyphLine
 from ptext.pdf.canvas.font.true_type_font import TrueTypeFont
 
@@ -30,28 +31,49 @@ class CIDFontType2(TrueTypeFont):
                 self["DW"] = Decimal(1000)
             return self["DW"]
         if self._cached_widths is None:
-            i = 0
-            self._cached_widths = {}
-            while i < len(self["W"]):
-                c_first = int(self["W"][i])
-                if isinstance(self["W"][i + 1], list):
-                    for j in range(0, len(self["W"][i + 1])):
-                        self._cached_widths[c_first + j] = self["W"][i + 1][j]
-                    i += 2
-                    continue
-                if isinstance(self["W"][i + 1], Decimal):
-                    c_last = int(self["W"][i + 1])
-                    w = int(self["W"][i + 2])
-                    for j in range(c_first, c_last + 1):
-                        self._cached_widths[j] = w
-                    i += 3
-                    continue
+            self._cached_widths = self._get_width_table()
         # use cache
         if character_code in self._cached_widths:
             return self._cached_widths[character_code]
         # default
         return None
 
+    def _get_width_table(self) -> Dict[int, Union[int, Decimal]]:
+        # the same (embedded) font, and its W array, is often found in many documents
+        cache: Optional[ContentHashCache] = ContentHashCache.get_process_cache()
+        key = None
+        if cache is not None:
+            key = ContentHashCache.get_object_key("Widths", self["W"])
+            if key is not None:
+                widths = cache.get(key)
+                if widths is not None:
+                    return widths
+
+        # build
+        # widths are kept as (plain) Decimal objects, rather than the objects in W
+        # (which refer to their parent, and thus to the Document)
+        i = 0
+        widths = {}
+        while i < len(self["W"]):
+            c_first = int(self["W"][i])
+            if isinstance(self["W"][i + 1], list):
+                for j in range(0, len(self["W"][i + 1])):
+                    widths[c_first + j] = Decimal(self["W"][i + 1][j])
+                i += 2
+                continue
+            if isinstance(self["W"][i + 1], Decimal):
+                c_last = int(self["W"][i + 1])
+                w = int(self["W"][i + 2])
+                for j in range(c_first, c_last + 1):
+                    widths[j] = w
+                i += 3
+                continue
+
+        # store
+        if cache is not None and key is not None:
+            cache.put(key, widths, 64 * len(widths))
+        return widths
+
     def build_glyph_line(self, content) -> GlyphLine:
 
         # init Encoding
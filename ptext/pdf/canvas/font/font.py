@@ -1,8 +1,11 @@
 import logging
+import typing
+from collections import OrderedDict
 from decimal import Decimal
 from typing import Optional
 
-from ptext.io.read_transform.types import Dictionary, HexadecimalString
+from ptext.io.content_hash_cache import ContentHashCache
+from ptext.io.read_transform.types import Dictionary, HexadecimalString, Stream
 from ptext.pdf.canvas.font.cmap.cmap import CMap
 from ptext.pdf.canvas.font.glyph_line import GlyphLine, Glyph
 from ptext.pdf.canvas.font.latin_text_encoding import (
@@ -28,10 +31,19 @@ class Font(Dictionary):
     glyphs; however, a CIDFont shall not be used directly but only as a component of a Type 0 font.
     """
 
+    # number of GlyphLine objects (per Font) that are cached
+    MAX_NUMBER_OF_CACHED_GLYPH_LINES: int = 512
+
     def __init__(self):
         super(Font, self).__init__()
         self._font_encoding = None
         self._to_unicode_map = None
+        # (kind, character code) -> Glyph
+        self._glyph_table: typing.Dict[typing.Tuple[int, int], Optional[Glyph]] = {}
+        # (is hexadecimal, bytes) -> Glyph(s)
+        self._glyph_line_cache: typing.OrderedDict[
+            typing.Tuple[bool, bytes], typing.List[Glyph]
+        ] = OrderedDict()
 
     def get_average_character_width(self) -> Optional[Decimal]:
         """
@@ -170,53 +182,75 @@ class Font(Dictionary):
             self._init_font_encoding()
         if self._to_unicode_map is None:
             self._init_to_unicode_map()
+
+        # the same String is often shown many times (e.g. headers, footers, labels)
+        is_hexadecimal: bool = isinstance(content, HexadecimalString)
+        key = (is_hexadecimal, bytes(content.get_value_bytes()))
+        glyphs = self._glyph_line_cache.get(key, None)
+        if glyphs is not None:
+            self._glyph_line_cache.move_to_end(key)
+            return GlyphLine(list(glyphs))
+
+        # decode
+        glyphs = self._build_glyphs(key[1], is_hexadecimal)
+        self._glyph_line_cache[key] = glyphs
+        if len(self._glyph_line_cache) > Font.MAX_NUMBER_OF_CACHED_GLYPH_LINES:
+            self._glyph_line_cache.popitem(last=False)
+        return GlyphLine(list(glyphs))
+
+    def _build_glyphs(
+        self, value_bytes: bytes, is_hexadecimal: bool
+    ) -> typing.List[Glyph]:
         glyphs = []
         i = 0
-        value_bytes = content.get_value_bytes()
         while i < len(value_bytes):
             # attempt to use ToUnicode CMAP (2 bytes)
-            if i + 1 < len(value_bytes) and isinstance(content, HexadecimalString):
-                code = value_bytes[i] * 256 + value_bytes[i + 1]
-                if (
-                    self._to_unicode_map is not None
-                    and self._to_unicode_map.code_to_unicode(code) is not None
-                    and self._to_unicode_map.code_to_unicode(code) != 0
-                ):
-                    unicode = self._to_unicode_map.code_to_unicode(code)
-                    glyphs.append(
-                        Glyph(code, unicode, self.get_single_character_width(code))
-                    )
+            if i + 1 < len(value_bytes) and is_hexadecimal:
+                g = self._get_glyph(2, value_bytes[i] * 256 + value_bytes[i + 1])
+                if g is not None:
+                    glyphs.append(g)
                     i += 2
                     continue
             # attempt to use ToUnicode CMAP (1 byte)
-            code = value_bytes[i]
-            if (
-                isinstance(content, HexadecimalString)
-                and self._to_unicode_map is not None
-                and self._to_unicode_map.code_to_unicode(code) is not None
-                and self._to_unicode_map.code_to_unicode(code) != 0
-            ):
-                unicode = self._to_unicode_map.code_to_unicode(code)
-                glyphs.append(
-                    Glyph(code, unicode, self.get_single_character_width(code))
-                )
-                i += 1
-                continue
+            if is_hexadecimal:
+                g = self._get_glyph(1, value_bytes[i])
+                if g is not None:
+                    glyphs.append(g)
+                    i += 1
+                    continue
             # attempt to use encoding
-            if (
-                self._font_encoding is not None
-                and self._font_encoding.can_encode_character_code(code)
-            ):
-                unicode = self._font_encoding.code_to_unicode(code)
-                glyphs.append(
-                    Glyph(code, unicode, self.get_single_character_width(code))
-                )
-                i += 1
-                continue
+            g = self._get_glyph(0, value_bytes[i])
+            if g is not None:
+                glyphs.append(g)
             # default I guess ?
             i += 1
         # return
-        return GlyphLine(glyphs)
+        return glyphs
+
+    def _get_glyph(self, kind: int, code: int) -> Optional[Glyph]:
+        """
+        This function returns the Glyph for a character code,
+        (kind 2 and 1) using the ToUnicode CMAP for 2 or 1 byte codes, or (kind 0) using the encoding.
+        It returns None if the character code can not be decoded that way.
+        Glyph(s) are built once, and kept in a table (per Font).
+        """
+        key = (kind, code)
+        if key in self._glyph_table:
+            return self._glyph_table[key]
+        g: Optional[Glyph] = None
+        if kind > 0 and self._to_unicode_map is not None:
+            unicode = self._to_unicode_map.code_to_unicode(code)
+            if unicode is not None and unicode != 0:
+                g = Glyph(code, unicode, self.get_single_character_width(code))
+        if (
+            kind == 0
+            and self._font_encoding is not None
+            and self._font_encoding.can_encode_character_code(code)
+        ):
+            unicode = self._font_encoding.code_to_unicode(code)
+            g = Glyph(code, unicode, self.get_single_character_width(code))
+        self._glyph_table[key] = g
+        return g
 
     def can_encode_unicode(self, unicode_code: int) -> bool:
         if self._to_unicode_map is not None:
@@ -304,6 +338,18 @@ class Font(Dictionary):
     def _init_to_unicode_map(self):
         if "ToUnicode" not in self:
             return
-        self._to_unicode_map = CMap().read(
-            self["ToUnicode"]["DecodedBytes"].decode("latin1")
-        )
+
+        # the same ToUnicode CMAP is often embedded in many documents
+        cache: Optional[ContentHashCache] = ContentHashCache.get_process_cache()
+        key = None
+        if cache is not None and isinstance(self["ToUnicode"], Stream):
+            key = ContentHashCache.get_stream_key("CMap", self["ToUnicode"])
+            if key is not None:
+                self._to_unicode_map = cache.get(key)
+                if self._to_unicode_map is not None:
+                    return
+
+        cmap_bytes: bytes = self["ToUnicode"]["DecodedBytes"]
+        self._to_unicode_map = CMap().read(cmap_bytes.decode("latin1"))
+        if cache is not None and key is not None:
+            cache.put(key, self._to_unicode_map, len(cmap_bytes))
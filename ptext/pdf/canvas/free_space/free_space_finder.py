@@ -1,9 +1,10 @@
 import copy
-import io
 import typing
 
+from ptext.io.filter.stream_decode_util import open_decoded_stream
 from ptext.io.read_transform.types import Decimal
 from ptext.pdf.canvas.canvas import Canvas
+from ptext.pdf.canvas.canvas_instruction_list import InstructionRecordingMode
 from ptext.pdf.canvas.event.event_listener import EventListener, Event
 from ptext.pdf.canvas.event.text_render_event import TextRenderEvent
 from ptext.pdf.canvas.geometry.rectangle import Rectangle
@@ -14,7 +15,10 @@ class FreeSpaceFinder(EventListener):
     def __init__(self, page: Page):
         self.page = copy.deepcopy(page)
         self.grid_resolution = 10
-        self.mock_canvas = Canvas().set_parent(self.page)  # type: ignore [attr-defined]
+        self.mock_canvas = Canvas(
+            instruction_recording_mode=InstructionRecordingMode.NONE
+        )
+        self.mock_canvas.set_parent(self.page)  # type: ignore [attr-defined]
         self.grid: typing.List[typing.List[bool]] = [[]]
         self._draw_text_and_objects()
 
@@ -44,11 +48,8 @@ class FreeSpaceFinder(EventListener):
 
         # process canvas
         contents = self.page["Contents"]
-        if isinstance(contents, dict):
-            self.mock_canvas.read(io.BytesIO(contents["DecodedBytes"]))
-        if isinstance(contents, list):
-            bts = b"".join([x["DecodedBytes"] + b" " for x in contents])
-            self.mock_canvas.read(io.BytesIO(bts))
+        if isinstance(contents, (dict, list)):
+            self.mock_canvas.read(open_decoded_stream(contents))
 
     def find_free_space(self, needed_space: Rectangle) -> typing.Optional[Rectangle]:
         w = int(int(needed_space.width) / self.grid_resolution)
@@ -0,0 +1,136 @@
+import typing
+from decimal import Decimal
+from typing import List, Tuple
+
+from ptext.pdf.canvas.geometry.matrix import Matrix
+
+
+class AffineTransform:
+    """
+    This class represents an affine transformation, the matrix [[a, b, 0], [c, d, 0], [e, f, 1]],
+    as six floats. The Canvas uses it for its transformation matrices (the CTM, text matrix and text line matrix),
+    multiplying and applying these in closed form, rather than using a (Decimal) Matrix.
+
+    Decimal values are converted to float when an AffineTransform is built (and back when a Matrix is built from it).
+    Results computed with an AffineTransform are within 1e-6 (user space units)
+    of those computed using a Matrix, for coordinates smaller than 1e6.
+    """
+
+    __slots__ = ["a", "b", "c", "d", "e", "f"]
+
+    def __init__(
+        self,
+        a: typing.Union[float, Decimal] = 1.0,
+        b: typing.Union[float, Decimal] = 0.0,
+        c: typing.Union[float, Decimal] = 0.0,
+        d: typing.Union[float, Decimal] = 1.0,
+        e: typing.Union[float, Decimal] = 0.0,
+        f: typing.Union[float, Decimal] = 0.0,
+    ):
+        self.a: float = float(a)
+        self.b: float = float(b)
+        self.c: float = float(c)
+        self.d: float = float(d)
+        self.e: float = float(e)
+        self.f: float = float(f)
+
+    @staticmethod
+    def identity_matrix() -> "AffineTransform":
+        """
+        This function returns the identity transformation
+        """
+        return AffineTransform()
+
+    @staticmethod
+    def matrix_from_six_values(
+        a: Decimal, b: Decimal, c: Decimal, d: Decimal, e: Decimal, f: Decimal
+    ) -> "AffineTransform":
+        """
+        This function returns the transformation [[a, b, 0], [c, d, 0], [e, f, 1]]
+        """
+        return AffineTransform(a, b, c, d, e, f)
+
+    @staticmethod
+    def from_matrix(m: Matrix) -> "AffineTransform":
+        """
+        This function returns the AffineTransform for a given Matrix,
+        ignoring its third column (which is [0, 0, 1] for an affine transformation)
+        """
+        return AffineTransform(m[0][0], m[0][1], m[1][0], m[1][1], m[2][0], m[2][1])
+
+    def to_matrix(self) -> Matrix:
+        """
+        This function returns this AffineTransform as a (Decimal) Matrix
+        """
+        return Matrix.matrix_from_six_values(
+            Decimal(self.a),
+            Decimal(self.b),
+            Decimal(self.c),
+            Decimal(self.d),
+            Decimal(self.e),
+            Decimal(self.f),
+        )
+
+    def mul(self, y: "AffineTransform") -> "AffineTransform":
+        """
+        This function returns the product of this AffineTransform and another
+        (the transformation that applies this AffineTransform first, and y second)
+        """
+        return AffineTransform(
+            self.a * y.a + self.b * y.c,
+            self.a * y.b + self.b * y.d,
+            self.c * y.a + self.d * y.c,
+            self.c * y.b + self.d * y.d,
+            self.e * y.a + self.f * y.c + y.e,
+            self.e * y.b + self.f * y.d + y.f,
+        )
+
+    def apply(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        This function transforms the point (x, y)
+        """
+        x = float(x)
+        y = float(y)
+        return (
+            x * self.a + y * self.c + self.e,
+            x * self.b + y * self.d + self.f,
+        )
+
+    def cross(self, x: float, y: float, z: float) -> Tuple[float, float, float]:
+        """
+        This function returns the product of the (row) vector [x, y, z] and this AffineTransform
+        """
+        x = float(x)
+        y = float(y)
+        z = float(z)
+        return (
+            x * self.a + y * self.c + z * self.e,
+            x * self.b + y * self.d + z * self.f,
+            z,
+        )
+
+    def determinant(self) -> float:
+        return self.a * self.d - self.b * self.c
+
+    def __getitem__(self, item) -> List[float]:
+        return [
+            [self.a, self.b, 0.0],
+            [self.c, self.d, 0.0],
+            [self.e, self.f, 1.0],
+        ][item]
+
+    def __str__(self):
+        return "[[%f %f %f]\n [%f %f %f]\n [%f %f %f]]" % (
+            self.a,
+            self.b,
+            0,
+            self.c,
+            self.d,
+            0,
+            self.e,
+            self.f,
+            1,
+        )
+
+    def __deepcopy__(self, memodict={}):
+        return AffineTransform(self.a, self.b, self.c, self.d, self.e, self.f)
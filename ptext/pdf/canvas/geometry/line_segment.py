@@ -1,7 +1,8 @@
 from decimal import Decimal
-from math import sqrt
-from typing import Tuple
+from math import hypot
+from typing import Tuple, Union
 
+from ptext.pdf.canvas.geometry.affine_transform import AffineTransform
 from ptext.pdf.canvas.geometry.matrix import Matrix
 
 
@@ -13,7 +14,9 @@ class LineSegment:
         self.y1 = y1
 
     def length(self) -> Decimal:
-        return Decimal(sqrt((self.x0 - self.x1) ** 2 + (self.y0 - self.y1) ** 2))
+        return Decimal(
+            hypot(float(self.x0) - float(self.x1), float(self.y0) - float(self.y1))
+        )
 
     def get_start(self) -> Tuple[Decimal, Decimal]:
         return (self.x0, self.y0)
@@ -21,7 +24,12 @@ class LineSegment:
     def get_end(self) -> Tuple[Decimal, Decimal]:
         return (self.x1, self.y1)
 
-    def transform_by(self, matrix: Matrix) -> "LineSegment":
+    def transform_by(self, matrix: Union[Matrix, AffineTransform]) -> "LineSegment":
+        # transform (in float), keep Decimal coordinates
+        if isinstance(matrix, AffineTransform):
+            x0, y0 = matrix.apply(self.x0, self.y0)
+            x1, y1 = matrix.apply(self.x1, self.y1)
+            return LineSegment(Decimal(x0), Decimal(y0), Decimal(x1), Decimal(y1))
         p0 = matrix.cross(self.x0, self.y0, Decimal(1))
         p1 = matrix.cross(self.x1, self.y1, Decimal(1))
         return LineSegment(p0[0], p0[1], p1[0], p1[1])
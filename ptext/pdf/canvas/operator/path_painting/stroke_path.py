@@ -19,8 +19,9 @@ class StrokePath(CanvasOperator):
         gs = canvas.graphics_state
 
         # notify listeners
-        for l in gs.path:
-            canvas.event_occurred(LineRenderEvent(gs, l))
+        if canvas.has_event_listeners_for(LineRenderEvent):
+            for l in gs.path:
+                canvas.event_occurred(LineRenderEvent(gs, l))
 
         # clear path
         gs.path = []
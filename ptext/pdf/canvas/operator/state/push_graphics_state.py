@@ -15,4 +15,5 @@ class PushGraphicsState(CanvasOperator):
         super().__init__("q", 0)
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType] = []) -> None:  # type: ignore [name-defined]
-        canvas.graphics_state_stack.append(copy.deepcopy(canvas.graphics_state))
+        # fonts and colors are shared (rather than copied) with the saved state
+        canvas.graphics_state_stack.append(copy.copy(canvas.graphics_state))
@@ -2,7 +2,7 @@ from typing import List
 
 from ptext.io.read_transform.types import AnyPDFType
 from ptext.pdf.canvas.event.begin_text_event import BeginTextEvent
-from ptext.pdf.canvas.geometry.matrix import Matrix
+from ptext.pdf.canvas.geometry.affine_transform import AffineTransform
 from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
 
 
@@ -17,6 +17,7 @@ class BeginTextObject(CanvasOperator):
         super().__init__("BT", 0)
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType] = []):  # type: ignore [name-defined]
-        canvas.graphics_state.text_matrix = Matrix.identity_matrix()
-        canvas.graphics_state.text_line_matrix = Matrix.identity_matrix()
-        canvas.event_occurred(BeginTextEvent())
+        canvas.graphics_state.text_matrix = AffineTransform.identity_matrix()
+        canvas.graphics_state.text_line_matrix = AffineTransform.identity_matrix()
+        if canvas.has_event_listeners_for(BeginTextEvent):
+            canvas.event_occurred(BeginTextEvent())
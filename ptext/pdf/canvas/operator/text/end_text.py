@@ -16,4 +16,5 @@ class EndTextObject(CanvasOperator):
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType] = []):  # type: ignore [name-defined]
         canvas.graphics_state.text_matrix = None
         canvas.graphics_state.text_line_matrix = None
-        canvas.event_occurred(EndTextEvent())
+        if canvas.has_event_listeners_for(EndTextEvent):
+            canvas.event_occurred(EndTextEvent())
@@ -3,7 +3,7 @@ from decimal import Decimal
 from typing import List
 
 from ptext.io.read_transform.types import AnyPDFType
-from ptext.pdf.canvas.geometry.matrix import Matrix
+from ptext.pdf.canvas.geometry.affine_transform import AffineTransform
 from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
 
 
@@ -26,9 +26,7 @@ class MoveTextPosition(CanvasOperator):
         tx = operands[0]
         ty = operands[1]
 
-        m = Matrix.identity_matrix()
-        m[2][0] = tx
-        m[2][1] = ty
+        m = AffineTransform(e=tx, f=ty)
 
         canvas.graphics_state.text_matrix = m.mul(
             canvas.graphics_state.text_line_matrix
@@ -3,7 +3,7 @@ from decimal import Decimal
 from typing import List
 
 from ptext.io.read_transform.types import AnyPDFType
-from ptext.pdf.canvas.geometry.matrix import Matrix
+from ptext.pdf.canvas.geometry.affine_transform import AffineTransform
 from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
 
 
@@ -31,7 +31,7 @@ class SetTextMatrix(CanvasOperator):
         assert isinstance(operands[4], Decimal)
         assert isinstance(operands[5], Decimal)
 
-        mtx = Matrix.matrix_from_six_values(
+        mtx = AffineTransform.matrix_from_six_values(
             operands[0],
             operands[1],
             operands[2],
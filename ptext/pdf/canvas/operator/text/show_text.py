@@ -15,8 +15,15 @@ class ShowText(CanvasOperator):
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType] = []) -> None:  # type: ignore [name-defined]
         assert isinstance(operands[0], String)
+
+        # only build TextRenderEvent if it is consumed
+        if not canvas.has_event_listeners_for(TextRenderEvent):
+            w = TextRenderEvent.get_baseline_length(canvas.graphics_state, operands[0])
+            canvas.graphics_state.text_matrix.e += w
+            return
+
         tri = TextRenderEvent(canvas.graphics_state, operands[0])
         # render
         canvas.event_occurred(tri)
         # update text rendering location
-        canvas.graphics_state.text_matrix[2][0] += tri.get_baseline().length()
+        canvas.graphics_state.text_matrix.e += float(tri.get_baseline().length())
@@ -28,17 +28,28 @@ class ShowTextWithGlyphPositioning(CanvasOperator):
 
         assert isinstance(operands[0], List)
 
+        # only build TextRenderEvent(s) if they are consumed
+        build_text_render_events: bool = canvas.has_event_listeners_for(
+            TextRenderEvent
+        )
+
         for i in range(0, len(operands[0])):
             obj = operands[0][i]
 
             # display string
             if isinstance(obj, String):
                 assert isinstance(obj, String)
+                if not build_text_render_events:
+                    w = TextRenderEvent.get_baseline_length(canvas.graphics_state, obj)
+                    canvas.graphics_state.text_matrix.e += w
+                    continue
                 tri = TextRenderEvent(canvas.graphics_state, obj)
                 # render
                 canvas.event_occurred(tri)
                 # update text rendering location
-                canvas.graphics_state.text_matrix[2][0] += tri.get_baseline().length()
+                canvas.graphics_state.text_matrix.e += float(
+                    tri.get_baseline().length()
+                )
                 continue
 
             # adjust
@@ -52,4 +63,4 @@ class ShowTextWithGlyphPositioning(CanvasOperator):
                     * gs.font_size
                     * (gs.horizontal_scaling / 100)
                 )
-                gs.text_matrix[2][0] -= adjust_scaled
+                gs.text_matrix.e -= float(adjust_scaled)
@@ -81,6 +81,22 @@ class Document(Dictionary):
         # return
         return self
 
+    def close(self) -> None:
+        """
+        This function closes the (memory-mapped) file this Document was read from,
+        if PDF.loads opened it (i.e. when the Document was read from a path or a file descriptor).
+        A Document that is read lazily can not read the objects it has not read yet, once it is closed.
+        """
+        source = getattr(self, "_source", None)
+        if source is not None:
+            source.close()
+
+    def __enter__(self) -> "Document":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def has_signatures(self):
         return False
 
@@ -1,14 +1,38 @@
 import io
-from typing import List, Union
+import mmap
+import os
+import typing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Union, Optional, Iterable, Iterator, Callable, Set
 
+from ptext.io.filter.decoded_bytes_cache import DecodedBytesCache
 from ptext.io.read_transform.read_any_object_transformer import (
     ReadAnyObjectTransformer,
 )
+from ptext.io.read_transform.read_base_transformer import ReadTransformerContext
+from ptext.io.tokenize.memory_view_source import MemoryViewSource
 from ptext.io.write_transform.write_any_object_transformer import (
     WriteAnyObjectTransformer,
 )
 from ptext.pdf.canvas.event.event_listener import EventListener
+from ptext.io.read_transform.types import LazyObject, Reference
+from ptext.pdf.batch import BatchResult, process_batch
 from ptext.pdf.document import Document
+from ptext.pdf.page.page import Page
+
+
+def _map_pages_in_worker(
+    file: Union[str, Path],
+    page_indices: List[int],
+    event_listener_factory: Callable[[], EventListener],
+    get_page_result: Callable[[EventListener, int], typing.Any],
+) -> List[typing.Any]:
+    # read (only) the given Page(s), and return a (picklable) result for each of them
+    l = event_listener_factory()
+    with PDF.loads(file, [l], pages=page_indices):
+        pass
+    return [get_page_result(l, i) for i in range(0, len(page_indices))]
 
 
 class PDF:
@@ -29,12 +53,312 @@ class PDF:
 
     @staticmethod
     def loads(
-        file: Union[io.BufferedIOBase, io.RawIOBase],
+        file: Union[io.BufferedIOBase, io.RawIOBase, str, Path, int, mmap.mmap],
         event_listeners: List[EventListener] = [],
+        lazy: bool = False,
+        pages: Optional[
+            Union[Iterable[Union[int, range]], Callable[[int], bool]]
+        ] = None,
+        decoded_bytes_cache: Optional[DecodedBytesCache] = None,
+        max_decoded_stream_size: Optional[int] = None,
+        decode_executor: Optional[Executor] = None,
     ) -> Document:
-        return ReadAnyObjectTransformer().transform(
-            file, parent_object=None, context=None, event_listeners=event_listeners
+        """
+        This function reads a Document from a given io source.
+        When lazy is set to True, indirect objects (fonts, images, pages, etc) are only read
+        (and transformed) the first time they are accessed. In that case the io source must
+        remain open for as long as the Document is used, and page events are sent to the
+        EventListener(s) when a Page is first accessed.
+        When pages is set (to page indices, ranges of page indices or a function accepting a
+        page index) only the selected Page(s) are read, and only those send events to the
+        EventListener(s). Other Page(s) keep their place in the Document, but are not read
+        until they are accessed (which implies the Document is read lazily). When accessed,
+        they are read without sending events, and without processing their content stream(s).
+        When file is a path, a file descriptor or an mmap, the file is memory-mapped
+        and read without copying it, the bytes of Stream objects are then memoryview(s)
+        into the memory-mapped file.
+        When file is a path (or a file descriptor), the Document (which is also a context manager)
+        should be closed once it is no longer used, this closes the memory-mapped file.
+        When a DecodedBytesCache is given, Stream objects are only decoded when their DecodedBytes
+        are accessed, and their DecodedBytes are kept (within the budget of the DecodedBytesCache)
+        by the DecodedBytesCache rather than by the Stream objects.
+        When max_decoded_stream_size is set, decoding a Stream fails (with a PDFValueError)
+        as soon as any of its filter(s) produces more than max_decoded_stream_size bytes,
+        this guards against decompression bombs.
+        When a decode executor (e.g. a ThreadPoolExecutor) is given, the (Flate) Stream objects of a Page
+        (its Contents, and the XObjects in its Resources) are decoded by the executor as soon as they are read,
+        and joined when their DecodedBytes are first accessed. The executor is not shut down by this function,
+        and (when the Document is read lazily) must remain usable for as long as the Document is used.
+        A DecodedBytesCache and a decode executor can not both be given.
+        """
+        assert decoded_bytes_cache is None or decode_executor is None
+        opened_source: Optional[MemoryViewSource] = None
+        if isinstance(file, (str, Path, int)):
+            file = MemoryViewSource.open(file)
+            opened_source = file
+        elif isinstance(file, mmap.mmap):
+            file = MemoryViewSource(file)
+        selected_pages: Optional[Callable[[int], bool]] = None
+        if pages is not None:
+            selected_pages = PDF._get_page_selection(pages)
+        try:
+            doc = ReadAnyObjectTransformer().transform(
+                file,
+                parent_object=None,
+                context=ReadTransformerContext(
+                    lazy=(lazy or selected_pages is not None),
+                    selected_pages=selected_pages,
+                    decoded_bytes_cache=decoded_bytes_cache,
+                    max_decoded_stream_size=max_decoded_stream_size,
+                    decode_executor=decode_executor,
+                ),
+                event_listeners=event_listeners,
+            )
+        except Exception:
+            if opened_source is not None:
+                opened_source.close()
+            raise
+
+        # the (memory-mapped) file opened here is closed with the Document
+        if opened_source is not None:
+            setattr(doc, "_source", opened_source)
+        return doc
+
+    @staticmethod
+    def iter_pages(
+        file: Union[io.BufferedIOBase, io.RawIOBase, str, Path, int, mmap.mmap],
+        event_listeners: List[EventListener] = [],
+    ) -> Iterator[Page]:
+        """
+        This function reads the Page(s) of a Document one at a time (in order),
+        sending their events to the EventListener(s) and yielding each Page once it has been processed.
+        Once the next Page is requested, the previous Page (and everything that was read for it,
+        and is only used by that Page, such as its content stream(s) and images) is released by the Document.
+        Objects that are used by more than one Page (e.g. Font(s), or shared Resources) are kept,
+        so they are only read once.
+        The io source must remain open until the last Page has been yielded.
+        When file is a path (or a file descriptor), the memory-mapped file is closed
+        once the last Page has been yielded (or the iterator is closed).
+        """
+        if isinstance(file, (str, Path, int)):
+            opened_source: MemoryViewSource = MemoryViewSource.open(file)
+            try:
+                yield from PDF.iter_pages(opened_source, event_listeners)
+            finally:
+                opened_source.close()
+            return
+        if isinstance(file, mmap.mmap):
+            file = MemoryViewSource(file)
+        transformer = ReadAnyObjectTransformer()
+        context = ReadTransformerContext(lazy=True)
+        doc = transformer.transform(
+            file,
+            parent_object=None,
+            context=context,
+            event_listeners=event_listeners,
         )
+        reference_cache = context.reference_cache
+        xref = doc["XRef"]
+        pages = xref["Trailer"]["Root"]["Pages"]
+
+        # the Page(s) are taken from a copy of /Kids, so the page tree is not changed
+        # an unresolved LazyObject in /Kids does not keep the Page it stands for
+        kids = list(list.__iter__(pages["Kids"]))
+        page_object_numbers: Set[int] = set(
+            [
+                int(x.get_reference().object_number)
+                for x in kids
+                if isinstance(x, LazyObject)
+                and x.get_reference() is not None
+                and x.get_reference().object_number is not None
+            ]
+        )
+        page_owners: typing.Dict[int, int] = PDF._get_page_owners(
+            kids, page_object_numbers, context
+        )
+
+        for i, kid in enumerate(kids):
+            # both caches keep insertion order, new entries are at the end
+            number_of_references_before: int = len(reference_cache)
+            number_of_objects_before: int = len(xref.cache)
+
+            # read (and transform) Page
+            # the LazyObject in /Kids is not used, it would keep the Page
+            page_reference: Optional[Reference] = None
+            if isinstance(kid, LazyObject) and kid.get_reference() is not None:
+                page_reference = kid.get_reference()
+                kid = transformer.transform(page_reference, pages, context, [])
+            if isinstance(kid, LazyObject):
+                kid = kid.resolve()
+            yield kid
+            kid = None
+
+            # release everything read for this Page, that is only used by this Page
+            # (or is another Page, e.g. the destination of a link)
+            for r in list(xref.cache)[number_of_objects_before:]:
+                xref.cache.pop(r)
+            for r in list(reference_cache)[number_of_references_before:]:
+                object_number: Optional[int] = (
+                    int(r.object_number) if r.object_number is not None else None
+                )
+                if (
+                    object_number is not None
+                    and page_owners.get(object_number, -1) != i
+                    and object_number not in page_object_numbers
+                ):
+                    # avoid keeping this Page (and its resources) as parent of a kept object
+                    if hasattr(reference_cache[r], "set_parent"):
+                        reference_cache[r].set_parent(doc)
+                    continue
+                reference_cache.pop(r)
+            if page_reference is not None and page_reference.object_number is not None:
+                xref.cache.pop(xref.get_entry(int(page_reference.object_number)), None)
+
+    @staticmethod
+    def _get_page_owners(
+        kids: List[typing.Any],
+        page_object_numbers: Set[int],
+        context: ReadTransformerContext,
+    ) -> typing.Dict[int, int]:
+        """
+        This function returns the (indirect) objects that are only used by a single Page,
+        as a dictionary mapping their object number to the index of that Page.
+        Objects are read (not transformed) starting from each Page, /Parent and other Page(s)
+        (e.g. the destination of a link) are not followed.
+        """
+        xref = context.root_object["XRef"]
+        number_of_objects_before: int = len(xref.cache)
+        owners: typing.Dict[int, int] = {}
+        for i, kid in enumerate(kids):
+            if not isinstance(kid, LazyObject) or kid.get_reference() is None:
+                continue
+            done: Set[int] = set()
+            stack: List[typing.Any] = [kid.get_reference()]
+            while len(stack) > 0:
+                obj = stack.pop()
+                if isinstance(obj, LazyObject):
+                    obj = obj.get_reference()
+                if isinstance(obj, Reference):
+                    if obj.object_number is None:
+                        continue
+                    object_number: int = int(obj.object_number)
+                    if object_number in done or (
+                        len(done) > 0 and object_number in page_object_numbers
+                    ):
+                        continue
+                    done.add(object_number)
+                    owners[object_number] = (
+                        i if owners.get(object_number, i) == i else -1
+                    )
+                    obj = xref.get_object(obj, context.source, context.tokenizer)
+                if isinstance(obj, dict):
+                    stack.extend([v for k, v in dict.items(obj) if k != "Parent"])
+                elif isinstance(obj, list):
+                    stack.extend(list.__iter__(obj))
+
+        # the objects that were read are not kept
+        for r in list(xref.cache)[number_of_objects_before:]:
+            xref.cache.pop(r)
+        return owners
+
+    @staticmethod
+    def loads_many(
+        files: Iterable[Union[str, Path]],
+        function: Callable[[Document], typing.Any],
+        max_workers: Optional[int] = None,
+        timeout_in_seconds: float = 30,
+        max_tasks_per_worker: int = 100,
+        max_memory_per_worker_in_mb: float = 1024,
+    ) -> Iterator[BatchResult]:
+        """
+        This function reads each Document (given by its path) in a pool of long-lived worker processes,
+        calls function on each Document (in its worker process), and yields a BatchResult
+        (holding the return value of function, timing and exception information) for each Document,
+        as soon as it completes.
+        Workers are recycled after max_tasks_per_worker Document(s),
+        or once their (peak) memory usage exceeds max_memory_per_worker_in_mb.
+        A Document that takes longer than timeout_in_seconds yields a timed-out BatchResult
+        (and its worker is replaced).
+        function (and its return value) must be picklable.
+        """
+        return process_batch(
+            files,
+            function,
+            max_workers=max_workers,
+            timeout_in_seconds=timeout_in_seconds,
+            max_tasks_per_worker=max_tasks_per_worker,
+            max_memory_per_worker_in_mb=max_memory_per_worker_in_mb,
+        )
+
+    @staticmethod
+    def map_pages(
+        file: Union[str, Path],
+        event_listener_factory: Callable[[], EventListener],
+        get_page_result: Callable[[EventListener, int], typing.Any],
+        pages: Optional[
+            Union[Iterable[Union[int, range]], Callable[[int], bool]]
+        ] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[typing.Any]:
+        """
+        This function processes the Page(s) of a Document (given by its path) in parallel,
+        and returns a result for each (selected) Page, in page order.
+        The (selected) Page(s) are split in (at most) max_workers consecutive ranges,
+        each range is read by a separate process (which memory-maps the file) that sends its events
+        to a new EventListener (built by event_listener_factory).
+        get_page_result is then called with that EventListener and the index of each Page
+        (relative to the start of the range) to obtain the result for that Page.
+        e.g. PDF.map_pages(path, SimpleTextExtraction, SimpleTextExtraction.get_text)
+        event_listener_factory, get_page_result and their results must be picklable.
+        """
+        assert isinstance(file, (str, Path))
+
+        # determine which Page(s) to process
+        with PDF.loads(file, lazy=True) as doc:
+            number_of_pages: int = int(
+                doc.get_document_info().get_number_of_pages() or 0
+            )
+        page_indices: List[int] = list(range(0, number_of_pages))
+        if pages is not None:
+            selected_pages = PDF._get_page_selection(pages)
+            page_indices = [i for i in page_indices if selected_pages(i)]
+        if len(page_indices) == 0:
+            return []
+
+        # split Page(s) in consecutive ranges
+        max_workers = max_workers or os.cpu_count() or 1
+        range_size: int = -(-len(page_indices) // max_workers)
+        page_ranges: List[List[int]] = [
+            page_indices[i : i + range_size]
+            for i in range(0, len(page_indices), range_size)
+        ]
+
+        # process ranges, and merge their results in page order
+        with ProcessPoolExecutor(max_workers=len(page_ranges)) as executor:
+            out: List[typing.Any] = []
+            for page_range_results in executor.map(
+                _map_pages_in_worker,
+                [file] * len(page_ranges),
+                page_ranges,
+                [event_listener_factory] * len(page_ranges),
+                [get_page_result] * len(page_ranges),
+            ):
+                out.extend(page_range_results)
+            return out
+
+    @staticmethod
+    def _get_page_selection(
+        pages: Union[Iterable[Union[int, range]], Callable[[int], bool]]
+    ) -> Callable[[int], bool]:
+        if callable(pages):
+            return pages
+        page_indices: Set[int] = set()
+        for x in pages:
+            if isinstance(x, range):
+                page_indices.update(x)
+            else:
+                page_indices.add(int(x))
+        return lambda i: i in page_indices
 
     @staticmethod
     def dumps(file: Union[io.BufferedIOBase, io.RawIOBase], document: Document) -> None:
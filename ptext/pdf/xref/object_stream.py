@@ -0,0 +1,90 @@
+import io
+import typing
+from collections import OrderedDict
+from typing import Optional
+
+from ptext.io.read_transform.types import AnyPDFType
+from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
+
+
+class ObjectStream:
+    """
+    An object stream, is a stream object in which a sequence of indirect objects may be stored, as an alternative to
+    their being stored at the outermost file level.
+    The stream data in an object stream shall contain the following items:
+    - N pairs of integers separated by white space, where the first integer in each pair shall represent the object
+    number of a compressed object and the second integer shall represent the byte offset in the decompressed stream
+    of that object, relative to the first object stored in the object stream, the value of the stream’s first entry.
+    The offsets shall be in increasing order.
+    - The value of the First entry in the stream dictionary shall be the byte offset in the decompressed stream of the
+    first object.
+
+    This class reads the offset table once, and parses each member (on demand) starting at its recorded offset.
+    Parsed members are memoized, the least recently used ones are evicted once more than
+    max_number_of_cached_members members have been parsed.
+    """
+
+    def __init__(
+        self,
+        decoded_bytes: bytes,
+        number_of_objects: int,
+        first_byte: int,
+        max_number_of_cached_members: int = 1024,
+    ):
+        self._decoded_bytes: bytes = decoded_bytes
+        self._first_byte: int = first_byte
+        self._tokenizer = HighLevelTokenizer(io.BytesIO(decoded_bytes))
+        self._max_number_of_cached_members: int = max_number_of_cached_members
+        self._members: typing.OrderedDict[int, Optional[AnyPDFType]] = OrderedDict()
+        self._offsets: typing.List[int] = self._read_offsets(number_of_objects)
+
+    def _read_offsets(self, number_of_objects: int) -> typing.List[int]:
+        try:
+            ints = [int(x) for x in self._decoded_bytes[0 : self._first_byte].split()]
+        except ValueError:
+            ints = []
+        offsets = [self._first_byte + x for x in ints[1 : 2 * number_of_objects : 2]]
+        if len(offsets) == number_of_objects and all(
+            0 <= offsets[i] < offsets[i + 1] for i in range(0, len(offsets) - 1)
+        ):
+            return offsets
+
+        # malformed offset table
+        # read all objects one after the other (once) to determine their offsets
+        offsets = []
+        self._tokenizer.seek(self._first_byte)
+        while len(offsets) < number_of_objects:
+            offset = self._tokenizer.tell()
+            try:
+                obj = self._tokenizer.read_object()
+            except Exception:
+                break
+            self._members[len(offsets)] = obj
+            offsets.append(offset)
+            if self._tokenizer.tell() == offset:
+                break
+        self._evict()
+        return offsets
+
+    def _evict(self) -> None:
+        while len(self._members) > self._max_number_of_cached_members:
+            self._members.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def get_object(self, index: int) -> Optional[AnyPDFType]:
+        """
+        This function returns the object at a given index in this ObjectStream,
+        or None if no such object exists
+        """
+        if index in self._members:
+            self._members.move_to_end(index)
+            return self._members[index]
+        if index < 0 or index >= len(self._offsets):
+            return None
+        self._tokenizer.seek(self._offsets[index])
+        obj = self._tokenizer.read_object()
+        self._members[index] = obj
+        self._evict()
+        return obj
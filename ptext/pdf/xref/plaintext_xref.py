@@ -1,4 +1,5 @@
 import io
+import re
 from typing import Optional, List, Union
 
 from ptext.exception.pdf_exception import (
@@ -9,6 +10,10 @@ from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
 from ptext.io.tokenize.low_level_tokenizer import TokenType
 from ptext.pdf.xref.xref import XREF
 
+# a (well-formed) subsection of the cross-reference table consists of 20-byte entries
+# nnnnnnnnnn ggggg n eol
+_XREF_ENTRIES = re.compile(rb"(?:[0-9]{10} [0-9]{5} [fn](?: \r| \n|\r\n))*")
+
 
 class PlainTextXREF(XREF):
     """
@@ -79,9 +84,16 @@ class PlainTextXREF(XREF):
 
         start_object_number = int(tokens[0].text)
         number_of_objects = int(tokens[1].text)
-        indirect_references = []
+
+        # read subsection (fast path)
+        indirect_references = self._read_fixed_width_entries(
+            src, start_object_number, number_of_objects
+        )
+        if indirect_references is not None:
+            return indirect_references
 
         # read subsection
+        indirect_references = []
         for i in range(0, number_of_objects):
             tokens = [tok.next_non_comment_token() for _ in range(0, 3)]
             assert tokens[0] is not None
@@ -115,6 +127,38 @@ class PlainTextXREF(XREF):
         # return
         return indirect_references
 
+    def _read_fixed_width_entries(
+        self, src: io.IOBase, start_object_number: int, number_of_objects: int
+    ) -> Optional[List[Reference]]:
+        """
+        This function reads an entire subsection of the cross-reference table at once,
+        and parses its entries by slicing, relying on every entry being exactly 20 bytes long.
+        It returns None (and restores the position of src) if the subsection is malformed,
+        in which case it should be read token by token instead.
+        """
+        byte_offset_before_entries = src.tell()
+        number_of_bytes = 20 * number_of_objects
+        data = src.read(number_of_bytes + 32)
+        data_without_eol = data.lstrip(b"\x00\t\n\x0c\r ")
+        number_of_whitespace_bytes = len(data) - len(data_without_eol)
+        data = data_without_eol[0:number_of_bytes]
+        if len(data) != number_of_bytes or _XREF_ENTRIES.fullmatch(data) is None:
+            src.seek(byte_offset_before_entries)
+            return None
+
+        src.seek(
+            byte_offset_before_entries + number_of_whitespace_bytes + number_of_bytes
+        )
+        return [
+            Reference(
+                object_number=start_object_number + i,
+                byte_offset=int(data[j : j + 10]),
+                generation_number=int(data[j + 11 : j + 16]),
+                is_in_use=(data[j + 17] == 110),  # n
+            )
+            for i, j in enumerate(range(0, number_of_bytes, 20))
+        ]
+
     def _read_trailer(self, src: io.IOBase, tok: HighLevelTokenizer) -> Dictionary:
 
         # return None if there is no trailer
@@ -1,4 +1,8 @@
+import array
+import functools
 import io
+import sys
+import typing
 from decimal import Decimal
 from typing import Optional, Union
 
@@ -54,15 +58,15 @@ class StreamXREF(XREF):
         # parent
         document = self.get_root()  # type: ignore [attr-defined]
 
-        # list of references
-        indirect_references = [
+        # the head of the linked list of free objects
+        self.append(
             Reference(
                 object_number=0,
                 generation_number=65535,
                 is_in_use=False,
                 document=document,
             )
-        ]
+        )
 
         # check size
         assert "Size" in xref_stream
@@ -86,115 +90,63 @@ class StreamXREF(XREF):
         xref_stream = decode_stream(xref_stream)
 
         # read every range specified in \Index
-        xref_stream_decoded_bytes = xref_stream["DecodedBytes"]
+        # the decoded bytes are a sequence of fixed-width records,
+        # every field is decoded as a column (for all records in a range at once)
+        xref_stream_decoded_bytes = bytes(xref_stream["DecodedBytes"])
+        bptr = 0
         for idx in range(0, len(index), 2):
             start = int(index[idx])
             length = int(index[idx + 1])
 
-            bptr = 0
-            for i in range(0, length):
-
-                # object number
-                object_number = start + i
-
-                # read type
-                type = 1
-                if widths[0] > 0:
-                    type = 0
-                    for j in range(0, widths[0]):
-                        type = (type << 8) + (xref_stream_decoded_bytes[bptr] & 0xFF)
-                        bptr += 1
-
-                # read field 2
-                field2 = 0
-                for j in range(0, widths[1]):
-                    field2 = (field2 << 8) + (xref_stream_decoded_bytes[bptr] & 0xFF)
-                    bptr += 1
-
-                # read field 3
-                field3 = 0
-                for j in range(0, widths[2]):
-                    field3 = (field3 << 8) + (xref_stream_decoded_bytes[bptr] & 0xFF)
-                    bptr += 1
-
-                # check type
-                assert type in [0, 1, 2]
-
-                pdf_indirect_reference = None
-                if type == 0:
-                    # type      :The type of this entry, which shall be 0. Type 0 entries define
-                    # the linked list of free objects (corresponding to f entries in a
-                    # cross-reference table).
-                    # field2    : The object number of the next free object
-                    # field3    : The generation number to use if this object number is used again
-                    pdf_indirect_reference = Reference(
-                        document=document,
-                        object_number=object_number,
-                        byte_offset=field2,
-                        generation_number=field3,
-                        is_in_use=False,
-                    )
+            records = xref_stream_decoded_bytes[
+                bptr : bptr + length * total_entry_width
+            ]
+            bptr += length * total_entry_width
 
-                if type == 1:
-                    # Type      : The type of this entry, which shall be 1. Type 1 entries define
-                    # objects that are in use but are not compressed (corresponding
-                    # to n entries in a cross-reference table).
-                    # field2    : The byte offset of the object, starting from the beginning of the
-                    # file.
-                    # field3    : The generation number of the object. Default value: 0.
-                    pdf_indirect_reference = Reference(
-                        document=document,
-                        object_number=object_number,
-                        byte_offset=field2,
-                        generation_number=field3,
-                    )
+            # type defaults to 1, field 2 and field 3 default to 0
+            types = self._read_column(records, total_entry_width, 0, widths[0], 1)
+            fields2 = self._read_column(
+                records, total_entry_width, widths[0], widths[1], 0
+            )
+            fields3 = self._read_column(
+                records, total_entry_width, widths[0] + widths[1], widths[2], 0
+            )
+            assert len(types) == len(fields2) == len(fields3) == length
 
-                if type == 2:
-                    # Type      : The type of this entry, which shall be 2. Type 2 entries define
-                    # compressed objects.
-                    # field2    : The object number of the object stream in which this object is
-                    # stored. (The generation number of the object stream shall be
-                    # implicitly 0.)
-                    # field3    : The index of this object within the object stream.
-                    pdf_indirect_reference = Reference(
-                        document=document,
-                        object_number=object_number,
-                        generation_number=0,
-                        parent_stream_object_number=field2,
-                        index_in_parent_stream=field3,
-                    )
+            # check type
+            assert set(types) <= {0, 1, 2}
 
-                assert pdf_indirect_reference is not None
-
-                # append
-                existing_indirect_ref = next(
-                    iter(
-                        [
-                            x
-                            for x in indirect_references
-                            if x.object_number is not None
-                            and x.object_number == Decimal(object_number)
-                        ]
-                    ),
-                    None,
+            # entries for object numbers that were already encountered (in this cross-reference stream)
+            # either update the existing entry, or are kept as well (behind the existing entry)
+            object_numbers = range(start, start + length)
+            encountered_object_numbers: typing.Set[int] = set(
+                self._entries_by_object_number.keys() & object_numbers
+            )
+            for r, _ in self._unbuilt_ranges:
+                encountered_object_numbers.update(
+                    range(max(r.start, start), min(r.stop, start + length))
+                )
+            for object_number in sorted(encountered_object_numbers):
+                i = object_number - start
+                pdf_indirect_reference = self._build_entry(
+                    object_number, types[i], fields2[i], fields3[i], document
                 )
+                existing_indirect_ref = self.get_entry(object_number)
+                assert existing_indirect_ref is not None
+
                 ref_is_in_reading_state = (
-                    existing_indirect_ref is not None
-                    and existing_indirect_ref.is_in_use
+                    existing_indirect_ref.is_in_use
                     and existing_indirect_ref.generation_number
                     == pdf_indirect_reference.generation_number
                 )
-                ref_is_first_encountered = existing_indirect_ref is None or (
+                ref_is_first_encountered = (
                     not ref_is_in_reading_state
                     and existing_indirect_ref.document is None
                 )
 
                 if ref_is_first_encountered:
-                    assert pdf_indirect_reference is not None
-                    indirect_references.append(pdf_indirect_reference)
+                    self._entries.append(pdf_indirect_reference)
                 elif ref_is_in_reading_state:
-                    assert existing_indirect_ref is not None
-                    assert pdf_indirect_reference is not None
                     existing_indirect_ref.index_in_parent_stream = (
                         pdf_indirect_reference.index_in_parent_stream
                     )
@@ -202,12 +154,129 @@ class StreamXREF(XREF):
                         pdf_indirect_reference.parent_stream_object_number
                     )
 
-        # add section
-        for r in indirect_references:
-            self.append(r)
+            # all other entries are built (from their columns) when they are first looked up
+            self._unbuilt_ranges.append(
+                (
+                    object_numbers,
+                    functools.partial(
+                        StreamXREF._build_entry_from_columns,
+                        start,
+                        types,
+                        fields2,
+                        fields3,
+                        document,
+                    ),
+                )
+            )
 
         # initialize trailer
         self["Trailer"] = Dictionary(xref_stream)
 
         # return
         return self
+
+    @staticmethod
+    def _build_entry(
+        object_number: int,
+        type: int,
+        field2: int,
+        field3: int,
+        document: typing.Any,
+    ) -> Reference:
+        if type == 1:
+            # Type      : The type of this entry, which shall be 1. Type 1 entries define
+            # objects that are in use but are not compressed (corresponding
+            # to n entries in a cross-reference table).
+            # field2    : The byte offset of the object, starting from the beginning of the
+            # file.
+            # field3    : The generation number of the object. Default value: 0.
+            return Reference(
+                document=document,
+                object_number=object_number,
+                byte_offset=field2,
+                generation_number=field3,
+            )
+
+        if type == 0:
+            # type      :The type of this entry, which shall be 0. Type 0 entries define
+            # the linked list of free objects (corresponding to f entries in a
+            # cross-reference table).
+            # field2    : The object number of the next free object
+            # field3    : The generation number to use if this object number is used again
+            return Reference(
+                document=document,
+                object_number=object_number,
+                byte_offset=field2,
+                generation_number=field3,
+                is_in_use=False,
+            )
+
+        # Type      : The type of this entry, which shall be 2. Type 2 entries define
+        # compressed objects.
+        # field2    : The object number of the object stream in which this object is
+        # stored. (The generation number of the object stream shall be
+        # implicitly 0.)
+        # field3    : The index of this object within the object stream.
+        assert type == 2
+        return Reference(
+            document=document,
+            object_number=object_number,
+            generation_number=0,
+            parent_stream_object_number=field2,
+            index_in_parent_stream=field3,
+        )
+
+    @staticmethod
+    def _build_entry_from_columns(
+        start: int,
+        types: typing.Sequence[int],
+        fields2: typing.Sequence[int],
+        fields3: typing.Sequence[int],
+        document: typing.Any,
+        object_number: int,
+    ) -> Reference:
+        i: int = object_number - start
+        return StreamXREF._build_entry(
+            object_number, types[i], fields2[i], fields3[i], document
+        )
+
+    def _read_column(
+        self,
+        records: bytes,
+        total_entry_width: int,
+        offset: int,
+        width: int,
+        default_value: int,
+    ) -> typing.Sequence[int]:
+        """
+        This function decodes a single (big-endian) field from every (fixed-width) record
+        """
+        number_of_records = len(records) // max(total_entry_width, 1)
+        end = number_of_records * total_entry_width
+        if width == 0:
+            return [default_value] * number_of_records
+        if width == 1:
+            return records[offset:end:total_entry_width]
+
+        # the bytes of the field are copied (by slice assignment) into an array of
+        # unsigned integers that is wide enough, leaving the leading byte(s) zero
+        typecodes = [t for t in "HIQ" if array.array(t).itemsize >= width]
+        if len(typecodes) > 0:
+            itemsize = array.array(typecodes[0]).itemsize
+            values = array.array(typecodes[0], bytes(itemsize * number_of_records))
+            with memoryview(values).cast("B") as value_bytes:
+                for j in range(0, width):
+                    value_bytes[itemsize - width + j :: itemsize] = records[
+                        offset + j : end : total_entry_width
+                    ]
+            # the fields are big-endian
+            if sys.byteorder == "little":
+                values.byteswap()
+            return values
+
+        # fields wider than 8 bytes
+        value_column = [0] * number_of_records
+        for j in range(0, width):
+            column = records[offset + j : end : total_entry_width]
+            value_column = [(v << 8) + b for v, b in zip(value_column, column)]
+        return value_column
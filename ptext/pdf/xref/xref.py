@@ -1,6 +1,7 @@
 import io
 import logging
 import typing
+from collections import OrderedDict
 from decimal import Decimal
 from typing import Union, Optional
 
@@ -11,6 +12,7 @@ from ptext.io.filter.stream_decode_util import decode_stream
 from ptext.io.read_transform.types import Dictionary, Reference, AnyPDFType, Stream
 from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
 from ptext.io.tokenize.low_level_tokenizer import TokenType
+from ptext.pdf.xref.object_stream import ObjectStream
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +20,27 @@ logger = logging.getLogger(__name__)
 class XREF(Dictionary):
     def __init__(self):
         super(XREF, self).__init__()
-        self.entries: typing.List[Reference] = []
+        self._entries: typing.List[Reference] = []
         self.cache: typing.Dict[Reference, AnyPDFType] = {}
+        # index of entries, keyed by object number
+        # entries are merged most-recent-section first, so the first entry for a given
+        # object number is the one that carries the current generation number
+        self._entries_by_object_number: typing.Dict[int, Reference] = {}
+        # index of entries that only specify their position in a parent (object) stream
+        self._entries_by_parent_stream: typing.Dict[
+            typing.Tuple[int, int], Reference
+        ] = {}
+        # ranges of entries that have not been built (as Reference objects) yet,
+        # each with the function that builds the entry for an object number in that range
+        # an entry is only built once it is looked up (or all entries are needed),
+        # an object number that is in the index (or in an earlier range) is never built from a later range
+        self._unbuilt_ranges: typing.List[
+            typing.Tuple[range, typing.Callable[[int], Reference]]
+        ] = []
+        # parsed object streams, keyed by object number
+        # only the most recently used object streams are kept
+        self._object_streams: typing.OrderedDict[int, ObjectStream] = OrderedDict()
+        self._max_number_of_object_streams: int = 16
 
     ##
     ## LOWLEVEL IO
@@ -45,7 +66,7 @@ class XREF(Dictionary):
 
         while pos > 0:
             src.seek(pos)
-            bytes_near_eof = "".join([tok._next_char() for _ in range(0, str_len)])
+            bytes_near_eof = src.read(str_len).decode("latin-1")
             idx = bytes_near_eof.find(text_to_find)
             if idx >= 0:
                 return pos + idx
@@ -86,26 +107,64 @@ class XREF(Dictionary):
     ## GETTERS AND SETTERS
     ##
 
+    @property
+    def entries(self) -> typing.List[Reference]:
+        """
+        This function returns all entries of this XREF
+        (building the entries that have not been looked up yet)
+        """
+        for object_numbers, build_entry in self._unbuilt_ranges:
+            for object_number in object_numbers:
+                if object_number not in self._entries_by_object_number:
+                    self.append(build_entry(object_number))
+        self._unbuilt_ranges.clear()
+        return self._entries
+
     def append(self, r: Reference) -> "XREF":
-        self.entries.append(r)
+        self._entries.append(r)
+        if r.object_number is not None:
+            self._entries_by_object_number.setdefault(int(r.object_number), r)
+        elif r.parent_stream_object_number is not None:
+            self._entries_by_parent_stream.setdefault(
+                (
+                    int(r.parent_stream_object_number),
+                    int(r.index_in_parent_stream or 0),
+                ),
+                r,
+            )
         return self
 
+    def get_entry(self, object_number: int) -> Optional[Reference]:
+        """
+        This function returns the (most recent) entry for a given object number,
+        or None if this XREF does not contain such an entry
+        """
+        entry = self._entries_by_object_number.get(int(object_number), None)
+        if entry is not None or len(self._unbuilt_ranges) == 0:
+            return entry
+        object_number = int(object_number)
+        for object_numbers, build_entry in self._unbuilt_ranges:
+            if object_number in object_numbers:
+                entry = build_entry(object_number)
+                self.append(entry)
+                return entry
+        return None
+
     def merge(self, other_xref: "XREF") -> "XREF":
-        for r in other_xref.entries:
-            duplicate_entries = []
+        # the entries of other_xref that have not been built yet are not built,
+        # its ranges are looked up after the ranges (and entries) of this XREF
+        for r in other_xref._entries:
+            is_duplicate = False
             if r.object_number is not None:
-                duplicate_entries = [
-                    x for x in self.entries if x.object_number == r.object_number
-                ]
+                is_duplicate = self.get_entry(int(r.object_number)) is not None
             elif r.parent_stream_object_number is not None:
-                duplicate_entries = [
-                    x
-                    for x in self.entries
-                    if x.parent_stream_object_number == r.parent_stream_object_number
-                    and x.index_in_parent_stream == r.index_in_parent_stream
-                ]
-            if len(duplicate_entries) == 0:
+                is_duplicate = (
+                    int(r.parent_stream_object_number),
+                    int(r.index_in_parent_stream or 0),
+                ) in self._entries_by_parent_stream
+            if not is_duplicate:
                 self.append(r)
+        self._unbuilt_ranges.extend(other_xref._unbuilt_ranges)
         return self
 
     def get_object(
@@ -125,23 +184,19 @@ class XREF(Dictionary):
         if isinstance(indirect_reference, int) or isinstance(
             indirect_reference, Decimal
         ):
-            refs = [
-                x for x in self.entries if x.object_number == int(indirect_reference)
-            ]
-            if len(refs) == 0:
+            ref = self.get_entry(int(indirect_reference))
+            if ref is None:
                 return None
-            indirect_reference = refs[0]
+            indirect_reference = ref
 
         # lookup Reference (in self) for Reference
         elif isinstance(indirect_reference, Reference):
-            refs = [
-                x
-                for x in self.entries
-                if x.object_number == indirect_reference.object_number
-            ]
-            if len(refs) == 0:
+            if indirect_reference.object_number is None:
                 return None
-            indirect_reference = refs[0]
+            ref = self.get_entry(indirect_reference.object_number)
+            if ref is None:
+                return None
+            indirect_reference = ref
 
         # reference points to an object that is not in use
         assert isinstance(indirect_reference, Reference)
@@ -157,57 +212,85 @@ class XREF(Dictionary):
             tok.seek(tell_before)
 
         # entry specifies a parent object
+        # its members are memoized by the (most recently used) ObjectStream(s),
+        # rather than by this cache
         if (
             indirect_reference.parent_stream_object_number is not None
             and indirect_reference.index_in_parent_stream is not None
         ):
 
-            stream_object = self.get_object(
-                indirect_reference.parent_stream_object_number, src, tok
+            return self._get_object_stream(
+                int(indirect_reference.parent_stream_object_number), src, tok
+            ).get_object(int(indirect_reference.index_in_parent_stream))
+
+        # update cache
+        self.cache[indirect_reference] = obj
+
+        # return
+        return obj
+
+    def _get_object_stream(
+        self,
+        parent_stream_object_number: int,
+        src: Union[io.BufferedIOBase, io.RawIOBase],
+        tok: HighLevelTokenizer,
+    ) -> ObjectStream:
+
+        # cache
+        object_stream = self._object_streams.get(parent_stream_object_number, None)
+        if object_stream is not None:
+            self._object_streams.move_to_end(parent_stream_object_number)
+            return object_stream
+
+        # get parent stream
+        stream_object = self.get_object(parent_stream_object_number, src, tok)
+        assert isinstance(stream_object, Stream)
+        assert "Length" in stream_object
+        assert "First" in stream_object
+
+        # Length may be Reference
+        if isinstance(stream_object["Length"], Reference):
+            stream_object["Length"] = self.get_object(
+                stream_object["Length"], src=src, tok=tok
+            )
+
+        # First may be Reference
+        if isinstance(stream_object["First"], Reference):
+            stream_object["First"] = self.get_object(
+                stream_object["First"], src=src, tok=tok
             )
-            assert isinstance(stream_object, Stream)
-            assert "Length" in stream_object
-            assert "First" in stream_object
-
-            # Length may be Reference
-            if isinstance(stream_object["Length"], Reference):
-                stream_object["Length"] = self.get_object(
-                    stream_object["Length"], src=src, tok=tok
-                )
 
-            # First may be Reference
-            if isinstance(stream_object["First"], Reference):
-                stream_object["First"] = self.get_object(
-                    stream_object["First"], src=src, tok=tok
+        # N may be Reference
+        if isinstance(stream_object.get("N", None), Reference):
+            stream_object["N"] = self.get_object(stream_object["N"], src=src, tok=tok)
+
+        first_byte = int(stream_object.get("First", 0))
+        if "DecodedBytes" not in stream_object:
+            try:
+                stream_object = decode_stream(stream_object)
+            except Exception as ex:
+                logger.debug(
+                    "unable to inflate stream for object %d"
+                    % parent_stream_object_number
                 )
+                raise ex
 
-            first_byte = int(stream_object.get("First", 0))
-            if "DecodedBytes" not in stream_object:
-                try:
-                    stream_object = decode_stream(stream_object)
-                except Exception as ex:
-                    logger.debug(
-                        "unable to inflate stream for object %d"
-                        % indirect_reference.parent_stream_object_number
-                    )
-                    raise ex
-            stream_bytes = stream_object["DecodedBytes"][first_byte:]
-
-            # tokenize parent stream
-            index = int(indirect_reference.index_in_parent_stream)
-            length = int(stream_object["Length"])
-            if index < length:
-                tok = HighLevelTokenizer(io.BytesIO(stream_bytes))
-                list_of_objs = [tok.read_object() for x in range(0, index + 1)]
-                obj = list_of_objs[-1]
-            else:
-                obj = None
+        # parse offset table
+        number_of_objects = int(stream_object.get("N", stream_object["Length"]))
+        object_stream = ObjectStream(
+            stream_object["DecodedBytes"], number_of_objects, first_byte
+        )
 
         # update cache
-        self.cache[indirect_reference] = obj
+        # the DecodedBytes of the parent stream are kept by the ObjectStream,
+        # for as long as the ObjectStream is cached
+        self.cache.pop(self.get_entry(parent_stream_object_number), None)
+        self._object_streams[parent_stream_object_number] = object_stream
+        while len(self._object_streams) > self._max_number_of_object_streams:
+            self._object_streams.popitem(last=False)
 
         # return
-        return obj
+        return object_stream
 
     ##
     ## OVERRIDES
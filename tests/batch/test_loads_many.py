@@ -0,0 +1,88 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from ptext.pdf.document import Document
+from ptext.pdf.pdf import PDF
+from tests.test import build_document_bytes
+
+
+def get_number_of_pages(doc: Document) -> int:
+    return int(doc.get_document_info().get_number_of_pages())
+
+
+def get_process_id(doc: Document) -> int:
+    return os.getpid()
+
+
+def sleep(doc: Document) -> None:
+    time.sleep(60)
+
+
+class TestLoadsMany(unittest.TestCase):
+    """
+    This test checks whether PDF.loads_many processes every Document (in worker processes),
+    reports exceptions and timeouts per Document, and recycles its workers.
+    """
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.files = []
+        for i in range(0, 8):
+            path = Path(self.tmp.name) / ("document-%d.pdf" % i)
+            with open(path, "wb") as pdf_file_handle:
+                pdf_file_handle.write(build_document_bytes(i + 1))
+            self.files.append(path)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_loads_many(self):
+        t0 = time.time()
+        results = list(
+            PDF.loads_many(iter(self.files), get_number_of_pages, max_workers=2)
+        )
+        print("%d documents : %f s" % (len(results), time.time() - t0))
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all([r.passed() for r in results]))
+        self.assertEqual(
+            sorted([(r.file, r.result) for r in results]),
+            [(f, i + 1) for i, f in enumerate(self.files)],
+        )
+        self.assertTrue(all([r.time_in_seconds > 0 for r in results]))
+
+    def test_loads_many_reports_exceptions(self):
+        files = [self.files[0], Path(self.tmp.name) / "does-not-exist.pdf"]
+        results = {
+            r.file: r for r in PDF.loads_many(files, get_number_of_pages, max_workers=1)
+        }
+        self.assertTrue(results[files[0]].passed())
+        self.assertFalse(results[files[1]].passed())
+        self.assertFalse(results[files[1]].timed_out)
+        self.assertTrue("FileNotFoundError" in results[files[1]].exception)
+        self.assertIsNotNone(results[files[1]].exception_traceback)
+
+    def test_loads_many_times_out(self):
+        t0 = time.time()
+        results = list(
+            PDF.loads_many(
+                self.files[0:3], sleep, max_workers=2, timeout_in_seconds=0.5
+            )
+        )
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all([r.timed_out for r in results]))
+        self.assertLess(time.time() - t0, 10)
+
+    def test_loads_many_recycles_workers(self):
+        results = list(
+            PDF.loads_many(
+                self.files, get_process_id, max_workers=1, max_tasks_per_worker=2
+            )
+        )
+        self.assertEqual(len(set([r.result for r in results])), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
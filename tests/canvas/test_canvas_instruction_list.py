@@ -0,0 +1,53 @@
+import io
+import unittest
+
+from ptext.pdf.canvas.canvas import Canvas
+from ptext.pdf.canvas.canvas_instruction_list import (
+    CanvasInstructionList,
+    InstructionRecordingMode,
+)
+from ptext.pdf.pdf import PDF
+from tests.test import build_document_bytes
+
+
+class TestCanvasInstructionList(unittest.TestCase):
+    """
+    This test checks whether a Canvas records the instructions it processes
+    according to its InstructionRecordingMode, and whether the compact form (CanvasInstructionList)
+    offers the same instructions as the Dictionary form.
+    """
+
+    CONTENT = (
+        b"q 1 0 0 1 10 20 cm BT /F1 12 Tf 72 712 Td (Hello) Tj [(Wor) -250 (ld)] TJ ET Q"
+    )
+
+    def setUp(self) -> None:
+        self.page = PDF.loads(io.BytesIO(build_document_bytes(1))).get_page(0)
+
+    def _read_content(self, instruction_recording_mode: InstructionRecordingMode):
+        canvas = Canvas(instruction_recording_mode=instruction_recording_mode)
+        canvas.set_parent(self.page)  # type: ignore [attr-defined]
+        canvas.read(io.BytesIO(TestCanvasInstructionList.CONTENT))
+        return canvas
+
+    def test_do_not_record_instructions(self):
+        canvas = self._read_content(InstructionRecordingMode.NONE)
+        self.assertNotIn("Instructions", canvas)
+
+    def test_record_instructions_compactly(self):
+        expected = self._read_content(InstructionRecordingMode.DICTIONARY)[
+            "Instructions"
+        ]
+        actual = self._read_content(InstructionRecordingMode.COMPACT)["Instructions"]
+        self.assertIsInstance(actual, CanvasInstructionList)
+        self.assertEqual(len(actual), 9)
+        self.assertEqual(len(actual), len(expected))
+        for i, d in enumerate(actual):
+            self.assertEqual(d["Name"], expected[i]["Name"])
+            self.assertEqual(list(d["Args"]), list(expected[i]["Args"]))
+            self.assertEqual(actual.get_name(i), expected[i]["Name"])
+        self.assertEqual(actual.get_operands(1), [1, 0, 0, 1, 10, 20])
+        self.assertEqual(actual[-1]["Name"], "Q")
+        self.assertEqual(actual.get_operands(-1), [])
+        with self.assertRaises(IndexError):
+            actual[9]
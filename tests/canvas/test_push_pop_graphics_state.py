@@ -0,0 +1,44 @@
+import io
+import unittest
+
+from ptext.pdf.canvas.canvas import Canvas
+from ptext.pdf.canvas.canvas_instruction_list import InstructionRecordingMode
+from ptext.pdf.pdf import PDF
+from tests.test import build_document_bytes
+
+
+class TestPushPopGraphicsState(unittest.TestCase):
+    """
+    This test checks whether Q restores the graphics state saved by q,
+    while q shares (rather than copies) the Font of the graphics state.
+    """
+
+    def setUp(self) -> None:
+        self.page = PDF.loads(io.BytesIO(build_document_bytes(1))).get_page(0)
+        self.canvas = Canvas(instruction_recording_mode=InstructionRecordingMode.NONE)
+        self.canvas.set_parent(self.page)  # type: ignore [attr-defined]
+
+    def test_push_shares_font(self):
+        self.canvas.read(io.BytesIO(b"BT /F1 12 Tf q"))
+        font = self.canvas.graphics_state.font
+        self.assertIs(self.canvas.graphics_state_stack[-1].font, font)
+
+    def test_pop_restores_graphics_state(self):
+        self.canvas.read(
+            io.BytesIO(
+                b"1 0 0 1 10 20 cm 1 0 0 rg BT /F1 12 Tf 72 712 Td "
+                b"q 2 0 0 2 5 5 cm 0 0 1 rg 3 Tc /F1 24 Tf (Hello) Tj Q"
+            )
+        )
+        gs = self.canvas.graphics_state
+        self.assertEqual(len(self.canvas.graphics_state_stack), 0)
+        self.assertEqual(gs.ctm[2][0], 10)
+        self.assertEqual(gs.ctm[2][1], 20)
+        self.assertEqual(gs.ctm[0][0], 1)
+        self.assertEqual(gs.non_stroke_color.to_rgb().red, 1)
+        self.assertEqual(gs.character_spacing, 0)
+        self.assertEqual(gs.font_size, 12)
+
+        # showing text (in between q and Q) does not move the saved text matrix
+        self.assertEqual(gs.text_matrix[2][0], 72)
+        self.assertEqual(gs.text_matrix[2][1], 712)
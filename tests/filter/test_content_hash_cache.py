@@ -0,0 +1,231 @@
+import io
+import os
+import pickle
+import tempfile
+import threading
+import time
+import typing
+import unittest
+import zlib
+
+from ptext.functionality.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.content_hash_cache import ContentHashCache
+from ptext.io.filter.stream_decode_util import decode_stream_bytes
+from ptext.io.read_transform.types import (
+    Decimal,
+    Dictionary,
+    List,
+    Name,
+    Reference,
+    Stream,
+)
+from ptext.pdf.pdf import PDF
+
+
+def _build_document_bytes(number_of_codes: int = 100) -> bytes:
+    # a single Page, showing "Hi!" in a Type0 font,
+    # with a (Flate) ToUnicode CMAP and a CIDFontType2 (with a W array),
+    # both covering number_of_codes character codes
+    cmap = zlib.compress(
+        b"/CIDInit /ProcSet findresource begin\n12 dict begin\nbegincmap\n"
+        b"/CMapName /Adobe-Identity-UCS def\n/CMapType 2 def\n"
+        b"1 begincodespacerange\n<0000> <FFFF>\nendcodespacerange\n"
+        b"%d beginbfchar\n<0001> <0048>\n<0002> <0069>\n<0003> <0021>\n%s"
+        b"endbfchar\nendcmap\n"
+        b"CMapName currentdict /CIDInit /ProcSet findresource pop end end\n"
+        % (
+            number_of_codes,
+            b"".join(
+                [
+                    b"<%04X> <%04X>\n" % (i, 0x4E00 + i)
+                    for i in range(4, number_of_codes + 1)
+                ]
+            ),
+        )
+    )
+    content = b"BT /F1 12 Tf 72 712 Td <000100020003> Tj ET"
+    objects: typing.List[bytes] = [
+        b"<</Type /Catalog /Pages 2 0 R>>",
+        b"<</Type /Pages /Kids [3 0 R] /Count 1>>",
+        b"<</Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+        b"/Resources <</Font <</F1 4 0 R>>>> /Contents 7 0 R>>",
+        b"<</Type /Font /Subtype /Type0 /BaseFont /Foo /Encoding /Identity-H "
+        b"/DescendantFonts [5 0 R] /ToUnicode 6 0 R>>",
+        b"<</Type /Font /Subtype /CIDFontType2 /BaseFont /Foo "
+        b"/CIDSystemInfo <</Registry (Adobe) /Ordering (Identity) /Supplement 0>> "
+        b"/DW 1000 /W [1 [722 556] 3 %d 333]>>" % number_of_codes,
+        b"<</Filter /FlateDecode /Length %d>>\nstream\n%s\nendstream"
+        % (len(cmap), cmap),
+        b"<</Length %d>>\nstream\n%s\nendstream" % (len(content), content),
+    ]
+
+    # write
+    out = b"%PDF-1.7\n"
+    byte_offsets = []
+    for i, obj in enumerate(objects):
+        byte_offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (i + 1, obj)
+    startxref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f\r\n" % (len(objects) + 1)
+    out += b"".join([b"%010d 00000 n\r\n" % x for x in byte_offsets])
+    out += b"trailer\n<</Size %d /Root 1 0 R>>\n" % (len(objects) + 1)
+    out += b"startxref\n%d\n%%%%EOF" % startxref
+    return out
+
+
+class TestContentHashCache(unittest.TestCase):
+    """
+    This test checks whether a (process) ContentHashCache keeps DecodedBytes, CMaps and width tables
+    by the hash of their content, reusing them across Stream objects and documents,
+    whether it evicts entries (least recently used first) once its budget is exceeded,
+    and whether entries can be read back from its directory.
+    """
+
+    def setUp(self) -> None:
+        self.previous_cache = ContentHashCache.get_process_cache()
+
+    def tearDown(self) -> None:
+        ContentHashCache.set_process_cache(self.previous_cache)
+
+    def _build_stream(self, content: bytes, level: int = 6) -> Stream:
+        s = Stream()
+        s[Name("Filter")] = Name("FlateDecode")
+        s[Name("Bytes")] = zlib.compress(content, level)
+        s[Name("Length")] = Decimal(len(s["Bytes"]))
+        return s
+
+    def test_decode_stream_bytes(self):
+        cache = ContentHashCache(1024)
+        ContentHashCache.set_process_cache(cache)
+        self.assertEqual(decode_stream_bytes(self._build_stream(b"Hello")), b"Hello")
+        self.assertEqual(decode_stream_bytes(self._build_stream(b"Hello")), b"Hello")
+        self.assertEqual(cache.number_of_misses, 1)
+        self.assertEqual(cache.number_of_hits, 1)
+        self.assertEqual(cache.get_hit_rate("DecodedBytes"), 0.5)
+
+        # the same content, compressed differently, is different content
+        decode_stream_bytes(self._build_stream(b"Hello", 1))
+        self.assertEqual(cache.number_of_misses, 2)
+
+        # the same Bytes, with different DecodeParms, are different content
+        s = self._build_stream(b"Hello")
+        s[Name("DecodeParms")] = Dictionary()
+        s["DecodeParms"][Name("Predictor")] = Decimal(1)
+        decode_stream_bytes(s)
+        self.assertEqual(cache.number_of_misses, 3)
+
+    def test_do_not_cache_unhashable_content(self):
+        cache = ContentHashCache(1024)
+        ContentHashCache.set_process_cache(cache)
+
+        # DecodeParms holding a Stream can not be hashed (only by its class), and are not cached
+        for content in [b"Hello", b"World"]:
+            s = self._build_stream(b"Hello")
+            s[Name("DecodeParms")] = Dictionary()
+            s["DecodeParms"][Name("JBIG2Globals")] = self._build_stream(content)
+            self.assertIsNone(ContentHashCache.get_stream_key("DecodedBytes", s))
+            self.assertEqual(decode_stream_bytes(s), b"Hello")
+        self.assertEqual(cache.number_of_hits, 0)
+        self.assertEqual(cache.number_of_misses, 0)
+        self.assertEqual(cache.size_in_bytes, 0)
+
+        # the same goes for a (W) List holding a Reference
+        w = List()
+        w.append(Decimal(1))
+        w.append(Reference(object_number=10))
+        self.assertIsNone(ContentHashCache.get_object_key("Widths", w))
+        w[1] = List()
+        w[1].append(Decimal(722))
+        self.assertIsNotNone(ContentHashCache.get_object_key("Widths", w))
+
+    def test_evict_least_recently_used(self):
+        cache = ContentHashCache(250)
+        ContentHashCache.set_process_cache(cache)
+        for i in range(0, 3):
+            decode_stream_bytes(self._build_stream(bytes([65 + i]) * 100))
+        self.assertEqual(cache.number_of_evictions, 1)
+        self.assertLessEqual(cache.size_in_bytes, 250)
+
+        # the first Stream was evicted, and is decoded again
+        decode_stream_bytes(self._build_stream(b"A" * 100))
+        self.assertEqual(cache.number_of_misses, 4)
+        decode_stream_bytes(self._build_stream(b"C" * 100))
+        self.assertEqual(cache.number_of_hits, 1)
+
+    def test_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            ContentHashCache.set_process_cache(ContentHashCache(directory=directory))
+            decode_stream_bytes(self._build_stream(b"Hello"))
+
+            # another (empty) ContentHashCache, sharing the same directory
+            cache = ContentHashCache(directory=directory)
+            ContentHashCache.set_process_cache(cache)
+            self.assertEqual(decode_stream_bytes(self._build_stream(b"Hello")), b"Hello")
+            decode_stream_bytes(self._build_stream(b"Hello"))
+            self.assertEqual(cache.number_of_misses, 0)
+            self.assertEqual(cache.number_of_disk_hits, 1)
+            self.assertEqual(cache.number_of_hits, 2)
+
+    def test_directory_with_bad_entries(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ContentHashCache(directory=directory)
+            ContentHashCache.set_process_cache(cache)
+            s = self._build_stream(b"Hello")
+            key = ContentHashCache.get_stream_key("DecodedBytes", s)
+            path = os.path.join(directory, "%s-%s.pickle" % key)
+
+            # entries that can not be unpickled (or are not entries) are a miss, and removed
+            for bts in [
+                b"",
+                b"not a pickle",
+                pickle.dumps((b"Hello", 5))[0:-3],
+                b"cno_such_module\nNoSuchClass\n.",
+                b"cptext.io.content_hash_cache\nNoSuchClass\n.",
+                pickle.dumps("Hello"),
+                pickle.dumps((None, 5)),
+            ]:
+                with open(path, "wb") as fh:
+                    fh.write(bts)
+                cache.clear()
+                self.assertIsNone(cache.get(key))
+                self.assertFalse(os.path.exists(path))
+
+            # an entry that can not be pickled is only kept in memory
+            cache.put(key, threading.Lock(), 10)
+            self.assertEqual(os.listdir(directory), [])
+            self.assertIsNotNone(cache.get(key))
+
+    def test_read_documents(self):
+        bts = _build_document_bytes()
+        cache = ContentHashCache()
+        ContentHashCache.set_process_cache(cache)
+        for _ in range(0, 3):
+            l = SimpleTextExtraction()
+            doc = PDF.loads(io.BytesIO(bts), [l])
+            self.assertEqual(l.get_text(0), "Hi!")
+            font = doc.get_page(0)["Resources"]["Font"]["F1"]
+            self.assertEqual(
+                font.get_descendant_font().get_single_character_width(2), 556
+            )
+            self.assertEqual(
+                font.get_descendant_font().get_single_character_width(100), 333
+            )
+
+        # the ToUnicode CMAP is decoded and parsed once, the width table is built once
+        self.assertEqual(cache.get_hit_rate("CMap"), 2 / 3)
+        self.assertEqual(cache.get_hit_rate("Widths"), 2 / 3)
+
+    def test_benchmark_read_documents(self):
+        bts = _build_document_bytes(5000)
+        t0 = time.time()
+        for _ in range(0, 20):
+            PDF.loads(io.BytesIO(bts), [SimpleTextExtraction()])
+        t1 = time.time()
+        ContentHashCache.set_process_cache(ContentHashCache())
+        for _ in range(0, 20):
+            PDF.loads(io.BytesIO(bts), [SimpleTextExtraction()])
+        t2 = time.time()
+        print(
+            "reading a document (with a ToUnicode CMAP of 5000 codes) 20 times "
+            "took %f seconds, %f seconds using a ContentHashCache" % (t1 - t0, t2 - t1)
+        )
@@ -0,0 +1,186 @@
+import base64
+import io
+import random
+import time
+import typing
+import unittest
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from ptext.exception.pdf_exception import PDFValueError
+from ptext.functionality.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.filter.decoded_bytes_cache import DecodedBytesCache
+from ptext.io.filter.stream_decode_util import decode_stream
+from ptext.io.read_transform.types import Decimal, List, Name, Stream
+from ptext.pdf.pdf import PDF
+
+
+def _build_document_bytes(
+    number_of_fragments: int, number_of_images: int, image_size: int
+) -> bytes:
+    # a single Page, its Contents are number_of_fragments (Flate) Stream objects,
+    # each showing a line of text and drawing one of the (Flate) RGB images
+    r = random.Random(0)
+    objects: typing.List[bytes] = []
+
+    def add_stream(dictionary: bytes, bts: bytes) -> int:
+        bts = zlib.compress(bts)
+        objects.append(
+            b"<<%s /Filter /FlateDecode /Length %d>>\nstream\n%s\nendstream"
+            % (dictionary, len(bts), bts)
+        )
+        return len(objects)
+
+    objects.append(b"<</Type /Catalog /Pages 2 0 R>>")
+    objects.append(b"<</Type /Pages /Kids [3 0 R] /Count 1>>")
+    objects.append(b"")
+    objects.append(
+        b"<</Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+        b"/Encoding /WinAnsiEncoding>>"
+    )
+
+    # images (a noisy gradient, which compresses somewhat)
+    images: typing.List[int] = []
+    for i in range(0, number_of_images):
+        row = bytes([(x + i) % 256 for x in range(0, image_size * 3)])
+        noise = bytes([r.randrange(4) for _ in range(0, image_size * 3)])
+        pixels = bytes([(a + b) % 256 for a, b in zip(row, noise)]) * image_size
+        images.append(
+            add_stream(
+                b"/Type /XObject /Subtype /Image /Width %d /Height %d "
+                b"/ColorSpace /DeviceRGB /BitsPerComponent 8"
+                % (image_size, image_size),
+                pixels,
+            )
+        )
+
+    # content fragments
+    fragments: typing.List[int] = []
+    for i in range(0, number_of_fragments):
+        image = b""
+        if number_of_images > 0:
+            image = b"q 10 0 0 10 500 %d cm /Im%d Do Q " % (
+                800 - 12 * i,
+                i % number_of_images,
+            )
+        fragments.append(
+            add_stream(
+                b"",
+                image
+                + b"BT /F1 10 Tf 72 %d Td (Line %d) Tj ET" % (800 - 12 * i, i + 1),
+            )
+        )
+
+    objects[2] = (
+        b"<</Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+        b"/Resources <</Font <</F1 4 0 R>> /XObject <<%s>>>> /Contents [%s]>>"
+        % (
+            b" ".join([b"/Im%d %d 0 R" % (i, x) for i, x in enumerate(images)]),
+            b" ".join([b"%d 0 R" % x for x in fragments]),
+        )
+    )
+
+    # write
+    out = b"%PDF-1.7\n"
+    byte_offsets = []
+    for i, obj in enumerate(objects):
+        byte_offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (i + 1, obj)
+    startxref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f\r\n" % (len(objects) + 1)
+    out += b"".join([b"%010d 00000 n\r\n" % x for x in byte_offsets])
+    out += b"trailer\n<</Size %d /Root 1 0 R>>\n" % (len(objects) + 1)
+    out += b"startxref\n%d\n%%%%EOF" % startxref
+    return out
+
+
+class TestDecodeExecutor(unittest.TestCase):
+    """
+    This test checks whether Stream objects (with a FlateDecode filter) can be decoded by a decode executor,
+    are joined when their DecodedBytes are first accessed,
+    and whether a Document read that way is the same as one read without a decode executor.
+    """
+
+    def _build_stream(self, filters: list, bts: bytes) -> Stream:
+        s = Stream()
+        s[Name("Filter")] = List()
+        for f in filters:
+            s["Filter"].append(Name(f))
+        s[Name("Bytes")] = bts
+        s[Name("Length")] = Decimal(len(bts))
+        return s
+
+    def test_decode_stream_with_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            s = self._build_stream(["FlateDecode"], zlib.compress(b"abc" * 1000))
+            decode_stream(s, decode_executor=executor)
+            self.assertIsInstance(getattr(s, "_decoded_bytes_future"), Future)
+            self.assertIn("DecodedBytes", s)
+            self.assertEqual(s["DecodedBytes"], b"abc" * 1000)
+            self.assertIsNone(getattr(s, "_decoded_bytes_future"))
+
+            # Stream objects without a FlateDecode filter are decoded as usual
+            s = self._build_stream(
+                ["ASCII85Decode"], base64.a85encode(b"abc") + b"~>"
+            )
+            decode_stream(s, decode_executor=executor)
+            self.assertIsNone(getattr(s, "_decoded_bytes_future"))
+            self.assertEqual(s["DecodedBytes"], b"abc")
+
+    def test_decode_stream_with_executor_raises_on_join(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            s = self._build_stream(["FlateDecode"], zlib.compress(bytes(4096)))
+            decode_stream(s, max_decoded_size=1024, decode_executor=executor)
+            for _ in range(0, 2):
+                with self.assertRaises(PDFValueError):
+                    s["DecodedBytes"]
+
+    def test_decode_executor_and_decoded_bytes_cache_are_exclusive(self):
+        bts = _build_document_bytes(2, 1, 8)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            s = self._build_stream(["FlateDecode"], zlib.compress(b"abc"))
+            with self.assertRaises(AssertionError):
+                decode_stream(
+                    s, decoded_bytes_cache=DecodedBytesCache(), decode_executor=executor
+                )
+            with self.assertRaises(AssertionError):
+                PDF.loads(
+                    io.BytesIO(bts),
+                    decoded_bytes_cache=DecodedBytesCache(),
+                    decode_executor=executor,
+                )
+
+    def test_read_document_with_executor(self):
+        bts = _build_document_bytes(20, 2, 64)
+
+        l0 = SimpleTextExtraction()
+        doc = PDF.loads(io.BytesIO(bts), [l0])
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for lazy in [False, True]:
+                l1 = SimpleTextExtraction()
+                doc_with_executor = PDF.loads(
+                    io.BytesIO(bts), [l1], lazy=lazy, decode_executor=executor
+                )
+                doc_with_executor.get_page(0)
+                self.assertEqual(l0.get_text(0), l1.get_text(0))
+                self.assertEqual(
+                    doc.get_page(0)["Resources"]["XObject"]["Im1"]["DecodedBytes"],
+                    doc_with_executor.get_page(0)["Resources"]["XObject"]["Im1"][
+                        "DecodedBytes"
+                    ],
+                )
+        self.assertIn("Line 20", l0.get_text(0))
+
+    def test_benchmark_read_document_with_executor(self):
+        bts = _build_document_bytes(40, 8, 1000)
+
+        t0 = time.time()
+        PDF.loads(io.BytesIO(bts))
+        t1 = time.time()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            PDF.loads(io.BytesIO(bts), decode_executor=executor)
+        t2 = time.time()
+        print(
+            "reading a page (40 content fragments, 8 images of 3MB) took %f seconds, "
+            "%f seconds using a ThreadPoolExecutor" % (t1 - t0, t2 - t1)
+        )
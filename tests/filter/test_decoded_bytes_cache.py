@@ -0,0 +1,116 @@
+import copy
+import gc
+import io
+import unittest
+import zlib
+
+from ptext.functionality.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.filter.decoded_bytes_cache import DecodedBytesCache
+from ptext.io.filter.stream_decode_util import decode_stream
+from ptext.io.read_transform.types import Stream, Name, Decimal
+from ptext.pdf.pdf import PDF
+from tests.test import build_document_bytes
+
+
+class TestDecodedBytesCache(unittest.TestCase):
+    """
+    This test checks whether Stream objects linked to a DecodedBytesCache
+    are decoded on demand, evicted (least recently used first) once the budget is exceeded,
+    and decoded again after having been evicted.
+    It also checks whether the DecodedBytes of a Stream are discarded once the Stream is garbage collected.
+    """
+
+    def _build_stream(self, content: bytes) -> Stream:
+        s = Stream()
+        s[Name("Filter")] = Name("FlateDecode")
+        s[Name("Bytes")] = zlib.compress(content)
+        s[Name("Length")] = Decimal(len(s["Bytes"]))
+        return s
+
+    def test_decode_stream_on_demand(self):
+        cache = DecodedBytesCache(1024)
+        s = decode_stream(self._build_stream(b"Hello World"), cache)
+        self.assertEqual(cache.number_of_misses, 0)
+        self.assertTrue("DecodedBytes" in s)
+        self.assertEqual(s["DecodedBytes"], b"Hello World")
+        self.assertEqual(s["DecodedBytes"], b"Hello World")
+        self.assertEqual(cache.number_of_misses, 1)
+        self.assertEqual(cache.number_of_hits, 1)
+        self.assertEqual(s["Type"], "Stream")
+
+    def test_evict_least_recently_used(self):
+        cache = DecodedBytesCache(250)
+        streams = [
+            decode_stream(self._build_stream(bytes([65 + i]) * 100), cache)
+            for i in range(0, 3)
+        ]
+        for s in streams:
+            self.assertEqual(len(s["DecodedBytes"]), 100)
+        self.assertEqual(cache.number_of_evictions, 1)
+        self.assertLessEqual(cache.size_in_bytes, 250)
+
+        # the first Stream was evicted, and is decoded again
+        self.assertEqual(streams[0]["DecodedBytes"], b"A" * 100)
+        self.assertEqual(cache.number_of_misses, 4)
+        self.assertEqual(streams[2]["DecodedBytes"], b"C" * 100)
+        self.assertEqual(cache.number_of_hits, 1)
+
+    def test_copy_stream_shares_cache(self):
+        cache = DecodedBytesCache(1024)
+        s = decode_stream(self._build_stream(b"Hello World"), cache)
+        s_copy = copy.deepcopy(s)
+        self.assertEqual(s_copy["DecodedBytes"], b"Hello World")
+        self.assertIs(getattr(s_copy, "_decoded_bytes_cache"), cache)
+
+    def test_discard_when_stream_is_collected(self):
+        cache = DecodedBytesCache(1024)
+        s0 = decode_stream(self._build_stream(b"A" * 100), cache)
+        s1 = decode_stream(self._build_stream(b"B" * 100), cache)
+        s1_copy = copy.deepcopy(s1)
+        for s in [s0, s1, s1_copy]:
+            self.assertEqual(len(s["DecodedBytes"]), 100)
+        self.assertEqual(cache.size_in_bytes, 300)
+
+        # the DecodedBytes of a collected Stream no longer count against the budget
+        del s, s0
+        gc.collect()
+        self.assertEqual(cache.size_in_bytes, 200)
+        del s1
+        gc.collect()
+        self.assertEqual(cache.size_in_bytes, 100)
+        self.assertEqual(s1_copy["DecodedBytes"], b"B" * 100)
+        self.assertEqual(cache.number_of_evictions, 0)
+
+    def test_discard_when_document_is_collected(self):
+        bts = build_document_bytes(10)
+        cache = DecodedBytesCache()
+        doc = PDF.loads(
+            io.BytesIO(bts), [SimpleTextExtraction()], decoded_bytes_cache=cache
+        )
+        for i in range(0, 10):
+            doc.get_page(i)["Contents"]["DecodedBytes"]
+        self.assertGreater(cache.size_in_bytes, 0)
+        del doc
+        gc.collect()
+        self.assertEqual(cache.size_in_bytes, 0)
+
+    def test_extract_text_using_decoded_bytes_cache(self):
+        bts = build_document_bytes(20)
+
+        l0 = SimpleTextExtraction()
+        doc0 = PDF.loads(io.BytesIO(bts), [l0])
+
+        # a budget of 0 bytes evicts everything right away
+        cache = DecodedBytesCache(0)
+        l1 = SimpleTextExtraction()
+        doc = PDF.loads(io.BytesIO(bts), [l1], decoded_bytes_cache=cache)
+        for i in range(0, 20):
+            self.assertEqual(l0.get_text(i), l1.get_text(i))
+        self.assertEqual(cache.size_in_bytes, 0)
+        self.assertGreaterEqual(cache.number_of_misses, 20)
+
+        # page contents can still be read
+        self.assertEqual(
+            doc.get_page(3)["Contents"]["DecodedBytes"],
+            doc0.get_page(3)["Contents"]["DecodedBytes"],
+        )
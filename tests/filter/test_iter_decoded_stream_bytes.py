@@ -0,0 +1,140 @@
+import base64
+import io
+import random
+import unittest
+import zlib
+
+from ptext.exception.pdf_exception import PDFValueError
+from ptext.functionality.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.filter.decoded_stream_reader import DecodedStreamReader
+from ptext.io.filter.flate_decode import FlateDecode
+from ptext.io.filter.stream_decode_util import (
+    decode_stream,
+    decode_stream_bytes,
+    iter_decoded_stream_bytes,
+    open_decoded_stream,
+)
+from ptext.io.read_transform.types import Decimal, Dictionary, List, Name, Stream
+from ptext.pdf.canvas.canvas import Canvas
+from ptext.pdf.pdf import PDF
+from tests.test import build_document_bytes
+
+
+class TestIterDecodedStreamBytes(unittest.TestCase):
+    """
+    This test checks whether decoding a Stream in chunks yields the same bytes as decoding it all at once,
+    whether the size of the decoded bytes can be limited (to guard against decompression bombs),
+    and whether a Canvas can read from a DecodedStreamReader.
+    """
+
+    def setUp(self) -> None:
+        r = random.Random(0)
+        self.content = bytes([r.randrange(256) for _ in range(0, 20000)])
+
+    def _build_stream(self, filters: list, bts: bytes, decode_parms=None) -> Stream:
+        s = Stream()
+        s[Name("Filter")] = List()
+        for f in filters:
+            s["Filter"].append(Name(f))
+        if decode_parms is not None:
+            s[Name("DecodeParms")] = decode_parms
+        s[Name("Bytes")] = bts
+        s[Name("Length")] = Decimal(len(bts))
+        return s
+
+    def _assert_decoded_in_chunks(self, s: Stream, expected_bytes: bytes):
+        for chunk_size in [1, 7, 100, 64 * 1024]:
+            chunks = [x for x in iter_decoded_stream_bytes(s, chunk_size=chunk_size)]
+            self.assertEqual(b"".join(chunks), expected_bytes)
+        self.assertEqual(decode_stream_bytes(s), expected_bytes)
+
+    def test_flate_decode(self):
+        s = self._build_stream(["FlateDecode"], zlib.compress(self.content))
+        self._assert_decoded_in_chunks(s, self.content)
+
+        # the decoded chunks are not larger than chunk_size
+        self.assertLessEqual(
+            max([len(x) for x in iter_decoded_stream_bytes(s, chunk_size=1000)]), 1000
+        )
+
+    def test_flate_decode_with_predictor(self):
+        # 100 rows of 50 (3 byte) pixels, each row preceded by 2 (PNG_FILTER_UP)
+        bts = b"".join(
+            [b"\x02" + self.content[i : i + 150] for i in range(0, 15000, 150)]
+        )
+        decode_parms = Dictionary()
+        decode_parms[Name("Predictor")] = Decimal(12)
+        decode_parms[Name("Colors")] = Decimal(3)
+        decode_parms[Name("Columns")] = Decimal(50)
+        s = self._build_stream(["FlateDecode"], zlib.compress(bts), decode_parms)
+        expected_bytes = FlateDecode.decode(
+            zlib.compress(bts), predictor=12, colors=3, columns=50
+        )
+        self._assert_decoded_in_chunks(s, expected_bytes)
+        self.assertEqual(len(expected_bytes), 15000)
+
+    def test_ascii85_and_flate_decode(self):
+        bts = base64.a85encode(zlib.compress(self.content), wrapcol=80) + b"~>"
+        s = self._build_stream(["ASCII85Decode", "FlateDecode"], bts)
+        self._assert_decoded_in_chunks(s, self.content)
+
+    def test_ascii85_decode_with_zeros(self):
+        bts = base64.a85encode(b"\x00" * 12 + self.content[0:13]) + b"~>"
+        self.assertIn(b"z", bts)
+        s = self._build_stream(["ASCII85Decode"], bts)
+        self._assert_decoded_in_chunks(s, b"\x00" * 12 + self.content[0:13])
+
+    def test_max_decoded_size(self):
+        s = self._build_stream(["FlateDecode"], zlib.compress(bytes(1024 * 1024)))
+        with self.assertRaises(PDFValueError):
+            for _ in iter_decoded_stream_bytes(s, 1024, max_decoded_size=64 * 1024):
+                pass
+        self.assertEqual(
+            len(decode_stream_bytes(s, max_decoded_size=1024 * 1024)), 1024 * 1024
+        )
+
+        # max_decoded_size is kept by the Stream
+        s = self._build_stream(["FlateDecode"], zlib.compress(bytes(1024 * 1024)))
+        with self.assertRaises(PDFValueError):
+            decode_stream(s, max_decoded_size=1024)
+
+    def test_read_document_with_max_decoded_stream_size(self):
+        bts = build_document_bytes(2)
+        doc = PDF.loads(io.BytesIO(bts), max_decoded_stream_size=1024)
+        self.assertEqual(doc.get_document_info().get_number_of_pages(), 2)
+        self.assertEqual(
+            getattr(doc.get_page(0)["Contents"], "_max_decoded_size"), 1024
+        )
+
+    def test_decoded_stream_reader(self):
+        reader = DecodedStreamReader(iter([b"abc", b"", b"defg", b"h"]))
+        self.assertFalse(reader.seekable())
+        self.assertEqual(reader.read(2), b"ab")
+        self.assertEqual(reader.read(3), b"c")
+        self.assertEqual(reader.tell(), 3)
+        self.assertEqual(reader.read(), b"defgh")
+        self.assertEqual(reader.read(), b"")
+
+    def test_open_decoded_stream_list(self):
+        contents = List()
+        contents.append(
+            self._build_stream(
+                ["FlateDecode"], zlib.compress(b"BT /F1 12 Tf 72 712 Td (Hello")
+            )
+        )
+        contents.append(
+            self._build_stream(["FlateDecode"], zlib.compress(b"World) Tj ET"))
+        )
+        reader = open_decoded_stream(contents)
+        self.assertIsInstance(reader, DecodedStreamReader)
+        self.assertEqual(reader.read(), b"BT /F1 12 Tf 72 712 Td (Hello World) Tj ET ")
+
+    def test_canvas_reads_decoded_stream_reader(self):
+        s = self._build_stream(["FlateDecode"], zlib.compress(b"q 1 0 0 1 72 72 cm Q"))
+        canvas = Canvas().read(open_decoded_stream(s))
+        self.assertEqual([x["Name"] for x in canvas["Instructions"]], ["q", "cm", "Q"])
+
+        # a Page reads its Contents through open_decoded_stream
+        l = SimpleTextExtraction()
+        PDF.loads(io.BytesIO(build_document_bytes(1)), [l])
+        self.assertEqual(l.get_text(0), "Page 1")
@@ -0,0 +1,110 @@
+import random
+import time
+import unittest
+
+from ptext.exception.pdf_exception import PDFSyntaxError
+from ptext.io.filter.lzw_decode import LZWDecode
+from ptext.io.filter.stream_decode_util import decode_stream_bytes
+from ptext.io.read_transform.types import Decimal, Dictionary, Name, Stream
+
+
+def _lzw_encode(bytes_in: bytes, early_change: int = 1) -> bytes:
+    # reference implementation of an LZW encoder (as described in the PDF specification)
+    codes: list = []
+    code_lengths: list = []
+
+    def write(code: int, number_of_entries_in_decoder: int) -> None:
+        codes.append(code)
+        code_lengths.append(
+            min(12, max(9, (number_of_entries_in_decoder + early_change).bit_length()))
+        )
+
+    table: dict = {}
+    next_code: int = 258
+    w: bytes = b""
+    write(256, 258)
+    for b in bytes_in:
+        wc = w + bytes([b])
+        if len(wc) == 1 or wc in table:
+            w = wc
+            continue
+        # the decoder adds an entry for every code (but the first) after a ClearTable
+        write(table.get(w, w[0]), max(258, next_code - 1))
+        table[wc] = next_code
+        next_code += 1
+        w = bytes([b])
+        if next_code == 4095:
+            write(256, next_code - 1)
+            table = {}
+            next_code = 258
+    if len(w) > 0:
+        write(table.get(w, w[0]), max(258, next_code - 1))
+        next_code += 1
+    write(257, max(258, next_code - 1))
+
+    # pack codes (most significant bit first)
+    bits = "".join(["{0:0{1}b}".format(c, n) for c, n in zip(codes, code_lengths)])
+    bits += "0" * (-len(bits) % 8)
+    return int(bits, 2).to_bytes(len(bits) // 8, "big")
+
+
+class TestLZWDecode(unittest.TestCase):
+    """
+    This test checks whether LZWDecode decodes variable-width (9 to 12 bit) codes,
+    ClearTable and EOD codes, with and without EarlyChange, by comparing against a reference encoder.
+    """
+
+    def setUp(self) -> None:
+        r = random.Random(0)
+        words = [b"lorem", b"ipsum", b"dolor", b"sit", b"amet", b"\n", b"0 0 1 rg"]
+        self.text = b" ".join([r.choice(words) for _ in range(0, 20000)])
+        self.binary = bytes([r.randrange(256) for _ in range(0, 10000)])
+
+    def test_decode_example_from_specification(self):
+        # PDF specification, 7.4.4.2 "Details of LZW Encoding"
+        bytes_in = bytes.fromhex("800B6050220C0C8501")
+        self.assertEqual(LZWDecode.decode(bytes_in), b"-----A---B")
+        self.assertEqual(_lzw_encode(b"-----A---B"), bytes_in)
+
+    def test_decode(self):
+        for bytes_in in [b"a", b"aaaaaaaaaa", self.text, self.binary]:
+            for early_change in [0, 1]:
+                bytes_out = LZWDecode.decode(
+                    _lzw_encode(bytes_in, early_change), early_change
+                )
+                self.assertEqual(bytes_out, bytes_in)
+
+    def test_decode_chunks(self):
+        bytes_in = _lzw_encode(self.text)
+        for chunk_size in [1, 3, 1000]:
+            chunks = [
+                bytes_in[i : i + chunk_size]
+                for i in range(0, len(bytes_in), chunk_size)
+            ]
+            self.assertEqual(b"".join(LZWDecode.decode_chunks(chunks)), self.text)
+
+    def test_decode_stream_with_early_change(self):
+        s = Stream()
+        s[Name("Filter")] = Name("LZWDecode")
+        s[Name("DecodeParms")] = Dictionary()
+        s["DecodeParms"][Name("EarlyChange")] = Decimal(0)
+        s[Name("Bytes")] = _lzw_encode(self.text, early_change=0)
+        s[Name("Length")] = Decimal(len(s["Bytes"]))
+        self.assertEqual(decode_stream_bytes(s), self.text)
+
+    def test_decode_malformed_bytes(self):
+        # the first code after ClearTable can not refer to the string table
+        with self.assertRaises(PDFSyntaxError):
+            LZWDecode.decode(bytes.fromhex("804080"))
+
+    def test_benchmark_lzw_decode(self):
+        for name, bytes_in in [("text", self.text * 8), ("binary", self.binary * 8)]:
+            bytes_encoded = _lzw_encode(bytes_in)
+            before = time.time()
+            bytes_out = LZWDecode.decode(bytes_encoded)
+            delta = time.time() - before
+            print(
+                "%s, %d bytes, decoded at %f MB/s"
+                % (name, len(bytes_out), len(bytes_out) / max(delta, 1e-9) / 1e6)
+            )
+            self.assertEqual(bytes_out, bytes_in)
@@ -0,0 +1,303 @@
+import random
+import time
+import unittest
+import zlib
+
+from ptext.io.filter import predictor as predictor_module
+from ptext.io.filter.flate_decode import FlateDecode
+from ptext.io.filter.predictor import Predictor
+
+
+def _paeth(a: int, b: int, c: int) -> int:
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    if pb <= pc:
+        return b
+    return c
+
+
+def _png_encode(rows: list, filter_type: int, bytes_per_pixel: int) -> bytes:
+    # reference (byte by byte) implementation of the PNG filters
+    out = bytearray()
+    prior = bytes(len(rows[0]))
+    for row in rows:
+        out.append(filter_type)
+        for i in range(0, len(row)):
+            a = row[i - bytes_per_pixel] if i >= bytes_per_pixel else 0
+            b = prior[i]
+            c = prior[i - bytes_per_pixel] if i >= bytes_per_pixel else 0
+            predicted = [0, a, b, (a + b) // 2, _paeth(a, b, c)][filter_type]
+            out.append((row[i] - predicted) % 256)
+        prior = row
+    return bytes(out)
+
+
+def _tiff_encode(samples: list, colors: int, bits_per_component: int) -> list:
+    # reference implementation of TIFF predictor 2 (on a single row of samples)
+    modulus = 1 << bits_per_component
+    return [
+        (samples[i] - (samples[i - colors] if i >= colors else 0)) % modulus
+        for i in range(0, len(samples))
+    ]
+
+
+def _pack(samples: list, bits_per_component: int) -> bytes:
+    if bits_per_component == 16:
+        return b"".join([s.to_bytes(2, "big") for s in samples])
+    out = bytearray((len(samples) * bits_per_component + 7) // 8)
+    for i, s in enumerate(samples):
+        bit = i * bits_per_component
+        out[bit // 8] |= s << (8 - bits_per_component - bit % 8)
+    return bytes(out)
+
+
+class TestPredictor(unittest.TestCase):
+    """
+    This test checks whether Predictor undoes the PNG filters (None, Sub, Up, Average and Paeth)
+    and the TIFF predictor (for 1 to 16 bits per component, and any number of colors),
+    comparing against a reference encoder, both with and without numpy.
+    It also benchmarks Predictor and FlateDecode (with a Predictor) on a larger image.
+    """
+
+    def setUp(self) -> None:
+        self.random = random.Random(0)
+
+    def _random_rows(self, number_of_rows: int, bytes_per_row: int) -> list:
+        return [
+            bytes([self.random.randrange(256) for _ in range(0, bytes_per_row)])
+            for _ in range(0, number_of_rows)
+        ]
+
+    def test_decode_png_filters(self):
+        for colors, bits_per_component, columns in [
+            (1, 8, 17),
+            (3, 8, 11),
+            (4, 8, 5),
+            (1, 1, 21),
+            (3, 4, 5),
+            (3, 4, 17),
+            (3, 16, 7),
+        ]:
+            bytes_per_row = (colors * bits_per_component * columns + 7) // 8
+            bytes_per_pixel = (colors * bits_per_component + 7) // 8
+            rows = self._random_rows(6, bytes_per_row)
+            for filter_type in range(0, 5):
+                bytes_out = Predictor.decode(
+                    _png_encode(rows, filter_type, bytes_per_pixel),
+                    predictor=10 + filter_type,
+                    colors=colors,
+                    bits_per_component=bits_per_component,
+                    columns=columns,
+                )
+                self.assertEqual(bytes_out, b"".join(rows))
+
+    def test_decode_png_mixed_filters(self):
+        rows = self._random_rows(10, 12)
+        encoded = b"".join(
+            [
+                _png_encode([rows[i - 1] if i > 0 else bytes(12), row], i % 5, 3)[13:]
+                for i, row in enumerate(rows)
+            ]
+        )
+        self.assertEqual(
+            Predictor.decode(encoded, predictor=15, colors=3, columns=4), b"".join(rows)
+        )
+
+    def test_decode_tiff(self):
+        for colors, bits_per_component, columns in [
+            (1, 8, 17),
+            (3, 8, 11),
+            (1, 1, 21),
+            (2, 2, 9),
+            (3, 4, 5),
+            (3, 16, 7),
+        ]:
+            rows = [
+                [
+                    self.random.randrange(1 << bits_per_component)
+                    for _ in range(0, colors * columns)
+                ]
+                for _ in range(0, 4)
+            ]
+            encoded = b"".join(
+                [
+                    _pack(_tiff_encode(r, colors, bits_per_component), bits_per_component)
+                    for r in rows
+                ]
+            )
+            bytes_out = Predictor.decode(
+                encoded,
+                predictor=2,
+                colors=colors,
+                bits_per_component=bits_per_component,
+                columns=columns,
+            )
+            self.assertEqual(
+                bytes_out, b"".join([_pack(r, bits_per_component) for r in rows])
+            )
+
+    def test_decode_tiff_short_final_row(self):
+        # the (complete) samples of a final row that is cut short are decoded as well
+        for colors, bits_per_component, columns, bytes_missing in [
+            (1, 8, 17, 5),
+            (3, 8, 11, 7),
+            (1, 1, 21, 1),
+            (3, 4, 5, 3),
+            (3, 16, 7, 6),
+            (3, 16, 7, 5),
+        ]:
+            rows = [
+                [
+                    self.random.randrange(1 << bits_per_component)
+                    for _ in range(0, colors * columns)
+                ]
+                for _ in range(0, 4)
+            ]
+            encoded = b"".join(
+                [
+                    _pack(_tiff_encode(r, colors, bits_per_component), bits_per_component)
+                    for r in rows
+                ]
+            )[0:-bytes_missing]
+            expected = b"".join([_pack(r, bits_per_component) for r in rows])[
+                0:-bytes_missing
+            ]
+            # a trailing half of a 16-bit sample can not be decoded
+            if bits_per_component == 16 and bytes_missing % 2 == 1:
+                expected = expected[0:-1] + encoded[-1:]
+            bytes_out = Predictor.decode(
+                encoded,
+                predictor=2,
+                colors=colors,
+                bits_per_component=bits_per_component,
+                columns=columns,
+            )
+            self.assertEqual(bytes_out, expected)
+
+    @unittest.skipUnless(predictor_module.numpy is not None, "requires numpy")
+    def test_decode_with_numpy(self):
+        self.test_decode_png_filters()
+        self.test_decode_png_mixed_filters()
+        self.test_decode_tiff()
+        self.test_decode_tiff_short_final_row()
+
+    def test_decode_without_numpy(self):
+        numpy = predictor_module.numpy
+        predictor_module.numpy = None
+        try:
+            self.test_decode_png_filters()
+            self.test_decode_png_mixed_filters()
+            self.test_decode_tiff()
+            self.test_decode_tiff_short_final_row()
+        finally:
+            predictor_module.numpy = numpy
+
+    def test_flate_decode_chunks_with_sub_byte_pixels(self):
+        # 3 colors of 4 bits, each pixel spans 2 bytes (rounded up)
+        rows = self._random_rows(9, (3 * 4 * 17 + 7) // 8)
+        for filter_type in range(0, 5):
+            bytes_in = zlib.compress(_png_encode(rows, filter_type, 2))
+            chunks = [bytes_in[i : i + 7] for i in range(0, len(bytes_in), 7)]
+            bytes_out = b"".join(
+                FlateDecode.decode_chunks(
+                    chunks,
+                    predictor=10 + filter_type,
+                    bits_per_component=4,
+                    columns=17,
+                    colors=3,
+                    chunk_size=16,
+                )
+            )
+            self.assertEqual(bytes_out, b"".join(rows))
+
+    def test_flate_decode_with_predictor(self):
+        rows = self._random_rows(8, 30)
+        bytes_in = zlib.compress(_png_encode(rows, 4, 3))
+        self.assertEqual(
+            FlateDecode.decode(memoryview(bytes_in), predictor=12, colors=3, columns=10),
+            b"".join(rows),
+        )
+
+    def test_benchmark_predictor(self):
+        colors, columns, number_of_rows = 3, 256, 128
+        for bits_per_component in [8, 16]:
+            bytes_per_row = colors * bits_per_component * columns // 8
+            bytes_per_pixel = colors * bits_per_component // 8
+            rows = self._random_rows(number_of_rows, bytes_per_row)
+            for predictor in [2, 10, 11, 12, 13, 14, 15]:
+                if predictor == 2:
+                    samples = [
+                        [
+                            self.random.randrange(1 << bits_per_component)
+                            for _ in range(0, colors * columns)
+                        ]
+                        for _ in range(0, number_of_rows)
+                    ]
+                    encoded = b"".join(
+                        [
+                            _pack(
+                                _tiff_encode(r, colors, bits_per_component),
+                                bits_per_component,
+                            )
+                            for r in samples
+                        ]
+                    )
+                    expected = b"".join(
+                        [_pack(r, bits_per_component) for r in samples]
+                    )
+                elif predictor == 15:
+                    # every row is encoded with another PNG filter
+                    prior_rows = [bytes(bytes_per_row)] + rows[0:-1]
+                    encoded = b"".join(
+                        [
+                            _png_encode([prior_rows[i], r], i % 5, bytes_per_pixel)[
+                                bytes_per_row + 1 :
+                            ]
+                            for i, r in enumerate(rows)
+                        ]
+                    )
+                    expected = b"".join(rows)
+                else:
+                    encoded = _png_encode(rows, predictor - 10, bytes_per_pixel)
+                    expected = b"".join(rows)
+                compressed = zlib.compress(encoded)
+                for name, decode in [
+                    (
+                        "Predictor",
+                        lambda: Predictor.decode(
+                            encoded,
+                            predictor=predictor,
+                            colors=colors,
+                            bits_per_component=bits_per_component,
+                            columns=columns,
+                        ),
+                    ),
+                    (
+                        "FlateDecode",
+                        lambda: b"".join(
+                            FlateDecode.decode_chunks(
+                                [compressed],
+                                predictor=predictor,
+                                bits_per_component=bits_per_component,
+                                columns=columns,
+                                colors=colors,
+                            )
+                        ),
+                    ),
+                ]:
+                    before = time.time()
+                    bytes_out = decode()
+                    delta = time.time() - before
+                    print(
+                        "%s, predictor %d, %d bits per component, %d bytes, decoded at %f MB/s"
+                        % (
+                            name,
+                            predictor,
+                            bits_per_component,
+                            len(bytes_out),
+                            len(bytes_out) / max(delta, 1e-9) / 1e6,
+                        )
+                    )
+                    self.assertEqual(bytes_out, expected)
@@ -0,0 +1,52 @@
+import unittest
+from decimal import Decimal
+
+from ptext.io.read_transform.types import Dictionary, Name
+from ptext.pdf.canvas.font.afm.adobe_font_metrics import AdobeFontMetrics
+
+
+class TestAdobeFontMetrics(unittest.TestCase):
+    """
+    This test checks whether AdobeFontMetrics finds the standard 14 fonts (by any spelling of their name),
+    and whether their Widths are indexed by character code
+    """
+
+    def test_get_standard_14_font(self):
+        f0 = AdobeFontMetrics.get("Helvetica-Bold")
+        self.assertIsNotNone(f0)
+        self.assertIs(AdobeFontMetrics.get("Helvetica-Bold"), f0)
+        self.assertIs(AdobeFontMetrics.get("HelveticaBold"), f0)
+        self.assertIs(AdobeFontMetrics.get("helvetica bold"), f0)
+        self.assertIsNot(AdobeFontMetrics.get("Helvetica"), f0)
+
+    def test_get_unknown_font(self):
+        self.assertIsNone(AdobeFontMetrics.get("Comic Sans"))
+        self.assertIsNone(AdobeFontMetrics.get("Comic Sans"))
+
+        # unknown names (e.g. subset fonts) are not kept
+        for i in range(0, 100):
+            self.assertIsNone(AdobeFontMetrics.get("ABCDEF+Font%d" % i))
+        self.assertNotIn("ABCDEF+Font0", AdobeFontMetrics._font_by_name)
+
+    def test_memo_holds_no_document_objects(self):
+        # a Name (e.g. the BaseFont of a Font) keeps its parent(s)
+        name = Name("Courier")
+        setattr(name, "_parent", Dictionary())
+        f = AdobeFontMetrics.get(name)
+        assert f is not None
+        self.assertIs(AdobeFontMetrics.get("Courier"), f)
+        self.assertTrue(all([type(x) is str for x in AdobeFontMetrics._font_by_name]))
+        self.assertIsNone(f.get_parent())
+
+    def test_widths_are_indexed_by_character_code(self):
+        f = AdobeFontMetrics.get("Helvetica")
+        assert f is not None
+        first_char = int(f["FirstChar"])
+        self.assertEqual(len(f["Widths"]), int(f["LastChar"]) - first_char + 1)
+        self.assertEqual(f["Widths"][ord(" ") - first_char], Decimal(278))
+        self.assertEqual(f["Widths"][ord("A") - first_char], Decimal(667))
+        self.assertEqual(f["Widths"][ord("i") - first_char], Decimal(222))
+        # AE (character code 225)
+        self.assertEqual(f["Widths"][225 - first_char], Decimal(1000))
+        # character code 226 is not used
+        self.assertEqual(f["Widths"][226 - first_char], Decimal(0))
@@ -0,0 +1,53 @@
+import io
+import unittest
+
+from ptext.io.read_transform.types import HexadecimalString, String
+from ptext.pdf.canvas.font.font import Font
+from ptext.pdf.pdf import PDF
+from tests.test import build_document_bytes
+
+
+class TestBuildGlyphLine(unittest.TestCase):
+    """
+    This test checks whether Font.build_glyph_line decodes a String once,
+    and returns (an independent copy of) the cached GlyphLine when the same String is shown again
+    """
+
+    def setUp(self) -> None:
+        page = PDF.loads(io.BytesIO(build_document_bytes(1))).get_page(0)
+        self.font = page["Resources"]["Font"]["F1"]
+        self.assertIsInstance(self.font, Font)
+
+    def test_build_glyph_line(self):
+        glyph_line = self.font.build_glyph_line(String("Total"))
+        self.assertEqual(glyph_line.get_text(), "Total")
+        self.assertEqual(len(glyph_line), 5)
+        self.assertTrue(all([g.width > 0 for g in glyph_line]))
+
+    def test_build_glyph_line_uses_cache(self):
+        n = len(self.font._glyph_line_cache)
+        glyph_line_0 = self.font.build_glyph_line(String("Total"))
+        glyph_line_1 = self.font.build_glyph_line(String("Total"))
+        self.assertIsNot(glyph_line_0, glyph_line_1)
+        self.assertEqual([g.code for g in glyph_line_0], [g.code for g in glyph_line_1])
+        self.assertEqual(len(self.font._glyph_line_cache), n + 1)
+
+        # the cached GlyphLine can not be modified through a GlyphLine that was returned
+        glyph_line_1.append_glyph_line(glyph_line_0)
+        glyph_line_2 = self.font.build_glyph_line(String("Total"))
+        self.assertEqual(glyph_line_2.get_text(), "Total")
+
+    def test_build_glyph_line_distinguishes_hexadecimal_strings(self):
+        n = len(self.font._glyph_line_cache)
+        glyph_line_0 = self.font.build_glyph_line(String("AB"))
+        glyph_line_1 = self.font.build_glyph_line(HexadecimalString("4142"))
+        self.assertEqual(glyph_line_0.get_text(), "AB")
+        self.assertEqual(glyph_line_1.get_text(), "AB")
+        self.assertEqual(len(self.font._glyph_line_cache), n + 2)
+
+    def test_glyph_line_cache_is_bounded(self):
+        for i in range(0, Font.MAX_NUMBER_OF_CACHED_GLYPH_LINES + 10):
+            self.font.build_glyph_line(String(str(i)))
+        self.assertEqual(
+            len(self.font._glyph_line_cache), Font.MAX_NUMBER_OF_CACHED_GLYPH_LINES
+        )
@@ -0,0 +1,162 @@
+import copy
+import io
+import pickle
+import time
+import unittest
+
+from ptext.functionality.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.read_transform.types import (
+    Dictionary,
+    LazyObject,
+    List,
+    _LazyDictionary,
+    _LazyList,
+    get_lazy_class,
+)
+from ptext.pdf.page.page import Page
+from ptext.pdf.pdf import PDF
+from tests.test import build_document_bytes
+
+
+class TestReadInfoDictionaryLazily(unittest.TestCase):
+    """
+    This test checks whether a Document that is read lazily
+    offers the same DocumentInfo (and Page content) as a Document that is read eagerly,
+    and whether reading the DocumentInfo lazily avoids reading every Page.
+    """
+
+    def test_read_info_dictionary_lazily(self):
+        bts = build_document_bytes(2000)
+
+        t0 = time.time()
+        doc = PDF.loads(io.BytesIO(bts), lazy=True)
+        info = doc.get_document_info()
+        lazy_values = [info.get_title(), info.get_author(), info.get_number_of_pages()]
+        delta_lazy = time.time() - t0
+
+        t0 = time.time()
+        doc = PDF.loads(io.BytesIO(bts))
+        info = doc.get_document_info()
+        eager_values = [info.get_title(), info.get_author(), info.get_number_of_pages()]
+        delta_eager = time.time() - t0
+
+        print("lazy  : %f s" % delta_lazy)
+        print("eager : %f s" % delta_eager)
+        self.assertEqual(lazy_values, eager_values)
+        self.assertEqual(lazy_values[2], 2000)
+        self.assertLess(delta_lazy, delta_eager)
+
+    def test_read_page_lazily(self):
+        bts = build_document_bytes(25, pages_per_node=4)
+        doc = PDF.loads(io.BytesIO(bts), lazy=True)
+        kids = doc["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+        self.assertEqual(len(kids), 25)
+        self.assertTrue(all([isinstance(x, LazyObject) for x in list.__iter__(kids)]))
+
+        # pages are read (and transformed) on first access
+        l = SimpleTextExtraction()
+        doc.add_event_listener(l)
+        page = doc.get_page(13)
+        self.assertIsInstance(page, Page)
+        self.assertEqual(l.get_text(0), "Page 14")
+        self.assertIs(doc.get_page(13), page)
+        self.assertEqual(
+            len([x for x in list.__iter__(kids) if isinstance(x, LazyObject)]), 24
+        )
+
+    def test_only_lazy_containers_hold_lazy_objects(self):
+        bts = build_document_bytes(10, pages_per_node=4)
+        for lazy in [False, True]:
+            doc = PDF.loads(io.BytesIO(bts), lazy=lazy)
+            doc.get_page(3)
+
+            # walk every Dictionary (and List) that has been resolved
+            number_of_lazy_containers: int = 0
+            done = set()
+            stack = [doc]
+            while len(stack) > 0:
+                obj = stack.pop()
+                if id(obj) in done:
+                    continue
+                done.add(id(obj))
+                values = list(
+                    dict.values(obj) if isinstance(obj, dict) else list.__iter__(obj)
+                )
+                lazy_class = isinstance(obj, (_LazyDictionary, _LazyList))
+                if any([isinstance(x, LazyObject) for x in values]):
+                    self.assertTrue(lazy_class)
+                number_of_lazy_containers += 1 if lazy_class else 0
+                stack.extend([x for x in values if isinstance(x, (Dictionary, List))])
+
+            # an eagerly read Document keeps plain dict (and list) access
+            if not lazy:
+                self.assertEqual(number_of_lazy_containers, 0)
+            else:
+                self.assertGreater(number_of_lazy_containers, 0)
+
+    def test_every_read_resolves_lazy_objects(self):
+        bts = build_document_bytes(10, pages_per_node=4)
+
+        def has_lazy_objects(obj) -> bool:
+            values = dict.values(obj) if isinstance(obj, dict) else list.__iter__(obj)
+            return any([isinstance(x, LazyObject) for x in values])
+
+        reads = [
+            lambda x: dict(x) if isinstance(x, dict) else list(x),
+            lambda x: {**x} if isinstance(x, dict) else [*x],
+            lambda x: x.copy(),
+            copy.copy,
+            copy.deepcopy,
+            lambda x: pickle.loads(pickle.dumps(x)),
+        ]
+        for i, read in enumerate(reads):
+            # a Pages Dictionary, and its /Kids List
+            for path in [["Root", "Pages"], ["Root", "Pages", "Kids"]]:
+                doc = PDF.loads(io.BytesIO(bts), lazy=True)
+                obj = doc["XRef"]["Trailer"]
+                for k in path:
+                    obj = obj[k]
+                obj_class = obj.__class__
+                self.assertTrue(has_lazy_objects(obj))
+                self.assertFalse(has_lazy_objects(read(obj)), "read %d" % i)
+                # reading (e.g. pickling) does not change the class of obj
+                self.assertIs(obj.__class__, obj_class)
+
+        doc = PDF.loads(io.BytesIO(bts), lazy=True)
+        trailer = doc["XRef"]["Trailer"]
+        self.assertIsInstance(trailer.setdefault("Root", None), Dictionary)
+
+        # comparing resolves both sides
+        doc2 = PDF.loads(io.BytesIO(bts), lazy=True)
+        kids = doc["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+        kids2 = doc2["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+        self.assertEqual(kids, kids2)
+        self.assertFalse(has_lazy_objects(kids) or has_lazy_objects(kids2))
+
+        # a pickled List is a plain List
+        out = pickle.loads(pickle.dumps(kids))
+        self.assertIs(out.__class__, List)
+
+    def test_pickle_subclass_of_lazy_class(self):
+        # the plain class is kept by the lazy class, it does not depend on the position of its bases
+        class LazyDictionarySubclass(get_lazy_class(Dictionary)):
+            pass
+
+        class LazyListSubclass(get_lazy_class(List)):
+            pass
+
+        d = LazyDictionarySubclass()
+        dict.__setitem__(d, "Key", LazyObject(None, lambda: "Value"))
+        out = pickle.loads(pickle.dumps(d))
+        self.assertIs(out.__class__, Dictionary)
+        self.assertEqual(dict.__getitem__(out, "Key"), "Value")
+
+        l = LazyListSubclass()
+        list.append(l, LazyObject(None, lambda: "Value"))
+        out = pickle.loads(pickle.dumps(l))
+        self.assertIs(out.__class__, List)
+        self.assertEqual(list.__getitem__(out, 0), "Value")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import random
+import unittest
+from decimal import Decimal
+
+from ptext.pdf.canvas.geometry.affine_transform import AffineTransform
+from ptext.pdf.canvas.geometry.line_segment import LineSegment
+from ptext.pdf.canvas.geometry.matrix import Matrix
+
+
+class TestAffineTransform(unittest.TestCase):
+    """
+    This test checks whether AffineTransform (float) yields the same results as Matrix (Decimal),
+    within the documented tolerance
+    """
+
+    def _random_matrix(self, r: random.Random) -> Matrix:
+        return Matrix.matrix_from_six_values(
+            *[Decimal(round(r.uniform(-1000, 1000), 3)) for _ in range(0, 6)]
+        )
+
+    def test_affine_transform_multiplication(self):
+        r = random.Random(0)
+        for _ in range(0, 100):
+            m0 = self._random_matrix(r)
+            m1 = self._random_matrix(r)
+            expected = m0.mul(m1)
+            actual = AffineTransform.from_matrix(m0).mul(
+                AffineTransform.from_matrix(m1)
+            )
+            for i in range(0, 3):
+                for j in range(0, 3):
+                    self.assertAlmostEqual(
+                        float(expected[i][j]), actual[i][j], delta=1e-6
+                    )
+
+    def test_affine_transform_cross(self):
+        m0 = AffineTransform(1, 0, 0, 1, 121, 613)
+        m1 = AffineTransform(2, 0, 0, 3, -7, -10)
+        m2 = m0.mul(m1)
+        self.assertEqual(m2.cross(0, 0, 1), (235, 1829, 1))
+        self.assertEqual(m2.cross(1, 1, 0), (2, 3, 0))
+        self.assertEqual(m2.apply(Decimal(1), Decimal(1)), (237, 1832))
+
+    def test_transform_line_segment(self):
+        r = random.Random(1)
+        for _ in range(0, 100):
+            m = self._random_matrix(r)
+            l = LineSegment(*[Decimal(r.uniform(-1000, 1000)) for _ in range(0, 4)])
+            expected = l.transform_by(m)
+            actual = l.transform_by(AffineTransform.from_matrix(m))
+            self.assertIsInstance(actual.x0, Decimal)
+            for x, y in zip(
+                expected.get_start() + expected.get_end(),
+                actual.get_start() + actual.get_end(),
+            ):
+                self.assertAlmostEqual(float(x), float(y), delta=1e-6)
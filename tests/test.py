@@ -162,3 +162,97 @@ class Test(unittest.TestCase):
             json_file_handle.write(
                 json.dumps(self.get_test_results_as_json(), indent=4)
             )
+
+
+def build_document_bytes(
+    number_of_pages: int, pages_per_node: int = 10, shared_resources: bool = False
+) -> bytes:
+    """
+    This function builds a (minimal) PDF with a given number of pages,
+    each page shows the text "Page <n>" in Helvetica.
+    The page tree is balanced, with at most pages_per_node kids per Pages node.
+    When shared_resources is set, all pages share a single (indirect) Resources dictionary,
+    and each page links to the first page.
+    """
+    objects: typing.List[bytes] = []
+
+    def add_object(obj: bytes) -> int:
+        objects.append(obj)
+        return len(objects)
+
+    def reserve_object() -> int:
+        return add_object(b"")
+
+    catalog = reserve_object()
+    info = add_object(
+        b"<</Title (Generated Document) /Author (Joris Schellekens) "
+        b"/Producer (pText)>>"
+    )
+    font = add_object(
+        b"<</Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+        b"/Encoding /WinAnsiEncoding>>"
+    )
+    resources = b"<</Font <</F1 %d 0 R>>>>" % font
+    if shared_resources:
+        resources = b"%d 0 R" % add_object(resources)
+
+    # pages
+    nodes: typing.List[typing.Tuple[int, int]] = []
+    for i in range(0, number_of_pages):
+        content = b"BT /F1 12 Tf 72 712 Td (Page %d) Tj ET" % (i + 1)
+        content_stream = add_object(
+            b"<</Length %d>>\nstream\n%s\nendstream" % (len(content), content)
+        )
+        page = reserve_object()
+        nodes.append((page, 1))
+        annotations = b""
+        if shared_resources:
+            annotations = b"/Annots [<</Type /Annot /Subtype /Link /Rect [0 0 10 10] "
+            annotations += b"/Dest [%d 0 R /Fit]>>] " % nodes[0][0]
+        objects[page - 1] = (
+            b"<</Type /Page /Parent %%d 0 R /MediaBox [0 0 595 842] "
+            b"/Resources %s %s/Contents %d 0 R>>"
+            % (resources, annotations, content_stream)
+        )
+
+    # page tree
+    while True:
+        parents: typing.List[typing.Tuple[int, int]] = []
+        for j in range(0, len(nodes), pages_per_node):
+            kids = nodes[j : j + pages_per_node]
+            parent = reserve_object()
+            objects[parent - 1] = (
+                b"<</Type /Pages /Parent %%d 0 R /Kids [%s] /Count %d>>"
+                % (
+                    b" ".join([b"%d 0 R" % k for k, _ in kids]),
+                    sum([c for _, c in kids]),
+                )
+            )
+            for k, _ in kids:
+                objects[k - 1] = objects[k - 1] % parent
+            parents.append((parent, sum([c for _, c in kids])))
+        nodes = parents
+        if len(nodes) == 1:
+            break
+    root_pages = nodes[0][0]
+    objects[root_pages - 1] = objects[root_pages - 1].replace(
+        b"/Parent %d 0 R ", b""
+    )
+    objects[catalog - 1] = b"<</Type /Catalog /Pages %d 0 R>>" % root_pages
+
+    # write
+    out = b"%PDF-1.7\n"
+    byte_offsets = []
+    for i, obj in enumerate(objects):
+        byte_offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (i + 1, obj)
+    startxref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f\r\n" % (len(objects) + 1)
+    out += b"".join([b"%010d 00000 n\r\n" % x for x in byte_offsets])
+    out += b"trailer\n<</Size %d /Root %d 0 R /Info %d 0 R>>\n" % (
+        len(objects) + 1,
+        catalog,
+        info,
+    )
+    out += b"startxref\n%d\n%%%%EOF" % startxref
+    return out
@@ -0,0 +1,79 @@
+import io
+import time
+import unittest
+
+from ptext.functionality.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.read_transform.types import LazyObject
+from ptext.pdf.page.page import Page
+from ptext.pdf.pdf import PDF
+from tests.test import build_document_bytes
+
+
+class TestExtractTextFromSelectedPages(unittest.TestCase):
+    """
+    This test checks whether PDF.loads only reads the selected Page(s),
+    (given as indices, ranges or a function) while keeping every other Page in place.
+    """
+
+    def _extract_text(self, bts: bytes, pages) -> (list, list):
+        l = SimpleTextExtraction()
+        doc = PDF.loads(io.BytesIO(bts), [l], pages=pages)
+        kids = doc["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+        self.assertEqual(len(kids), 100)
+        self.assertEqual(doc.get_document_info().get_number_of_pages(), 100)
+        text = [l.get_text(i) for i in range(0, 100) if l.get_text(i) != ""]
+        read_pages = [
+            i for i, x in enumerate(list.__iter__(kids)) if isinstance(x, Page)
+        ]
+        return text, read_pages
+
+    def test_select_pages_by_index(self):
+        bts = build_document_bytes(100, pages_per_node=7)
+        text, read_pages = self._extract_text(bts, [3, 40])
+        self.assertEqual(text, ["Page 4", "Page 41"])
+        self.assertEqual(read_pages, [3, 40])
+
+    def test_select_pages_by_range(self):
+        bts = build_document_bytes(100, pages_per_node=7)
+        text, read_pages = self._extract_text(bts, [range(10, 13), 99])
+        self.assertEqual(text, ["Page 11", "Page 12", "Page 13", "Page 100"])
+        self.assertEqual(read_pages, [10, 11, 12, 99])
+
+    def test_select_pages_by_function(self):
+        bts = build_document_bytes(100, pages_per_node=7)
+        text, read_pages = self._extract_text(bts, lambda i: i % 25 == 0)
+        self.assertEqual(text, ["Page 1", "Page 26", "Page 51", "Page 76"])
+        self.assertEqual(read_pages, [0, 25, 50, 75])
+
+    def test_unselected_pages_do_not_send_events(self):
+        bts = build_document_bytes(100, pages_per_node=7)
+        l = SimpleTextExtraction()
+        doc = PDF.loads(io.BytesIO(bts), [l], pages=[2, range(4, 6)])
+        kids = doc["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+        self.assertIsInstance(kids[10], Page)
+        self.assertIsInstance(kids[11], Page)
+        text = [l.get_text(i) for i in range(0, 100) if l.get_text(i) != ""]
+        self.assertEqual(text, ["Page 3", "Page 5", "Page 6"])
+
+    def test_unselected_pages_are_not_read(self):
+        bts = build_document_bytes(2000)
+
+        t0 = time.time()
+        doc = PDF.loads(io.BytesIO(bts), pages=[3])
+        delta_selected = time.time() - t0
+
+        t0 = time.time()
+        PDF.loads(io.BytesIO(bts))
+        delta_all = time.time() - t0
+
+        print("1 selected page : %f s" % delta_selected)
+        print("all pages       : %f s" % delta_all)
+        kids = doc["XRef"]["Trailer"]["Root"]["Pages"]["Kids"]
+        self.assertEqual(
+            len([x for x in list.__iter__(kids) if isinstance(x, LazyObject)]), 1999
+        )
+        self.assertLess(delta_selected, delta_all)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from ptext.functionality.text.simple_text_extraction import SimpleTextExtraction
+from ptext.pdf.pdf import PDF
+from tests.test import build_document_bytes
+
+
+class TestExtractTextInParallel(unittest.TestCase):
+    """
+    This test checks whether PDF.map_pages (processing ranges of Page(s) in separate processes)
+    returns the same text (in page order) as processing the whole Document at once.
+    """
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "document.pdf"
+        with open(self.path, "wb") as pdf_file_handle:
+            pdf_file_handle.write(build_document_bytes(200, pages_per_node=7))
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_extract_text_in_parallel(self):
+        t0 = time.time()
+        l = SimpleTextExtraction()
+        PDF.loads(self.path, [l])
+        expected_text = [l.get_text(i) for i in range(0, 200)]
+        delta_sequential = time.time() - t0
+
+        for max_workers in [1, 2, 4]:
+            t0 = time.time()
+            text = PDF.map_pages(
+                self.path,
+                SimpleTextExtraction,
+                SimpleTextExtraction.get_text,
+                max_workers=max_workers,
+            )
+            delta_parallel = time.time() - t0
+            self.assertEqual(text, expected_text)
+            print(
+                "%d worker(s) : %f s (sequential : %f s, %d cpu(s))"
+                % (max_workers, delta_parallel, delta_sequential, os.cpu_count())
+            )
+
+    def test_extract_text_from_selected_pages_in_parallel(self):
+        text = PDF.map_pages(
+            self.path,
+            SimpleTextExtraction,
+            SimpleTextExtraction.get_text,
+            pages=[range(10, 13), 150, 199],
+            max_workers=2,
+        )
+        self.assertEqual(text, ["Page 11", "Page 12", "Page 13", "Page 151", "Page 200"])
+
+
+if __name__ == "__main__":
+    unittest.main()
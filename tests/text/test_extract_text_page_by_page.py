@@ -0,0 +1,85 @@
+import gc
+import io
+import time
+import unittest
+import weakref
+
+from ptext.functionality.text.simple_text_extraction import SimpleTextExtraction
+from ptext.pdf.canvas.font.font import Font
+from ptext.pdf.page.page import Page
+from ptext.pdf.pdf import PDF
+from tests.test import build_document_bytes
+
+
+class TestExtractTextPageByPage(unittest.TestCase):
+    """
+    This test checks whether PDF.iter_pages yields every Page (in order),
+    sends the same events as PDF.loads, and releases each Page once the next one is read.
+    """
+
+    def test_extract_text_page_by_page(self):
+        bts = build_document_bytes(100, pages_per_node=7)
+
+        t0 = time.time()
+        l0 = SimpleTextExtraction()
+        PDF.loads(io.BytesIO(bts), [l0])
+        delta_loads = time.time() - t0
+
+        t0 = time.time()
+        l1 = SimpleTextExtraction()
+        n: int = 0
+        for page in PDF.iter_pages(io.BytesIO(bts), [l1]):
+            self.assertIsInstance(page, Page)
+            self.assertEqual(l1.get_text(n), "Page %d" % (n + 1))
+            n += 1
+        delta_iter_pages = time.time() - t0
+
+        print("loads      : %f s" % delta_loads)
+        print("iter_pages : %f s" % delta_iter_pages)
+        self.assertEqual(n, 100)
+        self.assertEqual(
+            [l0.get_text(i) for i in range(0, 100)],
+            [l1.get_text(i) for i in range(0, 100)],
+        )
+
+    def test_previous_pages_are_released(self):
+        bts = build_document_bytes(50)
+        pages = []
+        fonts = []
+        for page in PDF.iter_pages(io.BytesIO(bts)):
+            pages.append(weakref.ref(page))
+            fonts.append(page["Resources"]["Font"]["F1"])
+            gc.collect()
+            self.assertEqual(len([x for x in pages if x() is not None]), 1)
+
+        # Font(s) are read once
+        self.assertIsInstance(fonts[0], Font)
+        self.assertTrue(all([x is fonts[0] for x in fonts]))
+
+    def test_shared_resources_are_kept(self):
+        bts = build_document_bytes(20, shared_resources=True)
+        pages = []
+        contents = []
+        resources = []
+        l = SimpleTextExtraction()
+        for page in PDF.iter_pages(io.BytesIO(bts), [l]):
+            pages.append(weakref.ref(page))
+            contents.append(weakref.ref(page["Contents"]))
+            resources.append(page["Resources"])
+            gc.collect()
+            self.assertEqual(len([x for x in pages if x() is not None]), 1)
+            self.assertEqual(len([x for x in contents if x() is not None]), 1)
+        self.assertEqual(l.get_text(19), "Page 20")
+
+        # the (indirect) Resources dictionary is shared by all Page(s), and read once
+        self.assertTrue(all([x is resources[0] for x in resources]))
+
+    def test_page_tree_is_not_changed(self):
+        bts = build_document_bytes(20)
+        for page in PDF.iter_pages(io.BytesIO(bts)):
+            kids = page.get_parent()["Kids"]
+            self.assertEqual(len(kids), 20)
+            self.assertNotIn(None, list.__iter__(kids))
+
+if __name__ == "__main__":
+    unittest.main()
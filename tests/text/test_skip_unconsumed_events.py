@@ -0,0 +1,112 @@
+import gc
+import io
+import typing
+import weakref
+import unittest
+from unittest import mock
+
+from ptext.functionality.text.font_extraction import FontExtraction
+from ptext.functionality.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.read_transform.types import String
+from ptext.pdf.canvas.canvas import Canvas
+from ptext.pdf.canvas.event.event_listener import Event, EventListener
+from ptext.pdf.canvas.event.image_render_event import ImageRenderEvent
+from ptext.pdf.canvas.event.text_render_event import TextRenderEvent
+from ptext.pdf.pdf import PDF
+from tests.test import build_document_bytes
+
+
+class CountingEventListener(EventListener):
+    def __init__(self, supported_event_types: typing.Optional[typing.List[type]]):
+        self.supported_event_types = supported_event_types
+        self.events: typing.List[Event] = []
+
+    def event_occurred(self, event: Event) -> None:
+        self.events.append(event)
+
+    def get_supported_event_types(self) -> typing.Optional[typing.List[type]]:
+        return self.supported_event_types
+
+
+class TestSkipUnconsumedEvents(unittest.TestCase):
+    """
+    This test checks whether the Canvas only builds the Event(s) its EventListener(s) consume,
+    while still keeping track of the text position (and thus the text that is extracted) correctly,
+    and whether Event(s) are only sent to the EventListener(s) of the Document they occur in.
+    """
+
+    CONTENT = b"BT /F1 12 Tf 72 712 Td (Hello) Tj [(Wor) -250 (ld)] TJ (!) Tj"
+
+    def setUp(self) -> None:
+        self.page = PDF.loads(io.BytesIO(build_document_bytes(1))).get_page(0)
+
+    def _read_content(self, event_listener: EventListener) -> Canvas:
+        canvas = Canvas().set_parent(self.page)  # type: ignore [attr-defined]
+        setattr(canvas, "_event_listeners", [event_listener])
+        canvas.read(io.BytesIO(TestSkipUnconsumedEvents.CONTENT))
+        return canvas
+
+    def test_has_event_listeners_for(self):
+        canvas = Canvas()
+        setattr(canvas, "_event_listeners", [])
+        self.assertFalse(canvas.has_event_listeners_for(TextRenderEvent))
+        canvas.add_listener(FontExtraction())
+        self.assertFalse(canvas.has_event_listeners_for(TextRenderEvent))
+        canvas.add_listener(CountingEventListener([Event]))
+        self.assertTrue(canvas.has_event_listeners_for(TextRenderEvent))
+        self.assertTrue(canvas.has_event_listeners_for(ImageRenderEvent))
+
+    def test_text_position_without_text_render_events(self):
+
+        # every Event is consumed
+        l0 = CountingEventListener(None)
+        text_matrix_0 = self._read_content(l0).graphics_state.text_matrix
+        text_render_events = [x for x in l0.events if isinstance(x, TextRenderEvent)]
+        self.assertEqual(len(text_render_events), 4)
+
+        # no TextRenderEvent is consumed, and none should be built
+        l1 = CountingEventListener([ImageRenderEvent])
+        with mock.patch.object(TextRenderEvent, "__init__", side_effect=AssertionError):
+            text_matrix_1 = self._read_content(l1).graphics_state.text_matrix
+        self.assertEqual(len(l1.events), 0)
+
+        # the text position has advanced the same way
+        self.assertNotEqual(text_matrix_0[2][0], 72)
+        self.assertEqual(text_matrix_0[2][0], text_matrix_1[2][0])
+        self.assertEqual(text_matrix_0[2][1], text_matrix_1[2][1])
+
+    def test_baseline_length_matches_text_render_event(self):
+        graphics_state = self._read_content(CountingEventListener(None)).graphics_state
+        w = TextRenderEvent.get_baseline_length(graphics_state, String("Hello"))
+        self.assertIsInstance(w, float)
+        self.assertGreater(w, 0)
+        tri = TextRenderEvent(graphics_state, String("Hello"))
+        self.assertEqual(w, float(tri.get_baseline().length()))
+
+    def test_extract_text_is_unchanged(self):
+        bts = build_document_bytes(10)
+        l0 = SimpleTextExtraction()
+        l1 = FontExtraction()
+        PDF.loads(io.BytesIO(bts), [l0, l1])
+        self.assertEqual(l0.get_text(0), "Page 1")
+        self.assertEqual(len(l1.get_fonts_per_page(0)), 1)
+
+    def test_event_listeners_belong_to_their_document(self):
+        bts = build_document_bytes(3)
+        l0 = CountingEventListener(None)
+        doc = PDF.loads(io.BytesIO(bts), [l0])
+        number_of_events = len(l0.events)
+        self.assertGreater(number_of_events, 0)
+
+        # reading another Document does not send Event(s) to l0
+        l1 = CountingEventListener(None)
+        PDF.loads(io.BytesIO(bts), [l1])
+        self.assertEqual(len(l0.events), number_of_events)
+        self.assertEqual(len(l1.events), number_of_events)
+
+        # and does not keep the first Document
+        ref = weakref.ref(doc)
+        doc = None
+        l0 = None
+        gc.collect()
+        self.assertIsNone(ref())
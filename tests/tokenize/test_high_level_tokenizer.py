@@ -0,0 +1,109 @@
+import io
+import time
+import unittest
+from decimal import Decimal
+
+from ptext.io.read_transform.types import (
+    CanvasOperatorName,
+    Dictionary,
+    List,
+    Reference,
+    Stream,
+)
+from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
+
+
+class CountingHighLevelTokenizer(HighLevelTokenizer):
+    """
+    This HighLevelTokenizer keeps track of the number of Token(s) it scanned
+    """
+
+    def __init__(self, io_source):
+        super(CountingHighLevelTokenizer, self).__init__(io_source)
+        self.number_of_scanned_tokens = 0
+
+    def _scan_token(self):
+        self.number_of_scanned_tokens += 1
+        return super(CountingHighLevelTokenizer, self)._scan_token()
+
+
+class TestHighLevelTokenizer(unittest.TestCase):
+    """
+    This test checks whether HighLevelTokenizer.read_object decides between <number>,
+    <number> <number> R and <number> <number> obj without having to re-read Token(s)
+    """
+
+    def test_read_numbers_and_references(self):
+        tok = HighLevelTokenizer(io.BytesIO(b"[1 2 0 R 3 4 5 6 0 R 7]"))
+        obj = tok.read_object()
+        assert isinstance(obj, List)
+        assert len(obj) == 7
+        assert obj[0] == Decimal(1)
+        assert obj[1] == Reference(object_number=2, generation_number=0)
+        assert obj[2] == Decimal(3)
+        assert obj[3] == Decimal(4)
+        assert obj[4] == Decimal(5)
+        assert obj[5] == Reference(object_number=6, generation_number=0)
+        assert obj[6] == Decimal(7)
+
+    def test_read_indirect_objects(self):
+        tok = HighLevelTokenizer(
+            io.BytesIO(
+                b"12 0 obj\n<</Type /Font /Widths [1 2 3]>>\nendobj\n"
+                b"13 0 obj\n<</Length 6>>\nstream\n0 0 m\nendstream\nendobj\n"
+            )
+        )
+        obj = tok.read_object()
+        assert isinstance(obj, Dictionary)
+        assert obj.get_reference() == Reference(object_number=12, generation_number=0)  # type: ignore [attr-defined]
+        assert obj["Widths"] == [Decimal(1), Decimal(2), Decimal(3)]
+        assert tok.read_object() is None  # endobj
+
+        obj = tok.read_object()
+        assert isinstance(obj, Stream)
+        assert obj["Bytes"] == b"0 0 m\n"
+
+    def test_benchmark_widths_heavy_font_dictionary(self):
+        widths = " ".join([str(250 + (i * 37) % 750) for i in range(0, 65536)])
+        content = ("<</Type /Font /Subtype /CIDFontType2 /W [1 [%s]]>>" % widths).encode(
+            "latin-1"
+        )
+        tok = CountingHighLevelTokenizer(io.BytesIO(content))
+        before = time.time()
+        obj = tok.read_object()
+        delta = time.time() - before
+        print(
+            "widths-heavy font dictionary: %d tokens scanned for 65544 tokens in %f s"
+            % (tok.number_of_scanned_tokens, delta)
+        )
+        assert isinstance(obj, Dictionary)
+        assert len(obj["W"][1]) == 65536
+        assert tok.number_of_scanned_tokens <= 65544 + 16
+
+    def test_benchmark_coordinate_heavy_content_stream(self):
+        content = "".join(
+            ["%d %d m %d %d l S\n" % (i, i + 1, i + 2, i + 3) for i in range(0, 16384)]
+        ).encode("latin-1")
+        tok = CountingHighLevelTokenizer(io.BytesIO(content))
+        number_of_objects = 0
+        number_of_operators = 0
+        before = time.time()
+        while True:
+            obj = tok.read_object()
+            if obj is None:
+                break
+            if isinstance(obj, CanvasOperatorName):
+                number_of_operators += 1
+            number_of_objects += 1
+        delta = time.time() - before
+        print(
+            "coordinate-heavy content stream: %d tokens scanned for %d tokens in %f s"
+            % (tok.number_of_scanned_tokens, number_of_objects, delta)
+        )
+        assert number_of_objects == 16384 * 7
+        assert number_of_operators == 16384 * 3
+        assert tok.number_of_scanned_tokens <= number_of_objects + 16
+
+
+if __name__ == "__main__":
+    unittest.main()
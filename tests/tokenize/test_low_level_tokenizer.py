@@ -0,0 +1,109 @@
+import io
+import mmap
+import tempfile
+import time
+import typing
+import unittest
+
+from ptext.io.tokenize.low_level_tokenizer import LowLevelTokenizer, Token
+
+
+class TestLowLevelTokenizer(unittest.TestCase):
+    """
+    This test checks whether the buffered LowLevelTokenizer produces the same Token(s)
+    as the (original) LowLevelTokenizer that reads its io source one byte at a time.
+    It also benchmarks both implementations.
+    """
+
+    def _build_content(self, number_of_objects: int) -> bytes:
+        out = "%PDF-1.7\n%\xe2\xe3\xcf\xd3\n"
+        for i in range(0, number_of_objects):
+            out += (
+                "%d 0 obj\n"
+                "<</Type /Font /Subtype /Type1 /BaseFont /Helvetica#20Bold "
+                "/Widths [250 333 408 500 500 833 778 180 333 333] "
+                "/Title (Hello \\(nested\\) (World) \\\\) /ID <c447fa6f0c67>\n"
+                "/Parent %d 0 R /Rect [-1.5 +2 .75 100.0] /Marked true>>\n"
+                "endobj\n"
+                "BT /F1 12 Tf 72 712 Td (line %d) Tj ET %% a comment\r\n"
+            ) % (i + 1, i, i)
+        return out.encode("latin-1")
+
+    def _read_all_tokens(self, content: bytes, use_buffer: bool) -> typing.List[Token]:
+        tok = LowLevelTokenizer(io.BytesIO(content), use_buffer=use_buffer)
+        out = []
+        while True:
+            t = tok.next_token()
+            if t is None:
+                break
+            out.append(t)
+        return out
+
+    def test_buffered_tokens_match_unbuffered_tokens(self):
+
+        content = self._build_content(64)
+        tokens_0 = self._read_all_tokens(content, use_buffer=False)
+        tokens_1 = self._read_all_tokens(content, use_buffer=True)
+
+        assert len(tokens_0) == len(tokens_1)
+        for t0, t1 in zip(tokens_0, tokens_1):
+            assert t0.byte_offset == t1.byte_offset
+            assert t0.token_type == t1.token_type
+            assert t0.text == t1.text
+
+    def test_tokenize_bytes(self):
+        tok = LowLevelTokenizer(memoryview(b"<< /Length 12 >>"))
+        assert [tok.next_token().text for _ in range(0, 4)] == [
+            "<<",
+            "/Length",
+            "12",
+            ">>",
+        ]
+        assert tok.next_token() is None
+
+    def test_tokenize_without_copying_content(self):
+        content = self._build_content(16)
+        tokens_0 = self._read_all_tokens(content, use_buffer=False)
+
+        # a BytesIO is viewed, rather than copied
+        tok = LowLevelTokenizer(io.BytesIO(content))
+        assert isinstance(tok._buffer, memoryview)
+
+        # a file is mapped into memory, rather than read
+        with tempfile.TemporaryFile() as fh:
+            fh.write(content)
+            fh.seek(0)
+            tok = LowLevelTokenizer(fh)
+            assert isinstance(tok._buffer, mmap.mmap)
+            tokens_1 = []
+            while True:
+                t = tok.next_token()
+                if t is None:
+                    break
+                tokens_1.append(t)
+            assert [(t.byte_offset, t.token_type, t.text) for t in tokens_0] == [
+                (t.byte_offset, t.token_type, t.text) for t in tokens_1
+            ]
+            tok._buffer.close()
+
+    def test_benchmark_tokenizer(self):
+
+        content = self._build_content(2048)
+
+        before = time.time()
+        n0 = len(self._read_all_tokens(content, use_buffer=False))
+        delta_0 = time.time() - before
+
+        before = time.time()
+        n1 = len(self._read_all_tokens(content, use_buffer=True))
+        delta_1 = time.time() - before
+
+        print(
+            "%d bytes, %d tokens, unbuffered: %f s, buffered: %f s (x %f)"
+            % (len(content), n0, delta_0, delta_1, delta_0 / max(delta_1, 1e-9))
+        )
+        assert n0 == n1
+
+
+if __name__ == "__main__":
+    unittest.main()
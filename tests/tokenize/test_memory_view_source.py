@@ -0,0 +1,123 @@
+import copy
+import gc
+import io
+import mmap
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from ptext.functionality.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.tokenize.memory_view_source import MemoryViewSource
+from ptext.pdf.pdf import PDF
+from tests.test import build_document_bytes
+
+
+class TestMemoryViewSource(unittest.TestCase):
+    """
+    This test checks whether a PDF read from a memory-mapped file (by path, file descriptor or mmap)
+    offers the same content as a PDF read from a file object,
+    and whether its Stream(s) refer to the mapped bytes rather than holding a copy,
+    and whether the memory-mapped file is closed with the Document.
+    """
+
+    def setUp(self) -> None:
+        self.bts = build_document_bytes(10)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "document.pdf"
+        with open(self.path, "wb") as pdf_file_handle:
+            pdf_file_handle.write(self.bts)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _extract_text(self, file) -> list:
+        l = SimpleTextExtraction()
+        PDF.loads(file, [l])
+        return [l.get_text(i) for i in range(0, 10)]
+
+    def test_memory_view_source_read_and_seek(self):
+        src = MemoryViewSource(b"0123456789")
+        self.assertEqual(src.read(3), b"012")
+        self.assertEqual(src.seek(-2, io.SEEK_END), 8)
+        self.assertEqual(src.read(), b"89")
+        src.seek(4)
+        view = src.read_view(2)
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(bytes(view), b"45")
+        self.assertEqual(src.get_view(7).read(), b"789")
+
+    def test_read_document_by_path(self):
+        expected_text = self._extract_text(io.BytesIO(self.bts))
+        self.assertEqual(self._extract_text(str(self.path)), expected_text)
+        self.assertEqual(self._extract_text(self.path), expected_text)
+
+    def test_read_document_by_file_descriptor(self):
+        expected_text = self._extract_text(io.BytesIO(self.bts))
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            self.assertEqual(self._extract_text(fd), expected_text)
+        finally:
+            os.close(fd)
+
+    def test_read_document_by_mmap(self):
+        expected_text = self._extract_text(io.BytesIO(self.bts))
+        with open(self.path, "rb") as pdf_file_handle:
+            m = mmap.mmap(pdf_file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+            self.assertEqual(self._extract_text(m), expected_text)
+
+    def test_stream_bytes_are_not_copied(self):
+        doc = PDF.loads(self.path)
+        page = doc.get_page(0)
+        self.assertIsInstance(page["Contents"]["Bytes"], memoryview)
+
+        # copying a Page shares the (read-only) bytes
+        page_copy = copy.deepcopy(page)
+        self.assertEqual(
+            page_copy["Contents"]["DecodedBytes"], page["Contents"]["DecodedBytes"]
+        )
+
+    def test_close_document(self):
+        with PDF.loads(self.path, lazy=True) as doc:
+            self.assertEqual(doc.get_document_info().get_number_of_pages(), 10)
+        source = getattr(doc, "_source")
+        self.assertTrue(source.closed)
+        self.assertTrue(getattr(source, "_mmap").closed)
+        with self.assertRaises(ValueError):
+            source.read()
+
+        # Stream(s) that refer to the mapped bytes remain readable
+        doc = PDF.loads(self.path)
+        page = doc.get_page(0)
+        doc.close()
+        self.assertEqual(
+            bytes(page["Contents"]["Bytes"]), bytes(page["Contents"]["DecodedBytes"])
+        )
+
+        # a Document read from a file object does not close it
+        src = io.BytesIO(self.bts)
+        PDF.loads(src).close()
+        self.assertFalse(src.closed)
+
+    @unittest.skipUnless(os.path.isdir("/proc/self/fd"), "requires /proc/self/fd")
+    def test_iter_pages_closes_file(self):
+        # the file is unmapped (closing its file descriptor) once no Page refers to it
+        # Document(s) left over by earlier tests are collected first, so they do not skew the count
+        gc.collect()
+        number_of_fds = len(os.listdir("/proc/self/fd"))
+        pages = PDF.iter_pages(self.path)
+        next(pages)
+        self.assertGreater(len(os.listdir("/proc/self/fd")), number_of_fds)
+        pages.close()
+        gc.collect()
+        self.assertEqual(len(os.listdir("/proc/self/fd")), number_of_fds)
+
+    def test_read_document_with_prefix(self):
+        with open(self.path, "wb") as pdf_file_handle:
+            pdf_file_handle.write(b"garbage before the header\n" * 8 + self.bts)
+        doc = PDF.loads(self.path)
+        self.assertEqual(doc.get_document_info().get_number_of_pages(), 10)
+        self.assertEqual(
+            doc.get_document_info().get_title(),
+            PDF.loads(io.BytesIO(self.bts)).get_document_info().get_title(),
+        )
@@ -0,0 +1,134 @@
+import io
+import typing
+import unittest
+from typing import Any, Optional
+
+from ptext.functionality.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.read_transform.read_any_object_transformer import (
+    ReadAnyObjectTransformer,
+)
+from ptext.io.read_transform.read_base_transformer import (
+    ReadBaseTransformer,
+    ReadTransformerContext,
+)
+from ptext.io.read_transform.types import Decimal, Dictionary, Name, Stream
+from ptext.pdf.page.page import Page
+from tests.test import build_document_bytes
+
+
+class ProbeCountingTransformer(ReadBaseTransformer):
+    def __init__(
+        self,
+        transformable_types: Optional[typing.Tuple[type, ...]] = None,
+        transformable_dictionary_keys: typing.Dict[str, typing.List[Optional[str]]] = {},
+        output: Any = None,
+    ):
+        super(ProbeCountingTransformer, self).__init__()
+        self.transformable_types = transformable_types
+        self.transformable_dictionary_keys = transformable_dictionary_keys
+        self.output = output
+        self.number_of_probes: int = 0
+
+    def can_be_transformed(self, object: Any) -> bool:
+        self.number_of_probes += 1
+        return self.output is not None
+
+    def get_transformable_types(self) -> Optional[typing.Tuple[type, ...]]:
+        return self.transformable_types
+
+    def get_transformable_dictionary_keys(
+        self,
+    ) -> typing.Dict[str, typing.List[Optional[str]]]:
+        return self.transformable_dictionary_keys
+
+    def transform(self, object_to_transform, parent_object, context=None, event_listeners=[]):
+        return self.output
+
+
+class TestReadTransformerDispatch(unittest.TestCase):
+    """
+    This test checks whether ReadBaseTransformer only asks the children that may transform an object
+    (by Python type, /Type and /Subtype) whether they can transform it,
+    while keeping the order in which children were added.
+    """
+
+    def test_only_matching_children_are_probed(self):
+        any_object = ProbeCountingTransformer()
+        streams = ProbeCountingTransformer((Stream,))
+        images = ProbeCountingTransformer(
+            (Stream,), {"Type": ["XObject", None], "Subtype": ["Image"]}
+        )
+        root = ReadBaseTransformer()
+        root.add_child_transformer(any_object)
+        root.add_child_transformer(streams)
+        root.add_child_transformer(images)
+
+        def get_number_of_probes() -> typing.List[int]:
+            return [x.number_of_probes for x in [any_object, streams, images]]
+
+        # number
+        root.transform(Decimal(1), None)
+        self.assertEqual(get_number_of_probes(), [1, 0, 0])
+
+        # stream (not an image)
+        s = Stream()
+        s[Name("Type")] = Name("XRef")
+        root.transform(s, None)
+        self.assertEqual(get_number_of_probes(), [2, 1, 0])
+
+        # image
+        s = Stream()
+        s[Name("Subtype")] = Name("Image")
+        root.transform(s, None)
+        root.transform(s, None)
+        self.assertEqual(get_number_of_probes(), [4, 3, 2])
+
+    def test_children_keep_priority(self):
+        d = Dictionary()
+        d[Name("Type")] = Name("Font")
+        root = ReadBaseTransformer()
+        root.add_child_transformer(ProbeCountingTransformer((Dictionary,), output=1))
+        root.add_child_transformer(
+            ProbeCountingTransformer((Dictionary,), {"Type": ["Font"]}, output=2)
+        )
+        self.assertEqual(root.transform(d, None), 1)
+
+        root = ReadBaseTransformer()
+        root.add_child_transformer(
+            ProbeCountingTransformer((Dictionary,), {"Type": ["Font"]}, output=2)
+        )
+        root.add_child_transformer(ProbeCountingTransformer((Dictionary,), output=1))
+        self.assertEqual(root.transform(d, None), 2)
+
+    def test_type_that_is_not_a_name(self):
+        d = Dictionary()
+        d[Name("Type")] = Decimal(1)
+        fonts = ProbeCountingTransformer((Dictionary,), {"Type": ["Font", None]})
+        dictionaries = ProbeCountingTransformer((Dictionary,))
+        root = ReadBaseTransformer()
+        root.add_child_transformer(fonts)
+        root.add_child_transformer(dictionaries)
+        root.transform(d, None)
+        self.assertEqual(fonts.number_of_probes, 0)
+        self.assertEqual(dictionaries.number_of_probes, 1)
+
+    def test_add_child_transformer_after_dispatch(self):
+        root = ReadBaseTransformer()
+        self.assertIsNone(root.transform(Decimal(1), None))
+        root.add_child_transformer(ProbeCountingTransformer(output=3))
+        self.assertEqual(root.transform(Decimal(1), None), 3)
+
+    def test_read_document(self):
+        l = SimpleTextExtraction()
+        doc = ReadAnyObjectTransformer().transform(
+            io.BytesIO(build_document_bytes(10)), None, ReadTransformerContext(), [l]
+        )
+        self.assertIsInstance(doc.get_page(0), Page)
+        self.assertEqual(
+            sorted([l.get_text(i) for i in range(0, 10)]),
+            sorted(["Page %d" % (i + 1) for i in range(0, 10)]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import io
+import random
+import time
+import unittest
+
+from ptext.io.read_transform.types import Dictionary, Reference
+from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
+from ptext.pdf.xref.object_stream import ObjectStream
+from ptext.pdf.xref.xref import XREF
+
+
+class TestObjectStream(unittest.TestCase):
+    """
+    This test checks whether ObjectStream parses its members by their recorded offset,
+    (in any order) whether it falls back to reading its members one after the other
+    when the offset table is malformed,
+    and whether XREF keeps (only) the most recently used ObjectStream(s).
+    """
+
+    def _build_object_stream_bytes(self, number_of_objects: int) -> (bytes, int):
+        offset_table = b""
+        objects = b""
+        for i in range(0, number_of_objects):
+            offset_table += b"%d %d " % (i + 100, len(objects))
+            objects += b"<</Index %d /Kids [%d 0 R]>>\n" % (i, i + 1)
+        return offset_table + objects, len(offset_table)
+
+    def test_random_access(self):
+        decoded_bytes, first_byte = self._build_object_stream_bytes(100)
+        object_stream = ObjectStream(decoded_bytes, 100, first_byte)
+        self.assertEqual(len(object_stream), 100)
+        indices = [x for x in range(0, 100)]
+        random.shuffle(indices)
+        for i in indices:
+            obj = object_stream.get_object(i)
+            assert isinstance(obj, Dictionary)
+            self.assertEqual(int(obj["Index"]), i)
+            self.assertEqual(obj["Kids"][0].object_number, i + 1)
+        self.assertIsNone(object_stream.get_object(100))
+
+    def test_eviction(self):
+        decoded_bytes, first_byte = self._build_object_stream_bytes(100)
+        object_stream = ObjectStream(
+            decoded_bytes, 100, first_byte, max_number_of_cached_members=10
+        )
+        for i in range(0, 100):
+            object_stream.get_object(i)
+        self.assertEqual(len(object_stream._members), 10)
+        self.assertEqual(int(object_stream.get_object(0)["Index"]), 0)
+
+    def test_malformed_offset_table(self):
+        decoded_bytes, first_byte = self._build_object_stream_bytes(10)
+        decoded_bytes = (
+            b"1 0 2 0 " + b" " * (first_byte - 8) + decoded_bytes[first_byte:]
+        )
+        object_stream = ObjectStream(decoded_bytes, 10, first_byte)
+        self.assertEqual(len(object_stream), 10)
+        for i in range(0, 10):
+            self.assertEqual(int(object_stream.get_object(i)["Index"]), i)
+
+    def test_xref_keeps_recently_used_object_streams(self):
+        # 20 object streams (object 1 to 20), of 10 members each (object 100 and up)
+        xref = XREF()
+        src = b""
+        for i in range(0, 20):
+            decoded_bytes, first_byte = self._build_object_stream_bytes(10)
+            xref.append(
+                Reference(
+                    object_number=i + 1, generation_number=0, byte_offset=len(src)
+                )
+            )
+            src += b"%d 0 obj\n<</Type /ObjStm /N 10 /First %d /Length %d>>\n" % (
+                i + 1,
+                first_byte,
+                len(decoded_bytes),
+            )
+            src += b"stream\n%s\nendstream\nendobj\n" % decoded_bytes
+            for j in range(0, 10):
+                xref.append(
+                    Reference(
+                        object_number=100 + 10 * i + j,
+                        parent_stream_object_number=i + 1,
+                        index_in_parent_stream=j,
+                    )
+                )
+
+        # members are memoized by their ObjectStream, not by the XREF
+        tok = HighLevelTokenizer(io.BytesIO(src))
+        for _ in range(0, 2):
+            for i in range(0, 200):
+                obj = xref.get_object(100 + i, io.BytesIO(src), tok)
+                assert isinstance(obj, Dictionary)
+                self.assertEqual(int(obj["Index"]), i % 10)
+        self.assertEqual(len(xref.cache), 0)
+        self.assertEqual(len(xref._object_streams), 16)
+
+    def test_benchmark(self):
+        number_of_objects = 20000
+        decoded_bytes, first_byte = self._build_object_stream_bytes(number_of_objects)
+        t0 = time.time()
+        object_stream = ObjectStream(decoded_bytes, number_of_objects, first_byte)
+        for i in range(number_of_objects - 1, -1, -1):
+            object_stream.get_object(i)
+        delta = time.time() - t0
+        print("resolving %d objects : %f s" % (number_of_objects, delta))
+        self.assertLess(delta, 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import io
+import time
+import unittest
+
+from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
+from ptext.pdf.xref.plaintext_xref import PlainTextXREF
+
+
+class TestPlainTextXREF(unittest.TestCase):
+    """
+    This test checks whether PlainTextXREF reads (well-formed) 20-byte entries,
+    as well as malformed (19- or 21-byte) entries, which are read token by token.
+    It also benchmarks reading a large cross-reference table.
+    """
+
+    def _build_xref_table(self, number_of_objects: int, eol: bytes) -> bytes:
+        out = b"xref\n0 %d\n" % (number_of_objects + 1)
+        out += b"0000000000 65535 f" + eol
+        out += b"".join(
+            [
+                b"%010d %05d n" % (i * 10, i % 3) + eol
+                for i in range(0, number_of_objects)
+            ]
+        )
+        out += b"7 2\n0000000777 00001 n\r\n0000000888 00000 f\r\n"
+        out += b"trailer\n<</Size %d>>\nstartxref\n0\n%%%%EOF" % (
+            number_of_objects + 1
+        )
+        return out
+
+    def _read(self, content: bytes) -> PlainTextXREF:
+        src = io.BytesIO(content)
+        return PlainTextXREF().read(src, HighLevelTokenizer(src), initial_offset=0)
+
+    def test_read_entries(self):
+        for eol in [b" \n", b" \r", b"\r\n", b"\n", b"  \r\n"]:
+            xref = self._read(self._build_xref_table(5, eol))
+            self.assertEqual(len(xref.entries), 8)
+            self.assertFalse(xref.get_entry(0).is_in_use)
+            self.assertEqual(xref.get_entry(0).generation_number, 65535)
+            self.assertEqual(xref.get_entry(5).byte_offset, 40)
+            self.assertEqual(xref.get_entry(5).generation_number, 1)
+            self.assertTrue(xref.get_entry(5).is_in_use)
+            self.assertEqual(xref.get_entry(7).byte_offset, 777)
+            self.assertEqual(xref.get_entry(7).generation_number, 1)
+            self.assertFalse(xref.get_entry(8).is_in_use)
+            self.assertEqual(int(xref["Trailer"]["Size"]), 6)
+
+    def test_read_large_xref_table(self):
+        number_of_objects = 300000
+        for eol in [b"\r\n", b"\n"]:
+            content = self._build_xref_table(number_of_objects, eol)
+            t0 = time.time()
+            xref = self._read(content)
+            delta = time.time() - t0
+            print(
+                "reading %d entries (%d-byte lines) : %f s"
+                % (number_of_objects, 18 + len(eol), delta)
+            )
+            self.assertEqual(len(xref.entries), number_of_objects + 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import io
+import time
+import unittest
+
+from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
+from ptext.pdf.xref.stream_xref import StreamXREF
+
+
+class TestStreamXREF(unittest.TestCase):
+    """
+    This test checks whether StreamXREF decodes every (fixed-width) record
+    in a cross-reference stream, across all ranges in its /Index.
+    It also checks how entries for the same object number (in overlapping ranges) are merged,
+    and reads (and merges) a large cross-reference stream, of which only the entries that are looked up are built.
+    """
+
+    def _build_xref_stream(self, records: bytes, size: int, index: str = "") -> bytes:
+        return (
+            b"1 0 obj\n<</Type /XRef /Size %d /W [1 3 2] %s /Length %d>>\nstream\n"
+            % (size, index.encode("latin-1"), len(records))
+            + records
+            + b"\nendstream\nendobj\n"
+        )
+
+    def _read(self, content: bytes) -> StreamXREF:
+        src = io.BytesIO(content)
+        return StreamXREF().read(src, HighLevelTokenizer(src), initial_offset=0)
+
+    def test_read_entries(self):
+        records = (
+            b"\x00\x00\x00\x00\xff\xff"  # 0, free
+            + b"\x01\x00\x01\x02\x00\x00"  # 1, byte offset 258
+            + b"\x02\x00\x00\x05\x00\x03"  # 2, 4th object in object stream 5
+            + b"\x01\x01\x00\x00\x00\x02"  # 10, byte offset 65536, generation 2
+        )
+        xref = self._read(self._build_xref_stream(records, 11, "/Index [0 3 10 1]"))
+        self.assertEqual(xref.get_entry(1).byte_offset, 258)
+        self.assertEqual(xref.get_entry(2).parent_stream_object_number, 5)
+        self.assertEqual(xref.get_entry(2).index_in_parent_stream, 3)
+        self.assertEqual(xref.get_entry(10).byte_offset, 65536)
+        self.assertEqual(xref.get_entry(10).generation_number, 2)
+        self.assertIsNone(xref.get_entry(3))
+
+    def test_read_duplicate_entries(self):
+        records = (
+            b"\x00\x00\x00\x00\xff\xff"  # 0, free
+            + b"\x01\x00\x01\x02\x00\x00"  # 1, byte offset 258
+            + b"\x01\x00\x02\x00\x00\x00"  # 2, byte offset 512
+            + b"\x02\x00\x00\x05\x00\x03"  # 1, 4th object in object stream 5
+            + b"\x01\x00\x03\x00\x00\x01"  # 2, byte offset 768, generation 1
+        )
+        xref = self._read(
+            self._build_xref_stream(records, 3, "/Index [0 3 1 2]")
+        )
+        # same generation number, the existing entry is updated
+        self.assertEqual(xref.get_entry(1).byte_offset, 258)
+        self.assertEqual(xref.get_entry(1).parent_stream_object_number, 5)
+        self.assertEqual(xref.get_entry(1).index_in_parent_stream, 3)
+        # other generation number, the first entry is kept
+        self.assertEqual(xref.get_entry(2).byte_offset, 512)
+        self.assertEqual(xref.get_entry(2).generation_number, 0)
+        self.assertEqual(len(xref.entries), 3)
+
+    def _build_large_xref_stream(self, number_of_objects: int) -> bytes:
+        records = bytearray()
+        for i in range(0, number_of_objects):
+            records += bytes([1]) + (i * 10).to_bytes(3, "big") + bytes([0, 0])
+        return self._build_xref_stream(bytes(records), number_of_objects)
+
+    def test_read_large_xref_stream(self):
+        number_of_objects = 1000000
+        content = self._build_large_xref_stream(number_of_objects)
+        t0 = time.time()
+        xref = self._read(content)
+        delta = time.time() - t0
+        print("reading %d entries : %f s" % (number_of_objects, delta))
+        self.assertLess(delta, 1)
+        self.assertEqual(xref.get_entry(123456).byte_offset, 1234560)
+        self.assertEqual(xref.get_entry(999999).byte_offset, 9999990)
+        self.assertIsNone(xref.get_entry(number_of_objects))
+        self.assertEqual(len(xref.entries), number_of_objects)
+        self.assertEqual(
+            [int(xref.get_entry(i).byte_offset) for i in range(1, number_of_objects)],
+            [i * 10 for i in range(1, number_of_objects)],
+        )
+        self.assertFalse(xref.get_entry(0).is_in_use)
+
+    def test_merge_large_xref_stream(self):
+        # an incremental update (object 5 and 1000000) on top of a large cross-reference stream
+        number_of_objects = 1000000
+        most_recent_xref = self._read(
+            self._build_xref_stream(
+                b"\x01\x00\x03\xe7\x00\x00" + b"\x01\x00\x03\xe8\x00\x00",
+                number_of_objects + 1,
+                "/Index [5 1 %d 1]" % number_of_objects,
+            )
+        )
+        previous_xref = self._read(self._build_large_xref_stream(number_of_objects))
+        t0 = time.time()
+        xref = most_recent_xref.merge(previous_xref)
+        delta = time.time() - t0
+        print("merging %d entries : %f s" % (number_of_objects, delta))
+        self.assertLess(delta, 1)
+        # the entries of the previous section are not built by merging
+        self.assertLess(len(xref._entries), 10)
+        self.assertEqual(xref.get_entry(5).byte_offset, 999)
+        self.assertEqual(xref.get_entry(number_of_objects).byte_offset, 1000)
+        self.assertEqual(xref.get_entry(6).byte_offset, 60)
+        self.assertEqual(xref.get_entry(999999).byte_offset, 9999990)
+        self.assertEqual(len(xref.entries), number_of_objects + 1)
+        self.assertEqual(
+            sorted([int(r.object_number) for r in xref.entries]),
+            list(range(0, number_of_objects + 1)),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
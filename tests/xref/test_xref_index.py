@@ -0,0 +1,83 @@
+import io
+import time
+import unittest
+
+from ptext.io.read_transform.types import Reference
+from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
+from ptext.pdf.xref.xref import XREF
+
+
+class TestXREFIndex(unittest.TestCase):
+    """
+    This test checks whether XREF looks up its entries by object number,
+    and whether merging (incremental update) sections scales (near) linearly
+    with the number of objects in the document.
+    """
+
+    def _build_xref(self, number_of_objects: int, generation_number: int) -> XREF:
+        xref = XREF()
+        for i in range(0, number_of_objects):
+            xref.append(
+                Reference(
+                    object_number=i,
+                    byte_offset=i * 20,
+                    generation_number=generation_number,
+                )
+            )
+        return xref
+
+    def test_merge_keeps_most_recent_entry(self):
+        # the most recent section is read (and merged) first
+        xref = self._build_xref(10, 1)
+        xref.merge(self._build_xref(20, 0))
+        self.assertEqual(len(xref.entries), 20)
+        for i in range(0, 10):
+            self.assertEqual(xref.get_entry(i).generation_number, 1)
+        for i in range(10, 20):
+            self.assertEqual(xref.get_entry(i).generation_number, 0)
+        self.assertIsNone(xref.get_entry(20))
+
+    def test_get_object(self):
+        content = b"%PDF-1.7\n"
+        offsets = []
+        for i in range(1, 4):
+            offsets.append(len(content))
+            content += b"%d 0 obj\n<</Value %d>>\nendobj\n" % (i, i * 10)
+        xref = XREF()
+        xref.append(
+            Reference(object_number=0, generation_number=65535, is_in_use=False)
+        )
+        for i, o in enumerate(offsets):
+            xref.append(
+                Reference(object_number=i + 1, byte_offset=o, generation_number=0)
+            )
+
+        src = io.BytesIO(content)
+        tok = HighLevelTokenizer(src)
+        for i in range(1, 4):
+            obj = xref.get_object(i, src, tok)
+            self.assertEqual(int(obj["Value"]), i * 10)
+            obj = xref.get_object(Reference(object_number=i), src, tok)
+            self.assertEqual(int(obj["Value"]), i * 10)
+        self.assertIsNone(xref.get_object(4, src, tok))
+
+    def test_scaling_benchmark(self):
+        timings = []
+        for n in [1000, 10000, 100000, 500000]:
+            xref = self._build_xref(n, 1)
+            update = self._build_xref(n, 0)
+            t0 = time.time()
+            xref.merge(update)
+            for i in range(0, n):
+                xref.get_entry(i)
+            delta = time.time() - t0
+            timings.append(delta)
+            print("%d objects, merge + lookup : %f s" % (n, delta))
+            self.assertEqual(len(xref.entries), n)
+
+        # 500 times more objects should not take (much) more than 500 times longer
+        self.assertLess(timings[-1], max(timings[0], 0.001) * 500 * 10)
+
+
+if __name__ == "__main__":
+    unittest.main()